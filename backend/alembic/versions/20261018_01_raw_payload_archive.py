@@ -0,0 +1,45 @@
+"""add raw payload archive
+
+Revision ID: 20261018_01
+Revises: 20260214_02
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_01"
+down_revision: str | None = "20260214_02"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "raw_payload_blob",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("codec", sa.String(length=10), nullable=False),
+        sa.Column("raw_size", sa.Integer(), nullable=False),
+        sa.Column("stored_size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("content_hash"),
+    )
+    with op.batch_alter_table("raw_payload_log") as batch_op:
+        batch_op.alter_column("payload", existing_type=sa.Text(), nullable=True)
+        batch_op.add_column(sa.Column("batch_id", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+        batch_op.create_index("ix_raw_payload_log_batch_id", ["batch_id"])
+        batch_op.create_index("ix_raw_payload_log_content_hash", ["content_hash"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("raw_payload_log") as batch_op:
+        batch_op.drop_index("ix_raw_payload_log_content_hash")
+        batch_op.drop_index("ix_raw_payload_log_batch_id")
+        batch_op.drop_column("content_hash")
+        batch_op.drop_column("batch_id")
+        batch_op.alter_column("payload", existing_type=sa.Text(), nullable=False)
+    op.drop_table("raw_payload_blob")
@@ -0,0 +1,77 @@
+"""stable pipeline ids
+
+Revision ID: 20261018_02
+Revises: 20261018_01
+Create Date: 2026-10-18
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_02"
+down_revision: str | None = "20261018_01"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_CORP_NAME_NOISE = re.compile(r"\(주\)|주식회사|\s+")
+
+
+def _stable_id(corp_name: str, listing_date) -> str:
+    # Frozen copy of app.etl.normalize.pipeline_item_id, so later changes there cannot alter this migration.
+    identity = "name:" + _CORP_NAME_NOISE.sub("", unicodedata.normalize("NFKC", corp_name or "")).casefold()
+    cycle = str(listing_date.year) if listing_date else "pending"
+    return "ipo-" + hashlib.sha256(f"{identity}|{cycle}".encode("utf-8")).hexdigest()[:24]
+
+
+def upgrade() -> None:
+    alias_table = op.create_table(
+        "ipo_pipeline_alias",
+        sa.Column("alias_id", sa.String(length=64), nullable=False),
+        sa.Column("pipeline_id", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("alias_id"),
+    )
+    op.create_index("ix_ipo_pipeline_alias_pipeline_id", "ipo_pipeline_alias", ["pipeline_id"])
+
+    bind = op.get_bind()
+    items = sa.table(
+        "ipo_pipeline_item",
+        sa.column("pipeline_id", sa.String()),
+        sa.column("corp_name", sa.String()),
+        sa.column("listing_date", sa.Date()),
+    )
+    rows = bind.execute(sa.select(items.c.pipeline_id, items.c.corp_name, items.c.listing_date)).all()
+    aliases: list[dict] = []
+    seen: set[str] = set()
+    for old_id, corp_name, listing_date in rows:
+        new_id = _stable_id(corp_name, listing_date)
+        if new_id in seen:
+            # Positional ids could repeat a company; keep the first row and alias the rest to it.
+            bind.execute(sa.delete(items).where(items.c.pipeline_id == old_id))
+        elif new_id != old_id:
+            bind.execute(sa.update(items).where(items.c.pipeline_id == old_id).values(pipeline_id=new_id))
+        seen.add(new_id)
+        if new_id != old_id:
+            aliases.append({"alias_id": old_id, "pipeline_id": new_id})
+    if aliases:
+        op.bulk_insert(alias_table, aliases)
+
+
+def downgrade() -> None:
+    # Old positional ids are restored from the aliases; rows published after the upgrade keep their stable ids.
+    bind = op.get_bind()
+    items = sa.table("ipo_pipeline_item", sa.column("pipeline_id", sa.String()))
+    aliases = sa.table("ipo_pipeline_alias", sa.column("alias_id", sa.String()), sa.column("pipeline_id", sa.String()))
+    restored: set[str] = set()
+    for alias_id, pipeline_id in bind.execute(sa.select(aliases.c.alias_id, aliases.c.pipeline_id)).all():
+        if pipeline_id in restored:
+            continue
+        bind.execute(sa.update(items).where(items.c.pipeline_id == pipeline_id).values(pipeline_id=alias_id))
+        restored.add(pipeline_id)
+    op.drop_index("ix_ipo_pipeline_alias_pipeline_id", table_name="ipo_pipeline_alias")
+    op.drop_table("ipo_pipeline_alias")
@@ -0,0 +1,52 @@
+"""versioned pipeline snapshots
+
+Revision ID: 20261018_03
+Revises: 20261018_02
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_03"
+down_revision: str | None = "20261018_02"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The per-date table was never written, so it is replaced rather than migrated.
+    op.drop_table("ipo_pipeline_snapshot")
+    op.create_table(
+        "ipo_pipeline_snapshot",
+        sa.Column("version", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("snapshot_date", sa.String(length=10), nullable=False),
+        sa.Column("batch_id", sa.String(length=64), nullable=True),
+        sa.Column("item_count", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("version"),
+    )
+    op.create_index("ix_ipo_pipeline_snapshot_snapshot_date", "ipo_pipeline_snapshot", ["snapshot_date"])
+    op.create_table(
+        "ipo_pipeline_snapshot_pointer",
+        sa.Column("name", sa.String(length=30), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ipo_pipeline_snapshot_pointer")
+    op.drop_index("ix_ipo_pipeline_snapshot_snapshot_date", table_name="ipo_pipeline_snapshot")
+    op.drop_table("ipo_pipeline_snapshot")
+    op.create_table(
+        "ipo_pipeline_snapshot",
+        sa.Column("snapshot_date", sa.String(length=10), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("snapshot_date"),
+    )
@@ -0,0 +1,112 @@
+"""aggregated quality issues
+
+Revision ID: 20261018_04
+Revises: 20261018_03
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_04"
+down_revision: str | None = "20261018_03"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_AGGREGATE_INDEXES = ("source", "rule_code", "severity", "entity_key", "last_seen")
+_OCCURRENCE_INDEXES = ("aggregate_id", "observed_date")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "data_quality_issue_aggregate",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("source", sa.String(length=20), nullable=False),
+        sa.Column("rule_code", sa.String(length=100), nullable=False),
+        sa.Column("severity", sa.String(length=10), nullable=False),
+        sa.Column("entity_type", sa.String(length=30), nullable=False),
+        sa.Column("entity_key", sa.String(length=100), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("last_batch_id", sa.String(length=64), nullable=True),
+        sa.Column("first_seen", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("last_seen", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("occurrence_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("source", "rule_code", "entity_key", name="uq_data_quality_issue_aggregate_key"),
+    )
+    for column in _AGGREGATE_INDEXES:
+        op.create_index(f"ix_data_quality_issue_aggregate_{column}", "data_quality_issue_aggregate", [column])
+    op.create_table(
+        "data_quality_issue_occurrence",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("aggregate_id", sa.Integer(), nullable=False),
+        sa.Column("observed_date", sa.Date(), nullable=False),
+        sa.Column("severity", sa.String(length=10), nullable=False),
+        sa.Column("occurrence_count", sa.Integer(), nullable=False),
+        sa.Column("last_batch_id", sa.String(length=64), nullable=True),
+        sa.Column("last_seen", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "aggregate_id", "observed_date", "severity", name="uq_data_quality_issue_occurrence_day"
+        ),
+    )
+    for column in _OCCURRENCE_INDEXES:
+        op.create_index(f"ix_data_quality_issue_occurrence_{column}", "data_quality_issue_occurrence", [column])
+
+    # Existing per-occurrence rows are folded into the new tables and then removed, so nothing is counted twice.
+    # The message, severity and batch of an aggregate come from its most recent row by id.
+    op.execute(
+        """
+        INSERT INTO data_quality_issue_aggregate
+            (source, rule_code, severity, entity_type, entity_key, message, last_batch_id,
+             first_seen, last_seen, occurrence_count)
+        SELECT latest.source, latest.rule_code, latest.severity, latest.entity_type, latest.entity_key,
+               latest.message, latest.batch_id, grouped.first_seen, grouped.last_seen, grouped.occurrence_count
+        FROM (
+            SELECT source, rule_code, entity_key, MAX(id) AS latest_id, MIN(observed_at) AS first_seen,
+                   MAX(observed_at) AS last_seen, COUNT(*) AS occurrence_count
+            FROM data_quality_issue
+            GROUP BY source, rule_code, entity_key
+        ) AS grouped
+        JOIN data_quality_issue AS latest ON latest.id = grouped.latest_id
+        ORDER BY grouped.latest_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO data_quality_issue_occurrence
+            (aggregate_id, observed_date, severity, occurrence_count, last_batch_id, last_seen)
+        SELECT aggregate.id, DATE(issue.observed_at), issue.severity, COUNT(*), MAX(issue.batch_id),
+               MAX(issue.observed_at)
+        FROM data_quality_issue AS issue
+        JOIN data_quality_issue_aggregate AS aggregate
+          ON aggregate.source = issue.source
+         AND aggregate.rule_code = issue.rule_code
+         AND aggregate.entity_key = issue.entity_key
+        GROUP BY aggregate.id, DATE(issue.observed_at), issue.severity
+        """
+    )
+    op.execute("DELETE FROM data_quality_issue")
+
+
+def downgrade() -> None:
+    # One legacy row per aggregate, day and severity; repeats within a day collapse into that single row.
+    op.execute(
+        """
+        INSERT INTO data_quality_issue
+            (source, rule_code, severity, entity_type, entity_key, message, batch_id, observed_at)
+        SELECT aggregate.source, aggregate.rule_code, occurrence.severity, aggregate.entity_type,
+               aggregate.entity_key, aggregate.message, occurrence.last_batch_id, occurrence.last_seen
+        FROM data_quality_issue_occurrence AS occurrence
+        JOIN data_quality_issue_aggregate AS aggregate ON aggregate.id = occurrence.aggregate_id
+        ORDER BY occurrence.id
+        """
+    )
+    for column in reversed(_OCCURRENCE_INDEXES):
+        op.drop_index(f"ix_data_quality_issue_occurrence_{column}", table_name="data_quality_issue_occurrence")
+    op.drop_table("data_quality_issue_occurrence")
+    for column in reversed(_AGGREGATE_INDEXES):
+        op.drop_index(f"ix_data_quality_issue_aggregate_{column}", table_name="data_quality_issue_aggregate")
+    op.drop_table("data_quality_issue_aggregate")
@@ -1,5 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
+from app.db.session import SessionLocal
+from app.services.disclosure_service import list_disclosures
 from app.services.snapshot_service import build_company_snapshot
 
 router = APIRouter(prefix="/company", tags=["company"])
@@ -40,3 +42,10 @@ def get_company_financials(corp_code: str) -> dict:
             ]
         },
     }
+
+
+@router.get("/{corp_code}/disclosures")
+def get_company_disclosures(corp_code: str, limit: int = Query(default=100, ge=1, le=500)) -> dict:
+    with SessionLocal() as session:
+        items = list_disclosures(session, corp_code, limit=limit)
+    return {"corp_code": corp_code, "items": items, "total": len(items)}
@@ -6,7 +6,7 @@ from app.db.session import SessionLocal
 from app.services.ipo_service import (
     ensure_demo_pipeline_if_empty,
     get_pipeline_item,
-    list_pipeline_items,
+    get_pipeline_snapshot,
     refresh_pipeline_live,
 )
 
@@ -25,8 +25,7 @@ def get_ipo_pipeline(
         if refresh:
             refresh_result = refresh_pipeline_live(session, corp_code=corp_code, bas_dd=run_date)
         ensure_demo_pipeline_if_empty(session)
-        items = list_pipeline_items(session)
-    payload: dict = {"items": items, "total": len(items)}
+        payload = get_pipeline_snapshot(session)
     if refresh_result is not None:
         payload["refresh"] = refresh_result
     return payload
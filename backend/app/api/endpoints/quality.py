@@ -1,10 +1,10 @@
-from datetime import date, datetime
+from datetime import date
 
 from fastapi import APIRouter, Query
-from sqlalchemy import Select, and_, select
+from sqlalchemy import Select, and_, func, select
 
 from app.db.session import SessionLocal
-from app.models.quality import DataQualityIssue, DataQualitySummaryDaily
+from app.models.quality import DataQualityIssueAggregate, DataQualityIssueOccurrence, DataQualitySummaryDaily
 from app.quality.catalog import RULE_CATALOG
 
 router = APIRouter(prefix="/quality", tags=["quality"])
@@ -27,25 +27,31 @@ def get_quality_issues(
     from_date: str | None = Query(default=None, alias="from"),
     to_date: str | None = Query(default=None, alias="to"),
 ) -> dict:
-    stmt: Select = select(DataQualityIssue)
+    stmt: Select = select(DataQualityIssueAggregate)
     filters = []
     if source:
-        filters.append(DataQualityIssue.source == source)
+        filters.append(DataQualityIssueAggregate.source == source)
     if severity:
-        filters.append(DataQualityIssue.severity == severity)
+        filters.append(DataQualityIssueAggregate.severity == severity)
     if rule_code:
-        filters.append(DataQualityIssue.rule_code == rule_code)
-    from_dt = _parse_date(from_date)
-    to_dt = _parse_date(to_date)
-    if from_dt:
-        filters.append(DataQualityIssue.observed_at >= datetime.combine(from_dt, datetime.min.time()))
-    if to_dt:
-        filters.append(DataQualityIssue.observed_at <= datetime.combine(to_dt, datetime.max.time()))
+        filters.append(DataQualityIssueAggregate.rule_code == rule_code)
+    # An aggregate matches the range only if it has an occurrence bucket inside it; first_seen/last_seen would also
+    # match an issue seen before and after the range but not during it.
+    from_day = _parse_date(from_date)
+    to_day = _parse_date(to_date)
+    if from_day or to_day:
+        seen_in_range = [DataQualityIssueOccurrence.aggregate_id == DataQualityIssueAggregate.id]
+        if from_day:
+            seen_in_range.append(DataQualityIssueOccurrence.observed_date >= from_day)
+        if to_day:
+            seen_in_range.append(DataQualityIssueOccurrence.observed_date <= to_day)
+        filters.append(select(DataQualityIssueOccurrence.id).where(*seen_in_range).exists())
     if filters:
         stmt = stmt.where(and_(*filters))
 
     with SessionLocal() as session:
-        rows = session.execute(stmt.order_by(DataQualityIssue.id.desc())).scalars().all()
+        stmt = stmt.order_by(DataQualityIssueAggregate.last_seen.desc(), DataQualityIssueAggregate.id.desc())
+        rows = session.execute(stmt).scalars().all()
     items = [
         {
             "id": row.id,
@@ -55,8 +61,10 @@ def get_quality_issues(
             "entity_type": row.entity_type,
             "entity_key": row.entity_key,
             "message": row.message,
-            "batch_id": row.batch_id,
-            "observed_at": row.observed_at.isoformat() if row.observed_at else None,
+            "batch_id": row.last_batch_id,
+            "observed_at": row.last_seen.isoformat() if row.last_seen else None,
+            "first_seen": row.first_seen.isoformat() if row.first_seen else None,
+            "occurrence_count": row.occurrence_count,
         }
         for row in rows
     ]
@@ -103,9 +111,9 @@ def get_quality_entity_history(entity_key: str) -> dict:
     with SessionLocal() as session:
         rows = (
             session.execute(
-                select(DataQualityIssue)
-                .where(DataQualityIssue.entity_key == entity_key)
-                .order_by(DataQualityIssue.id.desc())
+                select(DataQualityIssueAggregate)
+                .where(DataQualityIssueAggregate.entity_key == entity_key)
+                .order_by(DataQualityIssueAggregate.last_seen.desc(), DataQualityIssueAggregate.id.desc())
             )
             .scalars()
             .all()
@@ -117,7 +125,9 @@ def get_quality_entity_history(entity_key: str) -> dict:
             "rule_code": row.rule_code,
             "severity": row.severity,
             "message": row.message,
-            "observed_at": row.observed_at.isoformat() if row.observed_at else None,
+            "observed_at": row.last_seen.isoformat() if row.last_seen else None,
+            "first_seen": row.first_seen.isoformat() if row.first_seen else None,
+            "occurrence_count": row.occurrence_count,
         }
         for row in rows
     ]
@@ -143,29 +153,44 @@ def get_quality_overview(
     from_date: str | None = Query(default=None, alias="from"),
     to_date: str | None = Query(default=None, alias="to"),
 ) -> dict:
-    stmt: Select = select(DataQualityIssue)
-    filters = []
-    if source:
-        filters.append(DataQualityIssue.source == source)
+    aggregate = DataQualityIssueAggregate
+    occurrence = DataQualityIssueOccurrence
     from_dt = _parse_date(from_date)
     to_dt = _parse_date(to_date)
+    if from_dt or to_dt:
+        # Only a date range needs the occurrence log; otherwise the running totals on the aggregates suffice.
+        stmt: Select = (
+            select(aggregate.source, occurrence.severity, aggregate.rule_code, func.sum(occurrence.occurrence_count))
+            .join(occurrence, occurrence.aggregate_id == aggregate.id)
+            .group_by(aggregate.source, occurrence.severity, aggregate.rule_code)
+        )
+    else:
+        stmt = select(
+            aggregate.source, aggregate.severity, aggregate.rule_code, func.sum(aggregate.occurrence_count)
+        ).group_by(aggregate.source, aggregate.severity, aggregate.rule_code)
+    filters = []
+    if source:
+        filters.append(aggregate.source == source)
     if from_dt:
-        filters.append(DataQualityIssue.observed_at >= datetime.combine(from_dt, datetime.min.time()))
+        filters.append(occurrence.observed_date >= from_dt)
     if to_dt:
-        filters.append(DataQualityIssue.observed_at <= datetime.combine(to_dt, datetime.max.time()))
+        filters.append(occurrence.observed_date <= to_dt)
     if filters:
         stmt = stmt.where(and_(*filters))
 
     with SessionLocal() as session:
-        rows = session.execute(stmt).scalars().all()
+        rows = session.execute(stmt).all()
 
     severity_counts = {"PASS": 0, "WARN": 0, "FAIL": 0}
     source_counts: dict[str, int] = {}
     rule_counts: dict[str, int] = {}
-    for row in rows:
-        severity_counts[row.severity] = severity_counts.get(row.severity, 0) + 1
-        source_counts[row.source] = source_counts.get(row.source, 0) + 1
-        rule_counts[row.rule_code] = rule_counts.get(row.rule_code, 0) + 1
+    total_issues = 0
+    for row_source, row_severity, row_rule_code, count in rows:
+        count = int(count or 0)
+        total_issues += count
+        severity_counts[row_severity] = severity_counts.get(row_severity, 0) + count
+        source_counts[row_source] = source_counts.get(row_source, 0) + count
+        rule_counts[row_rule_code] = rule_counts.get(row_rule_code, 0) + count
 
     top_rules = sorted(
         ({"rule_code": code, "count": count} for code, count in rule_counts.items()),
@@ -174,7 +199,7 @@ def get_quality_overview(
     )[:10]
 
     return {
-        "total_issues": len(rows),
+        "total_issues": total_issues,
         "severity_counts": severity_counts,
         "source_counts": source_counts,
         "top_rules": top_rules,
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class StoredBulkFile:
+    payload: bytes
+    etag: str | None
+    last_modified: str | None
+    sha256: str
+
+
+@dataclass(slots=True)
+class BulkFetchResult:
+    payload: bytes
+    changed: bool
+    not_modified: bool = False
+    bytes_saved: int = 0
+
+
+@dataclass(slots=True)
+class BulkStoreStats:
+    downloads: int = 0
+    not_modified: int = 0
+    unchanged: int = 0
+    local_hits: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+class BulkFileStore:
+    def __init__(self, root_dir: str | Path) -> None:
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = BulkStoreStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "BulkFileStore | None":
+        root_dir = os.getenv(f"{prefix}_CACHE_DIR")
+        return cls(root_dir) if root_dir else None
+
+    def _paths(self, name: str) -> tuple[Path, Path]:
+        base = self.root_dir / name
+        return base.with_name(f"{base.name}.bin"), base.with_name(f"{base.name}.meta.json")
+
+    def load(self, name: str) -> StoredBulkFile | None:
+        payload_path, meta_path = self._paths(name)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            payload = payload_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        # A crash between the payload and meta writes leaves a payload the meta does not describe; treat it as absent
+        # so its stale validators never turn a changed file into a 304.
+        if meta.get("sha256") != hashlib.sha256(payload).hexdigest():
+            return None
+        return StoredBulkFile(
+            payload=payload,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            sha256=meta.get("sha256", ""),
+        )
+
+    def save(self, name: str, payload: bytes, *, etag: str | None, last_modified: str | None) -> StoredBulkFile:
+        payload_path, meta_path = self._paths(name)
+        payload_path.parent.mkdir(parents=True, exist_ok=True)
+        stored = StoredBulkFile(
+            payload=payload,
+            etag=etag,
+            last_modified=last_modified,
+            sha256=hashlib.sha256(payload).hexdigest(),
+        )
+        # Payload first, then meta, each replaced atomically.
+        _write_atomic(payload_path, payload)
+        meta = {"etag": etag, "last_modified": last_modified, "sha256": stored.sha256, "size": len(payload)}
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        return stored
+
+    def record(self, result: BulkFetchResult, *, downloaded: int, local_hit: bool = False) -> None:
+        with self._lock:
+            self.stats.bytes_downloaded += downloaded
+            self.stats.bytes_saved += result.bytes_saved
+            if local_hit:
+                self.stats.local_hits += 1
+            elif result.not_modified:
+                self.stats.not_modified += 1
+            else:
+                self.stats.downloads += 1
+                if not result.changed:
+                    self.stats.unchanged += 1
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return asdict(self.stats)
@@ -1,4 +1,8 @@
-from app.connectors.http_client import HttpClient
+import hashlib
+
+from app.connectors.bulk_file_store import BulkFetchResult, BulkFileStore
+from app.connectors.http_client import AsyncHttpClient, HttpClient
+from app.connectors.rate_limit import SourceRateLimiter
 from app.schemas.dart import DartCompanyResponse, DartDisclosureItem, DartEstkRsResponse, DartListResponse
 
 
@@ -6,18 +10,77 @@ class DartApiError(RuntimeError):
     pass
 
 
+class DartRateLimitError(DartApiError):
+    pass
+
+
+_ZIP_MAGIC = b"PK"
+_RATE_LIMIT_STATUS = "020"
+
+open_api_rate_limiter = SourceRateLimiter.from_env("DART_OPEN_API", rate_per_second=5.0, burst=5, max_concurrency=4)
+
+
 class DartConnector:
-    def __init__(self, api_key: str, http_client: HttpClient | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        http_client: HttpClient | None = None,
+        bulk_store: BulkFileStore | None = None,
+        rate_limiter: SourceRateLimiter | None = None,
+    ) -> None:
         self.api_key = api_key
         self.http_client = http_client or HttpClient()
+        self.async_http_client = AsyncHttpClient(self.http_client)
         self.base_url = "https://opendart.fss.or.kr/api"
+        self.bulk_store = bulk_store or BulkFileStore.from_env("DART_BULK")
+        self.rate_limiter = rate_limiter or open_api_rate_limiter
 
-    def fetch_corp_codes_zip(self) -> bytes:
-        return self.http_client.get_bytes(
+    def _fetch_bulk(self, name: str, url: str, params: dict, *, immutable: bool = False) -> BulkFetchResult:
+        if self.bulk_store is None:
+            return BulkFetchResult(payload=self.http_client.get_bytes(url, params), changed=True)
+
+        stored = self.bulk_store.load(name)
+        if stored is not None and immutable:
+            result = BulkFetchResult(payload=stored.payload, changed=False, bytes_saved=len(stored.payload))
+            self.bulk_store.record(result, downloaded=0, local_hit=True)
+            return result
+
+        response = self.http_client.get_conditional(
+            url,
+            params,
+            etag=stored.etag if stored else None,
+            last_modified=stored.last_modified if stored else None,
+        )
+        if response.not_modified and stored is not None:
+            result = BulkFetchResult(
+                payload=stored.payload,
+                changed=False,
+                not_modified=True,
+                bytes_saved=len(stored.payload),
+            )
+            self.bulk_store.record(result, downloaded=0)
+            return result
+
+        payload = response.body
+        # DART reports quota/key errors as a 200 XML body; never let those replace a good archive.
+        if not payload.startswith(_ZIP_MAGIC):
+            return BulkFetchResult(payload=payload, changed=True)
+        changed = stored is None or stored.sha256 != hashlib.sha256(payload).hexdigest()
+        self.bulk_store.save(name, payload, etag=response.etag, last_modified=response.last_modified)
+        result = BulkFetchResult(payload=payload, changed=changed)
+        self.bulk_store.record(result, downloaded=len(payload))
+        return result
+
+    def fetch_corp_codes(self) -> BulkFetchResult:
+        return self._fetch_bulk(
+            "corpCode.zip",
             f"{self.base_url}/corpCode.xml",
             {"crtfc_key": self.api_key},
         )
 
+    def fetch_corp_codes_zip(self) -> bytes:
+        return self.fetch_corp_codes().payload
+
     def fetch_company(self, corp_code: str) -> DartCompanyResponse:
         response: DartCompanyResponse = self.http_client.get_json(
             f"{self.base_url}/company.json",
@@ -26,40 +89,114 @@ class DartConnector:
         self._ensure_success(response)
         return response
 
-    def fetch_list(
+    async def fetch_company_async(self, corp_code: str) -> DartCompanyResponse:
+        response: DartCompanyResponse = await self.async_http_client.get_json(
+            f"{self.base_url}/company.json",
+            {"crtfc_key": self.api_key, "corp_code": corp_code},
+        )
+        self._ensure_success(response)
+        return response
+
+    def _list_params(
         self,
-        corp_code: str,
-        page_no: int = 1,
-        page_count: int = 100,
-        last_reprt_at: str | None = None,
-        bgn_de: str | None = None,
-        end_de: str | None = None,
-    ) -> list[DartDisclosureItem]:
+        corp_code: str | None,
+        page_no: int,
+        page_count: int,
+        last_reprt_at: str | None,
+        bgn_de: str | None,
+        end_de: str | None,
+        pblntf_ty: str | None = None,
+    ) -> dict[str, str | int]:
         params: dict[str, str | int] = {
             "crtfc_key": self.api_key,
-            "corp_code": corp_code,
             "page_no": page_no,
             "page_count": page_count,
         }
+        if corp_code:
+            params["corp_code"] = corp_code
         if last_reprt_at:
             params["last_reprt_at"] = last_reprt_at
         if bgn_de:
             params["bgn_de"] = bgn_de
         if end_de:
             params["end_de"] = end_de
-        response: DartListResponse = self.http_client.get_json(
-            f"{self.base_url}/list.json",
-            params,
-        )
+        if pblntf_ty:
+            params["pblntf_ty"] = pblntf_ty
+        return params
+
+    def fetch_list_page(
+        self,
+        corp_code: str | None = None,
+        page_no: int = 1,
+        page_count: int = 100,
+        last_reprt_at: str | None = None,
+        bgn_de: str | None = None,
+        end_de: str | None = None,
+        pblntf_ty: str | None = None,
+    ) -> DartListResponse:
+        with self.rate_limiter.slot() as slot:
+            response: DartListResponse = self.http_client.get_json(
+                f"{self.base_url}/list.json",
+                self._list_params(corp_code, page_no, page_count, last_reprt_at, bgn_de, end_de, pblntf_ty),
+            )
+            slot.throttled = self._is_rate_limited(response)
         self._ensure_success(response, allow_no_data=True)
+        return response
+
+    async def fetch_list_page_async(
+        self,
+        corp_code: str | None = None,
+        page_no: int = 1,
+        page_count: int = 100,
+        last_reprt_at: str | None = None,
+        bgn_de: str | None = None,
+        end_de: str | None = None,
+        pblntf_ty: str | None = None,
+    ) -> DartListResponse:
+        async with self.rate_limiter.slot_async() as slot:
+            response: DartListResponse = await self.async_http_client.get_json(
+                f"{self.base_url}/list.json",
+                self._list_params(corp_code, page_no, page_count, last_reprt_at, bgn_de, end_de, pblntf_ty),
+            )
+            slot.throttled = self._is_rate_limited(response)
+        self._ensure_success(response, allow_no_data=True)
+        return response
+
+    def fetch_list(
+        self,
+        corp_code: str,
+        page_no: int = 1,
+        page_count: int = 100,
+        last_reprt_at: str | None = None,
+        bgn_de: str | None = None,
+        end_de: str | None = None,
+    ) -> list[DartDisclosureItem]:
+        return self.fetch_list_page(corp_code, page_no, page_count, last_reprt_at, bgn_de, end_de).get("list", [])
+
+    async def fetch_list_async(
+        self,
+        corp_code: str,
+        page_no: int = 1,
+        page_count: int = 100,
+        last_reprt_at: str | None = None,
+        bgn_de: str | None = None,
+        end_de: str | None = None,
+    ) -> list[DartDisclosureItem]:
+        response = await self.fetch_list_page_async(corp_code, page_no, page_count, last_reprt_at, bgn_de, end_de)
         return response.get("list", [])
 
-    def fetch_document_zip(self, rcept_no: str) -> bytes:
-        return self.http_client.get_bytes(
+    def fetch_document(self, rcept_no: str) -> BulkFetchResult:
+        # A receipt number's original document never changes; corrections get a new rcept_no.
+        return self._fetch_bulk(
+            f"document/{rcept_no}.zip",
             f"{self.base_url}/document.xml",
             {"crtfc_key": self.api_key, "rcept_no": rcept_no},
+            immutable=True,
         )
 
+    def fetch_document_zip(self, rcept_no: str) -> bytes:
+        return self.fetch_document(rcept_no).payload
+
     def fetch_estk_rs(self, rcept_no: str) -> DartEstkRsResponse:
         response: DartEstkRsResponse = self.http_client.get_json(
             f"{self.base_url}/estkRs.json",
@@ -68,6 +205,10 @@ class DartConnector:
         self._ensure_success(response)
         return response
 
+    @staticmethod
+    def _is_rate_limited(response: dict) -> bool:
+        return str(response.get("status", "")).strip() == _RATE_LIMIT_STATUS
+
     @staticmethod
     def _ensure_success(response: dict, *, allow_no_data: bool = False) -> None:
         status = str(response.get("status", "")).strip()
@@ -76,4 +217,5 @@ class DartConnector:
         if allow_no_data and status == "013":
             return
         message = str(response.get("message", "Unknown DART API error")).strip()
-        raise DartApiError(f"DART API status={status}: {message}")
+        error_cls = DartRateLimitError if status == _RATE_LIMIT_STATUS else DartApiError
+        raise error_cls(f"DART API status={status}: {message}")
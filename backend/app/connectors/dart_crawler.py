@@ -0,0 +1,188 @@
+import asyncio
+import json
+import math
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from app.connectors.dart_connector import DartConnector, DartRateLimitError
+from app.schemas.dart import DartDisclosureItem, DartListResponse
+
+# list.json rejects market-wide queries (no corp_code) spanning more than three months.
+MARKET_WIDE_WINDOW_DAYS = 90
+
+
+@dataclass(frozen=True, slots=True)
+class DartCrawlWindow:
+    bgn_de: str
+    end_de: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.bgn_de}-{self.end_de}"
+
+
+def _parse_de(value: str) -> date:
+    return datetime.strptime(value, "%Y%m%d").date()
+
+
+def split_crawl_windows(bgn_de: str, end_de: str, window_days: int | None) -> list[DartCrawlWindow]:
+    begin, end = _parse_de(bgn_de), _parse_de(end_de)
+    if window_days is None:
+        return [DartCrawlWindow(bgn_de, end_de)]
+    windows: list[DartCrawlWindow] = []
+    cursor = begin
+    while cursor <= end:
+        window_end = min(end, cursor + timedelta(days=window_days - 1))
+        windows.append(DartCrawlWindow(cursor.strftime("%Y%m%d"), window_end.strftime("%Y%m%d")))
+        cursor = window_end + timedelta(days=1)
+    return windows
+
+
+def _total_pages(response: DartListResponse, page_count: int) -> int:
+    if response.get("total_page"):
+        return int(response["total_page"])
+    total_count = int(response.get("total_count") or 0)
+    return max(1, math.ceil(total_count / page_count))
+
+
+class CrawlCheckpoint:
+    def __init__(self, path: str | Path, query: dict) -> None:
+        self.path = Path(path)
+        self.query = query
+        self.completed: set[str] = set()
+        # Last page consumed in each unfinished window, so a long window (or a corp-scoped crawl, which is a single
+        # window) resumes mid-way instead of from page 1.
+        self.pages: dict[str, int] = {}
+        try:
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        # A checkpoint from a different query must not skip windows of this one.
+        if state.get("query") == query:
+            self.completed = set(state.get("completed", []))
+            self.pages = {key: int(page_no) for key, page_no in state.get("pages", {}).items()}
+
+    def is_done(self, window: DartCrawlWindow) -> bool:
+        return window.key in self.completed
+
+    def pages_done(self, window: DartCrawlWindow) -> int:
+        return self.pages.get(window.key, 0)
+
+    def mark_pages(self, window: DartCrawlWindow, page_no: int) -> None:
+        self.pages[window.key] = page_no
+        self._save()
+
+    def mark_done(self, window: DartCrawlWindow) -> None:
+        self.completed.add(window.key)
+        self.pages.pop(window.key, None)
+        self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"query": self.query, "completed": sorted(self.completed), "pages": self.pages},
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self.path)
+
+
+class DartDisclosureCrawler:
+    def __init__(
+        self,
+        connector: DartConnector,
+        *,
+        page_count: int = 100,
+        max_attempts: int = 3,
+        initial_backoff: float = 1.0,
+        pages_per_chunk: int = 10,
+    ) -> None:
+        self.connector = connector
+        self.page_count = page_count
+        self.pages_per_chunk = pages_per_chunk
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+
+    async def _fetch_page(self, page_no: int, params: dict) -> DartListResponse:
+        backoff = self.initial_backoff
+        attempt = 1
+        while True:
+            try:
+                return await self.connector.fetch_list_page_async(
+                    page_no=page_no,
+                    page_count=self.page_count,
+                    **params,
+                )
+            except DartRateLimitError:
+                if attempt >= self.max_attempts:
+                    raise
+                await asyncio.sleep(backoff)
+                backoff *= 2
+                attempt += 1
+
+    async def _iter_window_pages(
+        self, window: DartCrawlWindow, params: dict, start_page: int
+    ) -> AsyncIterator[tuple[int, list[DartDisclosureItem]]]:
+        window_params = {**params, "bgn_de": window.bgn_de, "end_de": window.end_de}
+        first = await self._fetch_page(start_page, window_params)
+        total_pages = _total_pages(first, self.page_count)
+        page_no, rows = start_page, list(first.get("list", []))
+        while True:
+            yield page_no, rows
+            if page_no >= total_pages:
+                return
+            chunk_end = min(total_pages, page_no + self.pages_per_chunk)
+            # The connector's rate limiter paces the fan-out; gather just keeps the pipe full.
+            responses = await asyncio.gather(
+                *(self._fetch_page(chunk_page, window_params) for chunk_page in range(page_no + 1, chunk_end + 1))
+            )
+            page_no, rows = chunk_end, [row for response in responses for row in response.get("list", [])]
+
+    async def iter_windows(
+        self,
+        bgn_de: str,
+        end_de: str,
+        *,
+        corp_code: str | None = None,
+        pblntf_ty: str | None = None,
+        checkpoint_path: str | Path | None = None,
+    ) -> AsyncIterator[tuple[DartCrawlWindow, list[DartDisclosureItem]]]:
+        # Yields each window in chunks of pages_per_chunk pages; a window can appear more than once.
+        params = {"corp_code": corp_code, "pblntf_ty": pblntf_ty}
+        windows = split_crawl_windows(bgn_de, end_de, None if corp_code else MARKET_WIDE_WINDOW_DAYS)
+        checkpoint = (
+            CrawlCheckpoint(checkpoint_path, {**params, "bgn_de": bgn_de, "end_de": end_de})
+            if checkpoint_path
+            else None
+        )
+        for window in windows:
+            if checkpoint is not None and checkpoint.is_done(window):
+                continue
+            start_page = checkpoint.pages_done(window) + 1 if checkpoint is not None else 1
+            async for page_no, rows in self._iter_window_pages(window, params, start_page):
+                yield window, rows
+                # Only advance the cursor once the caller has consumed the chunk.
+                if checkpoint is not None:
+                    checkpoint.mark_pages(window, page_no)
+            if checkpoint is not None:
+                checkpoint.mark_done(window)
+
+    async def crawl(
+        self,
+        bgn_de: str,
+        end_de: str,
+        *,
+        corp_code: str | None = None,
+        pblntf_ty: str | None = None,
+    ) -> list[DartDisclosureItem]:
+        # No checkpoint here: rows collected in memory would be lost on a crash after their pages were marked done.
+        # Resumable crawls persist each chunk from iter_windows before asking for the next.
+        rows: list[DartDisclosureItem] = []
+        async for _, window_rows in self.iter_windows(bgn_de, end_de, corp_code=corp_code, pblntf_ty=pblntf_ty):
+            rows.extend(window_rows)
+        return rows
@@ -1,16 +1,197 @@
+import asyncio
 import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from http.client import BadStatusLine, HTTPConnection, HTTPException, HTTPMessage, HTTPSConnection
 from http.cookiejar import CookieJar
-from urllib.parse import urlencode
-from urllib.request import HTTPCookieProcessor, Request, build_opener
+from io import BytesIO
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode, urljoin, urlsplit
+from urllib.request import Request
+
+_REDIRECT_CODES = {301, 302, 303, 307, 308}
+_MAX_REDIRECTS = 5
+_DEFAULT_USER_AGENT = f"Python-urllib/{sys.version_info.major}.{sys.version_info.minor}"
+
+
+@dataclass(slots=True)
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+
+
+class ConnectionPool:
+    def __init__(self, max_per_host: int = 8, idle_timeout: float = 30.0) -> None:
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self._idle: dict[tuple[str, str, int], deque[tuple[HTTPConnection, float]]] = {}
+        self._stats: dict[str, PoolStats] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ConnectionPool":
+        return cls(
+            max_per_host=int(os.getenv("HTTP_POOL_MAX_PER_HOST", "8")),
+            idle_timeout=float(os.getenv("HTTP_POOL_IDLE_TIMEOUT", "30")),
+        )
+
+    def acquire(self, scheme: str, host: str, port: int, timeout: float) -> tuple[HTTPConnection, bool]:
+        key = (scheme, host, port)
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats.setdefault(host, PoolStats())
+            idle = self._idle.get(key)
+            while idle:
+                conn, released_at = idle.pop()
+                if now - released_at > self.idle_timeout:
+                    stats.expired += 1
+                    conn.close()
+                    continue
+                stats.hits += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            stats.misses += 1
+        connection_cls = HTTPSConnection if scheme == "https" else HTTPConnection
+        return connection_cls(host, port, timeout=timeout), False
+
+    def release(self, scheme: str, host: str, port: int, conn: HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, host, port), deque())
+            if len(idle) < self.max_per_host:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {host: asdict(stats) for host, stats in sorted(self._stats.items())}
+
+    def close(self) -> None:
+        with self._lock:
+            connections = [conn for idle in self._idle.values() for conn, _ in idle]
+            self._idle.clear()
+        for conn in connections:
+            conn.close()
+
+
+@dataclass(slots=True)
+class ConditionalResponse:
+    not_modified: bool
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+
+
+# Shared by every HttpClient so connector instances created per request still reuse sockets.
+default_pool = ConnectionPool.from_env()
 
 
 class HttpClient:
-    def __init__(self) -> None:
-        self._opener = build_opener(HTTPCookieProcessor(CookieJar()))
+    def __init__(self, pool: ConnectionPool | None = None, cookie_jar: CookieJar | None = None) -> None:
+        self.pool = pool or default_pool
+        self.cookie_jar = cookie_jar if cookie_jar is not None else CookieJar()
+
+    def _send(self, request: Request, timeout: float) -> tuple[int, str, HTTPMessage, bytes]:
+        parts = urlsplit(request.full_url)
+        scheme = parts.scheme
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        self.cookie_jar.add_cookie_header(request)
+        headers = dict(request.header_items())
+        header_names = {name.lower() for name in headers}
+        if "user-agent" not in header_names:
+            headers["User-Agent"] = _DEFAULT_USER_AGENT
+        if "connection" not in header_names:
+            headers["Connection"] = "keep-alive"
+
+        for attempt in range(2):
+            conn, reused = self.pool.acquire(scheme, host, port, timeout)
+            try:
+                conn.request(request.get_method(), path, body=request.data, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, HTTPException) as exc:
+                conn.close()
+                # A pooled socket may have been closed by the server while idle.
+                if reused and attempt == 0 and isinstance(exc, (ConnectionError, BadStatusLine)):
+                    continue
+                raise URLError(exc) from exc
+            self.cookie_jar.extract_cookies(response, request)
+            if response.will_close:
+                conn.close()
+            else:
+                self.pool.release(scheme, host, port, conn)
+            return response.status, response.reason, response.headers, body
+        raise URLError("connection retry exhausted")
+
+    @staticmethod
+    def _redirect_request(request: Request, status: int, location: str) -> Request:
+        new_url = urljoin(request.full_url, location)
+        if status in {307, 308}:
+            return Request(new_url, data=request.data, headers=dict(request.headers), method=request.get_method())
+        headers = {
+            key: value for key, value in request.headers.items() if key.lower() not in {"content-length", "content-type"}
+        }
+        return Request(new_url, headers=headers, method="GET")
+
+    def _fetch(self, request: Request, timeout: int) -> tuple[Request, int, str, HTTPMessage, bytes]:
+        redirects = 0
+        while True:
+            status, reason, headers, body = self._send(request, timeout)
+            location = headers.get("Location")
+            if status in _REDIRECT_CODES and location and redirects < _MAX_REDIRECTS:
+                request = self._redirect_request(request, status, location)
+                redirects += 1
+                continue
+            return request, status, reason, headers, body
 
     def _open(self, request: Request, timeout: int) -> bytes:
-        with self._opener.open(request, timeout=timeout) as response:  # noqa: S310
-            return response.read()
+        request, status, reason, headers, body = self._fetch(request, timeout)
+        if not 200 <= status < 300:
+            raise HTTPError(request.full_url, status, reason, headers, BytesIO(body))
+        return body
+
+    def get_conditional(
+        self,
+        url: str,
+        params: dict,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> ConditionalResponse:
+        request_headers = dict(headers or {})
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+        request = Request(f"{url}?{urlencode(params)}", headers=request_headers, method="GET")
+        request, status, reason, response_headers, body = self._fetch(request, timeout=60)
+        if status == 304:
+            return ConditionalResponse(not_modified=True, body=b"", etag=etag, last_modified=last_modified)
+        if not 200 <= status < 300:
+            raise HTTPError(request.full_url, status, reason, response_headers, BytesIO(body))
+        return ConditionalResponse(
+            not_modified=False,
+            body=body,
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified"),
+        )
 
     def get_json(self, url: str, params: dict, headers: dict[str, str] | None = None) -> dict:
         full_url = f"{url}?{urlencode(params)}"
@@ -54,3 +235,55 @@ class HttpClient:
             method="POST",
         )
         return self._open(request, timeout=30).decode("utf-8")
+
+
+_shared_executor: ThreadPoolExecutor | None = None
+_shared_executor_lock = threading.Lock()
+
+
+def shared_executor() -> ThreadPoolExecutor:
+    # Process-wide worker pool for blocking connector I/O; asyncio.run() would otherwise build a new one per call.
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=max(1, int(os.getenv("CONNECTOR_MAX_WORKERS", "16"))),
+                thread_name_prefix="connector-io",
+            )
+        return _shared_executor
+
+
+class AsyncHttpClient:
+    # Runs the pooled blocking client off the event loop; sockets stay shared with sync callers.
+    def __init__(
+        self,
+        http_client: HttpClient | None = None,
+        max_concurrency: int | None = None,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        self.http_client = http_client or HttpClient()
+        self.executor = executor
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        executor = self.executor or shared_executor()
+        if self._semaphore is None:
+            return await loop.run_in_executor(executor, partial(fn, *args))
+        async with self._semaphore:
+            return await loop.run_in_executor(executor, partial(fn, *args))
+
+    async def get_json(self, url: str, params: dict, headers: dict[str, str] | None = None) -> dict:
+        return await self._run(self.http_client.get_json, url, params, headers)
+
+    async def get_bytes(self, url: str, params: dict, headers: dict[str, str] | None = None) -> bytes:
+        return await self._run(self.http_client.get_bytes, url, params, headers)
+
+    async def get_text(self, url: str, params: dict, headers: dict[str, str] | None = None) -> str:
+        return await self._run(self.http_client.get_text, url, params, headers)
+
+    async def post_json(self, url: str, data: dict, headers: dict[str, str] | None = None) -> dict:
+        return await self._run(self.http_client.post_json, url, data, headers)
+
+    async def post_text(self, url: str, data: dict, headers: dict[str, str] | None = None) -> str:
+        return await self._run(self.http_client.post_text, url, data, headers)
@@ -1,13 +1,125 @@
+import asyncio
 import html
+import os
 import re
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import date
+from functools import partial
+from urllib.error import HTTPError
 
-from app.connectors.http_client import HttpClient
+from app.connectors.http_client import HttpClient, shared_executor
+from app.connectors.session_manager import SessionManager
+
+# One scanner for the whole page: a cell body, or a row boundary. Rows are emitted as </tr> is reached.
+# The cell body is an unrolled "anything up to </td>" loop, which avoids the backtracking of a lazy .*?.
+_TABLE_TOKEN = re.compile(
+    r"<(?:[tT][dD]\b[^>]*>([^<]*(?:<(?!/[tT][dD]>)[^<]*)*)</[tT][dD]>|(/?)[tT][rR]\b[^>]*>)"
+)
+_LINE_BREAK = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_TAG = re.compile(r"<.*?>", re.DOTALL)
+_SESSION_EXPIRED_STATUS_CODES = {401, 403}
+_ALT_ATTR = re.compile(r"alt=['\"]([^'\"]+)['\"]", re.IGNORECASE)
+_ROW_FIELDS = ("corp_name", "market", "stage", "listing_date", "lead_manager")
+# Stages the parser derives from listing_date and today's date rather than reads from the page.
+_DERIVED_STAGES = {"prelisting", "listed"}
+
+
+def iter_table_rows(document: str) -> Iterator[list[str]]:
+    cells: list[str] | None = None
+    for match in _TABLE_TOKEN.finditer(document):
+        cell = match.group(1)
+        if cell is not None:
+            if cells is not None:
+                cells.append(cell)
+        elif match.group(2):
+            if cells is not None:
+                yield cells
+            cells = None
+        else:
+            cells = []
+
+
+def kind_row_fingerprint(row: dict[str, str]) -> str:
+    # Every field, so a stage or lead manager change makes the row unseen and the walk picks it up.
+    return "|".join(row.get(field, "") for field in _ROW_FIELDS)
+
+
+@dataclass(slots=True)
+class KindPagedFetch:
+    rows: list[dict[str, str]]
+    pages: int
+    complete: bool
+    # The walk stopped at KIND_MAX_PAGES before reaching a known row or the end of the list.
+    truncated: bool = False
+
+
+class KindRowCache:
+    # Rows seen so far, newest first, keyed by corp_name so a re-dated company replaces its old row.
+    def __init__(self, full_resync_seconds: float = 86400.0) -> None:
+        self.full_resync_seconds = full_resync_seconds
+        self._rows: dict[str, dict[str, str]] = {}
+        self._synced_at: float | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "KindRowCache":
+        return cls(full_resync_seconds=float(os.getenv(f"{prefix}_FULL_RESYNC_SECONDS", "86400")))
+
+    def known_fingerprints(self) -> set[str]:
+        with self._lock:
+            if self._synced_at is None or time.monotonic() - self._synced_at >= self.full_resync_seconds:
+                return set()
+            return {kind_row_fingerprint(row) for row in self._rows.values()}
+
+    def merge(self, fetch: KindPagedFetch) -> list[dict[str, str]]:
+        with self._lock:
+            if fetch.complete:
+                # The walk reached the end of the list, so it is a full snapshot; drop withdrawn rows.
+                self._rows = {}
+                self._synced_at = time.monotonic()
+            elif fetch.truncated and self._synced_at is None:
+                # Rows past KIND_MAX_PAGES are never reachable, so a full walk that hit the cap is as synced as it
+                # gets. Without this every later call would repeat the full walk.
+                self._synced_at = time.monotonic()
+            fresh = {row["corp_name"]: row for row in fetch.rows}
+            self._rows = {**fresh, **{name: row for name, row in self._rows.items() if name not in fresh}}
+            # A cached prelisting row must turn listed once its date passes, not only after the next resync.
+            today = date.today()
+            for row in self._rows.values():
+                if row.get("stage") in _DERIVED_STAGES:
+                    row["stage"] = KindConnector._normalize_stage(row.get("listing_date"), today)
+            return list(self._rows.values())
+
+
+public_offering_row_cache = KindRowCache.from_env("KIND")
+kind_session = SessionManager.from_env("KIND")
+
+
+def _take_unseen(rows: list[dict[str, str]], known: set[str]) -> tuple[list[dict[str, str]], bool]:
+    for index, row in enumerate(rows):
+        if kind_row_fingerprint(row) in known:
+            return rows[:index], True
+    return rows, False
 
 
 class KindConnector:
-    def __init__(self, http_client: HttpClient | None = None) -> None:
-        self.http_client = http_client or HttpClient()
+    def __init__(
+        self,
+        http_client: HttpClient | None = None,
+        row_cache: KindRowCache | None = None,
+        page_size: int | None = None,
+        parallel_pages: int | None = None,
+        session: SessionManager | None = None,
+    ) -> None:
+        self.session = session or kind_session
+        self.http_client = http_client or self.session.default_client()
+        self.row_cache = row_cache or public_offering_row_cache
+        self.page_size = page_size or int(os.getenv("KIND_PAGE_SIZE", "100"))
+        self.parallel_pages = parallel_pages or int(os.getenv("KIND_PARALLEL_PAGES", "4"))
+        self.max_pages = int(os.getenv("KIND_MAX_PAGES", "50"))
         self.base_url = "https://kind.krx.co.kr/listinvstg"
         self.main_url = f"{self.base_url}/pubofrprogcom.do"
         self.browser_headers = {
@@ -17,70 +129,135 @@ class KindConnector:
             "X-Requested-With": "XMLHttpRequest",
         }
 
-    def fetch_public_offering_companies(self) -> list[dict[str, str]]:
+    @staticmethod
+    def _sub_request_payload(page_index: int = 1, page_size: int = 3000) -> dict[str, str]:
+        return {
+            "method": "searchPubofrProgComSub",
+            "forward": "pubofrprogcom_sub",
+            "currentPageSize": str(page_size),
+            "pageIndex": str(page_index),
+            "marketType": "",
+            "searchCorpName": "",
+            "fromDate": "",
+            "toDate": "",
+            "repMajAgntDesignAdvserComp": "",
+            "repMajAgntComp": "",
+            "designAdvserComp": "",
+        }
+
+    def _prime_session(self) -> None:
         # KIND listing page renders rows via server-side sub request.
         self.http_client.get_text(
             self.main_url,
             {"method": "searchPubofrProgComMain"},
             headers={"User-Agent": self.browser_headers["User-Agent"]},
         )
-        sub_html = self.http_client.post_text(
-            self.main_url,
-            {
-                "method": "searchPubofrProgComSub",
-                "forward": "pubofrprogcom_sub",
-                "currentPageSize": "3000",
-                "pageIndex": "1",
-                "marketType": "",
-                "searchCorpName": "",
-                "fromDate": "",
-                "toDate": "",
-                "repMajAgntDesignAdvserComp": "",
-                "repMajAgntComp": "",
-                "designAdvserComp": "",
-            },
-            headers=self.browser_headers,
+
+    def _post_page(self, page_index: int) -> str:
+        return self.http_client.post_text(
+            self.main_url, self._sub_request_payload(page_index, self.page_size), headers=self.browser_headers
         )
+
+    def _fetch_page(self, page_index: int) -> list[dict[str, str]]:
+        try:
+            sub_html = self._post_page(page_index)
+        except HTTPError as exc:
+            if exc.code not in _SESSION_EXPIRED_STATUS_CODES:
+                raise
+            self.session.invalidate(self.http_client)
+            self.session.ensure_primed(self.http_client, self._prime_session)
+            sub_html = self._post_page(page_index)
         return self._parse_company_table(sub_html)
 
+    async def _fetch_page_async(self, page_index: int) -> list[dict[str, str]]:
+        # The post, a possible re-prime and the parse all run on the connector worker pool.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(shared_executor(), partial(self._fetch_page, page_index))
+
+    def _consume_pages(
+        self, pages: list[list[dict[str, str]]], known: set[str], collected: list[dict[str, str]]
+    ) -> tuple[bool, bool]:
+        # Returns (done, complete). Pages are newest first, so the first known row ends the walk early.
+        for page_rows in pages:
+            unseen, hit_known = _take_unseen(page_rows, known)
+            collected.extend(unseen)
+            if hit_known:
+                return True, False
+            if len(page_rows) < self.page_size:
+                return True, True
+        return False, False
+
+    def fetch_new_public_offering_companies(self, known: set[str]) -> KindPagedFetch:
+        self.session.ensure_primed(self.http_client, self._prime_session)
+        collected: list[dict[str, str]] = []
+        for page_index in range(1, self.max_pages + 1):
+            done, complete = self._consume_pages([self._fetch_page(page_index)], known, collected)
+            if done:
+                return KindPagedFetch(rows=collected, pages=page_index, complete=complete)
+        return KindPagedFetch(rows=collected, pages=self.max_pages, complete=False, truncated=True)
+
+    async def fetch_new_public_offering_companies_async(self, known: set[str]) -> KindPagedFetch:
+        await self.session.ensure_primed_async(self.http_client, self._prime_session)
+        collected: list[dict[str, str]] = []
+        first_page = await self._fetch_page_async(1)
+        done, complete = self._consume_pages([first_page], known, collected)
+        fetched = 1
+        while not done and fetched < self.max_pages:
+            batch = range(fetched + 1, min(fetched + self.parallel_pages, self.max_pages) + 1)
+            pages = await asyncio.gather(*(self._fetch_page_async(page_index) for page_index in batch))
+            fetched = batch[-1]
+            done, complete = self._consume_pages(list(pages), known, collected)
+        return KindPagedFetch(rows=collected, pages=fetched, complete=complete, truncated=not done)
+
+    def fetch_public_offering_companies(self) -> list[dict[str, str]]:
+        fetch = self.fetch_new_public_offering_companies(self.row_cache.known_fingerprints())
+        return self.row_cache.merge(fetch)
+
+    async def fetch_public_offering_companies_async(self) -> list[dict[str, str]]:
+        fetch = await self.fetch_new_public_offering_companies_async(self.row_cache.known_fingerprints())
+        return self.row_cache.merge(fetch)
+
     @staticmethod
     def _clean_cell(value: str) -> str:
-        stripped = re.sub(r"<br\s*/?>", " ", value, flags=re.IGNORECASE)
-        stripped = re.sub(r"<.*?>", "", stripped)
-        return html.unescape(stripped).replace("\xa0", " ").strip()
+        # Most cells are plain text; skip the substitutions unless markup or entities are present.
+        if "<" in value:
+            value = _TAG.sub("", _LINE_BREAK.sub(" ", value))
+        if "&" in value:
+            value = html.unescape(value)
+        return value.replace("\xa0", " ").strip()
 
     @staticmethod
-    def _normalize_stage(listing_date: str | None) -> str:
+    def _normalize_stage(listing_date: str | None, today: date | None = None) -> str:
         if not listing_date:
             return "offering"
         cleaned = listing_date.replace("-", "")
         if len(cleaned) != 8 or not cleaned.isdigit():
             return "offering"
         target = date(int(cleaned[:4]), int(cleaned[4:6]), int(cleaned[6:8]))
-        return "prelisting" if target >= date.today() else "listed"
+        return "prelisting" if target >= (today or date.today()) else "listed"
 
     @staticmethod
     def _parse_company_table(html: str) -> list[dict[str, str]]:
-        rows = re.findall(r"<tr[^>]*>(.*?)</tr>", html, re.IGNORECASE | re.DOTALL)
+        today = date.today()
+        clean = KindConnector._clean_cell
         items: list[dict[str, str]] = []
-        for row in rows:
-            cells = re.findall(r"<td[^>]*>(.*?)</td>", row, re.IGNORECASE | re.DOTALL)
+        for cells in iter_table_rows(html):
             if len(cells) < 5:
                 continue
-            cleaned = [KindConnector._clean_cell(cell) for cell in cells]
+            # Only the columns that end up in the item are cleaned.
             if len(cells) >= 9:
-                market_match = re.search(r"alt=['\"]([^'\"]+)['\"]", cells[0], re.IGNORECASE)
-                market = KindConnector._clean_cell(market_match.group(1)) if market_match else ""
-                corp_name = cleaned[0]
-                listing_date = cleaned[7]
-                lead_manager = cleaned[8]
-                stage = KindConnector._normalize_stage(listing_date)
+                market_match = _ALT_ATTR.search(cells[0])
+                market = clean(market_match.group(1)) if market_match else ""
+                corp_name = clean(cells[0])
+                listing_date = clean(cells[7])
+                lead_manager = clean(cells[8])
+                stage = KindConnector._normalize_stage(listing_date, today)
             else:
-                corp_name = cleaned[0]
-                market = cleaned[1]
-                stage = cleaned[2] or KindConnector._normalize_stage(cleaned[3] if len(cleaned) > 3 else None)
-                listing_date = cleaned[3] if len(cleaned) > 3 else ""
-                lead_manager = cleaned[4] if len(cleaned) > 4 else ""
+                corp_name = clean(cells[0])
+                market = clean(cells[1])
+                listing_date = clean(cells[3])
+                stage = clean(cells[2]) or KindConnector._normalize_stage(listing_date, today)
+                lead_manager = clean(cells[4])
             if not corp_name:
                 continue
             items.append({"corp_name": corp_name, "market": market, "stage": stage, "listing_date": listing_date, "lead_manager": lead_manager})
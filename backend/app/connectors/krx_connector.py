@@ -1,7 +1,11 @@
 import json
+import os
 from urllib.error import HTTPError
 
-from app.connectors.http_client import HttpClient
+from app.connectors.http_client import AsyncHttpClient, HttpClient
+from app.connectors.rate_limit import SourceRateLimiter
+from app.connectors.response_cache import ResponseCache, build_cache_key, resolve_bas_dd_ttl
+from app.connectors.session_manager import SessionManager
 
 
 class KrxAuthError(RuntimeError):
@@ -16,10 +20,32 @@ class KrxRequestError(RuntimeError):
     pass
 
 
+_SESSION_EXPIRED_STATUS_CODES = {400, 401, 403}
+
+# Quota is per API key, so every connector instance draws from the same bucket.
+open_api_rate_limiter = SourceRateLimiter.from_env("KRX_OPEN_API", rate_per_second=10.0, burst=10, max_concurrency=8)
+# Disabled unless KRX_OPEN_API_CACHE_DIR is set.
+open_api_response_cache = ResponseCache.from_env("KRX_OPEN_API")
+# data.krx.co.kr cookies, primed once and shared by every connector using the default client.
+data_session = SessionManager.from_env("KRX_DATA")
+
+
 class KrxConnector:
-    def __init__(self, http_client: HttpClient | None = None, api_key: str | None = None) -> None:
-        self.http_client = http_client or HttpClient()
+    def __init__(
+        self,
+        http_client: HttpClient | None = None,
+        api_key: str | None = None,
+        rate_limiter: SourceRateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        session: SessionManager | None = None,
+    ) -> None:
+        self.session = session or data_session
+        self.http_client = http_client or self.session.default_client()
+        self.async_http_client = AsyncHttpClient(self.http_client)
         self.api_key = api_key
+        self.rate_limiter = rate_limiter or open_api_rate_limiter
+        self.response_cache = response_cache or open_api_response_cache
+        self.cache_today_ttl = float(os.getenv("KRX_OPEN_API_CACHE_TODAY_TTL", "300"))
         self.endpoint = "https://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
         self.loader_url = "https://data.krx.co.kr/contents/MDC/MDI/mdiLoader/index.cmd"
         self.openapi_base_url = "https://data-dbg.krx.co.kr/svc/apis"
@@ -45,7 +71,16 @@ class KrxConnector:
             pass
         return raw[:200] or f"http {error.code}"
 
-    def fetch_open_api(self, api_path: str, params: dict[str, str]) -> dict:
+    @classmethod
+    def _map_open_api_error(cls, error: HTTPError) -> Exception:
+        message = cls._extract_error_message(error)
+        if error.code == 403 and "access denied" in message.lower():
+            return KrxAccessDeniedError(message)
+        if error.code in {401, 403}:
+            return KrxAuthError(message)
+        return KrxRequestError(message)
+
+    def _open_api_request(self, api_path: str) -> tuple[str, dict[str, str]]:
         if not self.api_key:
             raise ValueError("KRX_API_KEY is required for Open API calls.")
         path = api_path.lstrip("/")
@@ -54,19 +89,79 @@ class KrxConnector:
             "AUTH_KEY": self.api_key,
             "User-Agent": self.browser_headers["User-Agent"],
         }
-        try:
-            return self.http_client.get_json(url, params, headers=headers)
-        except HTTPError as exc:
-            message = self._extract_error_message(exc)
-            if exc.code == 403 and "access denied" in message.lower():
-                raise KrxAccessDeniedError(message) from exc
-            if exc.code in {401, 403}:
-                raise KrxAuthError(message) from exc
-            raise KrxRequestError(message) from exc
+        return url, headers
 
-    def fetch_dataset(self, bld: str, params: dict[str, str]) -> dict:
+    def _cached_open_api(self, api_path: str, params: dict[str, str]) -> tuple[str | None, dict | None]:
+        if self.response_cache is None:
+            return None, None
+        key = build_cache_key(api_path.lstrip("/"), params)
+        return key, self.response_cache.get(key)
+
+    def _store_open_api(self, key: str | None, params: dict[str, str], payload: dict) -> None:
+        if self.response_cache is None or key is None or not isinstance(payload.get("OutBlock_1"), list):
+            return
+        ttl = resolve_bas_dd_ttl(params, today_ttl=self.cache_today_ttl, has_rows=bool(payload["OutBlock_1"]))
+        self.response_cache.put(key, payload, ttl_seconds=ttl)
+
+    def fetch_open_api(self, api_path: str, params: dict[str, str]) -> dict:
+        url, headers = self._open_api_request(api_path)
+        cache_key, cached = self._cached_open_api(api_path, params)
+        if cached is not None:
+            return cached
+        with self.rate_limiter.slot():
+            try:
+                payload = self.http_client.get_json(url, params, headers=headers)
+            except HTTPError as exc:
+                raise self._map_open_api_error(exc) from exc
+        self._store_open_api(cache_key, params, payload)
+        return payload
+
+    async def fetch_open_api_async(self, api_path: str, params: dict[str, str]) -> dict:
+        url, headers = self._open_api_request(api_path)
+        cache_key, cached = self._cached_open_api(api_path, params)
+        if cached is not None:
+            return cached
+        async with self.rate_limiter.slot_async():
+            try:
+                payload = await self.async_http_client.get_json(url, params, headers=headers)
+            except HTTPError as exc:
+                raise self._map_open_api_error(exc) from exc
+        self._store_open_api(cache_key, params, payload)
+        return payload
+
+    def _prime_session(self) -> None:
         # KRX endpoint may reject direct POST without session priming.
         self.http_client.get_text(self.loader_url, {}, headers={"User-Agent": self.browser_headers["User-Agent"]})
+
+    @staticmethod
+    def _session_expired(error: Exception) -> bool:
+        # An expired session answers with an error status or an HTML page instead of JSON.
+        return isinstance(error, ValueError) or (
+            isinstance(error, HTTPError) and error.code in _SESSION_EXPIRED_STATUS_CODES
+        )
+
+    def fetch_dataset(self, bld: str, params: dict[str, str]) -> dict:
         payload = {"bld": bld}
         payload.update(params)
+        self.session.ensure_primed(self.http_client, self._prime_session)
+        try:
+            return self.http_client.post_json(self.endpoint, payload, headers=self.browser_headers)
+        except (HTTPError, ValueError) as exc:
+            if not self._session_expired(exc):
+                raise
+        self.session.invalidate(self.http_client)
+        self.session.ensure_primed(self.http_client, self._prime_session)
         return self.http_client.post_json(self.endpoint, payload, headers=self.browser_headers)
+
+    async def fetch_dataset_async(self, bld: str, params: dict[str, str]) -> dict:
+        payload = {"bld": bld}
+        payload.update(params)
+        await self.session.ensure_primed_async(self.http_client, self._prime_session)
+        try:
+            return await self.async_http_client.post_json(self.endpoint, payload, headers=self.browser_headers)
+        except (HTTPError, ValueError) as exc:
+            if not self._session_expired(exc):
+                raise
+        self.session.invalidate(self.http_client)
+        await self.session.ensure_primed_async(self.http_client, self._prime_session)
+        return await self.async_http_client.post_json(self.endpoint, payload, headers=self.browser_headers)
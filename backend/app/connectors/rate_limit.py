@@ -0,0 +1,204 @@
+import asyncio
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from urllib.error import HTTPError, URLError
+
+_PUSH_BACK_STATUS_CODES = {403, 429}
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: int) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.wait_seconds = 0.0
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.rate_per_second)
+            self._updated_at = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self.acquired += 1
+                return 0.0
+            delay = (1.0 - self._tokens) / self.rate_per_second
+            self.wait_seconds += delay
+            return delay
+
+    def acquire(self) -> None:
+        while (delay := self._reserve()) > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        while (delay := self._reserve()) > 0:
+            await asyncio.sleep(delay)
+
+
+class AdaptiveConcurrencyLimiter:
+    # AIMD: +1 slot per window of successes, multiplicative cut when the source pushes back.
+    def __init__(
+        self,
+        initial_limit: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        backoff_ratio: float = 0.5,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        # One event per waiting coroutine; the limiter is shared across threads and event loops, so release()
+        # sets them through their own loop rather than one loop-bound asyncio.Condition.
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self.successes = 0
+        self.throttled = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        with self._condition:
+            if self._in_flight >= int(self._limit):
+                return False
+            self._in_flight += 1
+            return True
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                waiter = (loop, asyncio.Event())
+                self._async_waiters.append(waiter)
+            try:
+                await waiter[1].wait()
+            finally:
+                with self._condition:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def _wake_async_waiters(self) -> None:
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiting loop has already closed.
+                pass
+
+    def release(self, *, throttled: bool) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+            else:
+                self.successes += 1
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+            self._wake_async_waiters()
+
+
+def is_push_back(error: BaseException | None) -> bool:
+    # Only signals that the source is overloaded shrink the limit: 403/429/5xx, timeouts and dropped connections.
+    # A bad request, unknown path, auth failure or undecodable body says nothing about load. Connectors wrap
+    # transport errors, so the cause chain is checked too.
+    while error is not None:
+        if isinstance(error, HTTPError):
+            return error.code in _PUSH_BACK_STATUS_CODES or error.code >= 500
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            return True
+        if isinstance(error, URLError):
+            return isinstance(error.reason, (TimeoutError, ConnectionError))
+        error = error.__cause__
+    return False
+
+
+@dataclass(slots=True)
+class RateLimitSlot:
+    throttled: bool = False
+
+
+class SourceRateLimiter:
+    def __init__(
+        self,
+        *,
+        rate_per_second: float,
+        burst: int,
+        initial_concurrency: int,
+        max_concurrency: int,
+    ) -> None:
+        self.bucket = TokenBucket(rate_per_second, burst)
+        self.concurrency = AdaptiveConcurrencyLimiter(initial_concurrency, max_limit=max_concurrency)
+
+    @classmethod
+    def from_env(cls, prefix: str, *, rate_per_second: float, burst: int, max_concurrency: int) -> "SourceRateLimiter":
+        max_limit = int(os.getenv(f"{prefix}_MAX_CONCURRENCY", str(max_concurrency)))
+        return cls(
+            rate_per_second=float(os.getenv(f"{prefix}_RATE_PER_SEC", str(rate_per_second))),
+            burst=int(os.getenv(f"{prefix}_RATE_BURST", str(burst))),
+            initial_concurrency=int(os.getenv(f"{prefix}_INITIAL_CONCURRENCY", str(max(1, max_limit // 2)))),
+            max_concurrency=max_limit,
+        )
+
+    @contextmanager
+    def slot(self) -> Iterator[RateLimitSlot]:
+        self.bucket.acquire()
+        self.concurrency.acquire()
+        slot = RateLimitSlot()
+        try:
+            yield slot
+        except Exception as exc:
+            slot.throttled = slot.throttled or is_push_back(exc)
+            raise
+        finally:
+            self.concurrency.release(throttled=slot.throttled)
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[RateLimitSlot]:
+        await self.bucket.acquire_async()
+        await self.concurrency.acquire_async()
+        slot = RateLimitSlot()
+        try:
+            yield slot
+        except Exception as exc:
+            slot.throttled = slot.throttled or is_push_back(exc)
+            raise
+        finally:
+            self.concurrency.release(throttled=slot.throttled)
+
+    def metrics(self) -> dict[str, float | int]:
+        return {
+            "rate_per_second": self.bucket.rate_per_second,
+            "burst": self.bucket.burst,
+            "acquired": self.bucket.acquired,
+            "wait_seconds": round(self.bucket.wait_seconds, 3),
+            "concurrency_limit": self.concurrency.limit,
+            "in_flight": self.concurrency.in_flight,
+            "successes": self.concurrency.successes,
+            "throttled": self.concurrency.throttled,
+        }
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# basDd is a KRX trading date, so "today" is Seoul's date whatever the host timezone. Korea has no DST.
+KRX_TIMEZONE = timezone(timedelta(hours=9), "Asia/Seoul")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def build_cache_key(endpoint: str, params: dict) -> str:
+    canonical = json.dumps({"endpoint": endpoint, "params": params}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def resolve_bas_dd_ttl(
+    params: dict, *, today_ttl: float, today: str | None = None, has_rows: bool = True
+) -> float | None:
+    # A closed trading day never changes, so past basDd responses are kept until evicted. An empty response may
+    # only mean KRX has not published that day yet, so it gets the short TTL instead.
+    bas_dd = str(params.get("basDd", "")).strip()
+    current = today or datetime.now(KRX_TIMEZONE).strftime("%Y%m%d")
+    if has_rows and len(bas_dd) == 8 and bas_dd.isdigit() and bas_dd < current:
+        return None
+    return today_ttl
+
+
+class ResponseCache:
+    def __init__(self, root_dir: str | Path, *, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.root_dir = Path(root_dir)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._total_bytes = sum(item.stat().st_size for item in self.root_dir.glob("*/*.json"))
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "ResponseCache | None":
+        root_dir = os.getenv(f"{prefix}_CACHE_DIR")
+        if not root_dir:
+            return None
+        max_mb = float(os.getenv(f"{prefix}_CACHE_MAX_MB", "256"))
+        return cls(root_dir, max_bytes=int(max_mb * 1024 * 1024))
+
+    def _path(self, key: str) -> Path:
+        return self.root_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self._path(key)
+        with self._lock:
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self.stats.misses += 1
+                return None
+            expires_at = entry.get("expires_at")
+            if expires_at is not None and expires_at < time.time():
+                self._total_bytes -= path.stat().st_size
+                path.unlink(missing_ok=True)
+                self.stats.misses += 1
+                return None
+            # mtime doubles as the LRU clock.
+            os.utime(path)
+            self.stats.hits += 1
+            return entry["payload"]
+
+    def put(self, key: str, payload: dict, *, ttl_seconds: float | None) -> None:
+        path = self._path(key)
+        entry = {
+            "stored_at": time.time(),
+            "expires_at": None if ttl_seconds is None else time.time() + ttl_seconds,
+            "payload": payload,
+        }
+        encoded = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous_size = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(encoded)
+            tmp_path.replace(path)
+            self._total_bytes += len(encoded) - previous_size
+            self.stats.stores += 1
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(
+            ((item.stat(), item) for item in self.root_dir.glob("*/*.json")),
+            key=lambda entry: entry[0].st_mtime,
+        )
+        self._total_bytes = sum(stat.st_size for stat, _ in entries)
+        for stat, item in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            item.unlink(missing_ok=True)
+            self._total_bytes -= stat.st_size
+            self.stats.evictions += 1
+
+    def metrics(self) -> dict[str, float | int]:
+        with self._lock:
+            return {**asdict(self.stats), "hit_ratio": round(self.stats.hit_ratio, 4)}
@@ -0,0 +1,89 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from functools import partial
+from http.cookiejar import CookieJar
+from typing import Any
+
+from app.connectors.http_client import HttpClient, shared_executor
+
+
+@dataclass(slots=True)
+class SessionStats:
+    primes: int = 0
+    reuses: int = 0
+    reprimes: int = 0
+
+
+def _cookie_expiry(cookie_jar: Any, fallback: float) -> float:
+    # Session cookies carry no expiry; the TTL bounds them. Persistent ones may expire sooner.
+    expiries = [cookie.expires for cookie in cookie_jar if cookie.expires] if isinstance(cookie_jar, CookieJar) else []
+    return min([fallback, *expiries])
+
+
+class SessionManager:
+    # Priming state is tracked per cookie jar, so connectors sharing a client share one primed session.
+    def __init__(self, ttl_seconds: float = 600.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.stats = SessionStats()
+        self._expires_at: weakref.WeakKeyDictionary[Any, float] = weakref.WeakKeyDictionary()
+        # Set when the in-progress prime of a key finishes; the prime itself runs outside _lock.
+        self._priming: weakref.WeakKeyDictionary[Any, threading.Event] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._default_client: HttpClient | None = None
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "SessionManager":
+        return cls(ttl_seconds=float(os.getenv(f"{prefix}_SESSION_TTL", "600")))
+
+    def default_client(self) -> HttpClient:
+        with self._lock:
+            if self._default_client is None:
+                self._default_client = HttpClient()
+            return self._default_client
+
+    @staticmethod
+    def _key(http_client: Any) -> Any:
+        return getattr(http_client, "cookie_jar", http_client)
+
+    def ensure_primed(self, http_client: Any, prime: Callable[[], object]) -> None:
+        key = self._key(http_client)
+        while True:
+            with self._lock:
+                # Wall clock, because cookie expiry timestamps are epoch seconds.
+                if self._expires_at.get(key, 0.0) > time.time():
+                    self.stats.reuses += 1
+                    return
+                event = self._priming.get(key)
+                if event is None:
+                    event = self._priming[key] = threading.Event()
+                    break
+            # Another caller is priming this key; re-check once it is done, and take over if it failed.
+            event.wait()
+        try:
+            prime()
+            with self._lock:
+                self._expires_at[key] = _cookie_expiry(key, time.time() + self.ttl_seconds)
+                self.stats.primes += 1
+        finally:
+            with self._lock:
+                self._priming.pop(key, None)
+            event.set()
+
+    async def ensure_primed_async(self, http_client: Any, prime: Callable[[], object]) -> None:
+        # Runs on the connector worker pool so concurrent callers wait on the same priming event and prime once.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(shared_executor(), partial(self.ensure_primed, http_client, prime))
+
+    def invalidate(self, http_client: Any) -> None:
+        with self._lock:
+            self._expires_at.pop(self._key(http_client), None)
+            self.stats.reprimes += 1
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return asdict(self.stats)
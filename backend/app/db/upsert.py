@@ -0,0 +1,88 @@
+from collections.abc import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+
+_UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def insert_ignore(session: Session, model: type[Base], row: dict, *, index_elements: Sequence[str]) -> bool:
+    # Returns whether the row was inserted; a concurrent writer that got there first is not an error.
+    insert_fn = _UPSERT_DIALECTS.get(session.get_bind().dialect.name)
+    if insert_fn is None:
+        session.merge(model(**row))
+        return True
+    statement = insert_fn(model.__table__).on_conflict_do_nothing(index_elements=list(index_elements))
+    return session.execute(statement, row).rowcount == 1
+
+
+def _select_then_update(
+    session: Session,
+    model: type[Base],
+    rows: list[dict],
+    *,
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+    increment_columns: Sequence[str],
+    coalesce_columns: Sequence[str],
+) -> int:
+    # Dialects without INSERT ... ON CONFLICT: same column semantics, one lookup per row, not safe against a
+    # concurrent writer inserting the same key.
+    for row in rows:
+        existing = session.execute(
+            select(model).filter_by(**{column: row[column] for column in index_elements})
+        ).scalar_one_or_none()
+        if existing is None:
+            session.add(model(**row))
+            continue
+        for column in update_columns:
+            setattr(existing, column, row[column])
+        for column in increment_columns:
+            setattr(existing, column, getattr(existing, column) + row[column])
+        for column in coalesce_columns:
+            if row.get(column) is not None:
+                setattr(existing, column, row[column])
+    session.flush()
+    return len(rows)
+
+
+def bulk_upsert(
+    session: Session,
+    model: type[Base],
+    rows: list[dict],
+    *,
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+    increment_columns: Sequence[str] = (),
+    coalesce_columns: Sequence[str] = (),
+) -> int:
+    # increment_columns are counters: on conflict the incoming value is added to the stored one.
+    # coalesce_columns keep the stored value when the incoming one is NULL.
+    if not rows:
+        return 0
+    insert_fn = _UPSERT_DIALECTS.get(session.get_bind().dialect.name)
+    if insert_fn is None:
+        return _select_then_update(
+            session,
+            model,
+            rows,
+            index_elements=index_elements,
+            update_columns=update_columns,
+            increment_columns=increment_columns,
+            coalesce_columns=coalesce_columns,
+        )
+
+    # One statement executed for every row: compiled once and cached, where a multi-row VALUES is recompiled per call.
+    table = model.__table__
+    statement = insert_fn(table)
+    set_ = {column: getattr(statement.excluded, column) for column in update_columns}
+    set_.update({column: table.c[column] + getattr(statement.excluded, column) for column in increment_columns})
+    set_.update(
+        {column: func.coalesce(getattr(statement.excluded, column), table.c[column]) for column in coalesce_columns}
+    )
+    statement = statement.on_conflict_do_update(index_elements=list(index_elements), set_=set_)
+    session.execute(statement, rows)
+    return len(rows)
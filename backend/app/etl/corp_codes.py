@@ -0,0 +1,57 @@
+import io
+import zipfile
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+from xml.etree.ElementTree import iterparse
+
+CORP_CODE_FIELDS = ("corp_code", "corp_name", "corp_eng_name", "stock_code", "modify_date")
+
+
+def _parse_modify_date(value: str | None) -> date | None:
+    if not value or len(value) != 8 or not value.isdigit():
+        return None
+    return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+
+
+def _clean(value: str | None) -> str | None:
+    cleaned = (value or "").strip()
+    return cleaned or None
+
+
+def _open_xml_member(archive: zipfile.ZipFile):
+    names = [name for name in archive.namelist() if name.lower().endswith(".xml")]
+    if not names:
+        raise ValueError("corpCode archive has no XML member")
+    return archive.open(names[0])
+
+
+def iter_corp_code_batches(source: bytes | str | Path, *, batch_size: int = 500) -> Iterator[list[dict]]:
+    # Decompress and parse in one pass; each <list> element is dropped once read so memory stays flat.
+    archive_source = io.BytesIO(source) if isinstance(source, bytes) else source
+    batch: list[dict] = []
+    with zipfile.ZipFile(archive_source) as archive, _open_xml_member(archive) as stream:
+        context = iterparse(stream, events=("start", "end"))
+        _, root = next(context)
+        for event, element in context:
+            if event != "end" or element.tag != "list":
+                continue
+            values = {field: element.findtext(field) for field in CORP_CODE_FIELDS}
+            root.clear()
+            corp_code = _clean(values["corp_code"])
+            if corp_code is None:
+                continue
+            batch.append(
+                {
+                    "corp_code": corp_code,
+                    "corp_name": _clean(values["corp_name"]) or "",
+                    "eng_name": _clean(values["corp_eng_name"]),
+                    "stock_code": _clean(values["stock_code"]),
+                    "modify_date": _parse_modify_date(_clean(values["modify_date"])),
+                }
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
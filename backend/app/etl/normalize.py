@@ -1,3 +1,11 @@
+import hashlib
+import re
+import unicodedata
+from datetime import date
+
+_CORP_NAME_NOISE = re.compile(r"\(주\)|주식회사|\s+")
+
+
 def normalize_kind_rows(rows: list[dict]) -> list[dict]:
     normalized: list[dict] = []
     for row in rows:
@@ -26,3 +34,16 @@ def normalize_dart_disclosures(rows: list[dict]) -> list[dict]:
             }
         )
     return normalized
+
+
+def normalize_corp_name(corp_name: str) -> str:
+    # NFKC folds ㈜ and full-width forms, so "㈜알파 테크" and "(주)알파테크" normalize alike.
+    return _CORP_NAME_NOISE.sub("", unicodedata.normalize("NFKC", corp_name or "")).casefold()
+
+
+def pipeline_item_id(corp_name: str, listing_date: date | None) -> str:
+    # One id per company per listing cycle, independent of where KIND lists the row. corp_code is left out on
+    # purpose: it is only known when DART matched in the same batch, so the id would flip between refreshes.
+    identity = f"name:{normalize_corp_name(corp_name)}"
+    cycle = str(listing_date.year) if listing_date else "pending"
+    return "ipo-" + hashlib.sha256(f"{identity}|{cycle}".encode("utf-8")).hexdigest()[:24]
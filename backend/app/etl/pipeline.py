@@ -1,21 +1,64 @@
-﻿from dataclasses import dataclass
+﻿import logging
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from datetime import date
 
-from sqlalchemy import delete
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
-from app.etl.normalize import normalize_dart_disclosures, normalize_kind_rows
+from app.db.upsert import bulk_upsert
+from app.etl.normalize import normalize_corp_name, normalize_dart_disclosures, normalize_kind_rows, pipeline_item_id
 from app.etl.reconcile import match_kind_with_dart
-from app.models.ipo import IpoPipelineItem
-from app.quality.gate import run_quality_gate
+from app.models.ipo import IpoPipelineAlias, IpoPipelineItem
+from app.quality.gate import find_first_fail, run_quality_gate
 from app.quality.types import QualityIssue
-from app.services.quality_log_service import save_publish_log, save_quality_issues
+from app.services.disclosure_service import upsert_dart_disclosures
+from app.services.pipeline_snapshot_service import (
+    current_snapshot_version,
+    pipeline_item_order,
+    pipeline_item_payload,
+    publish_pipeline_snapshot,
+)
+from app.services.quality_log_service import defer_quality_logging, save_publish_log, save_quality_issues
+
+logger = logging.getLogger(__name__)
+
+_PUBLISH_CHUNK_SIZE = 500
+_PUBLISHED_COLUMNS = (
+    'pipeline_id',
+    'corp_name',
+    'corp_code',
+    'expected_stock_code',
+    'stage',
+    'key_dates',
+    'offer_price',
+    'offer_amount',
+    'lead_manager',
+    'source_kind_row_id',
+    'source_dart_rcept_no',
+    'listing_date',
+)
 
 
 @dataclass(slots=True)
 class PipelineRunResult:
     published: bool
     issues: list[QualityIssue]
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    # Merged rows dropped because an earlier row already had the same company and listing year.
+    duplicates: int = 0
+    snapshot_version: int | None = None
+    gate_timings: dict[str, float] = field(default_factory=dict)
+    # Rows whose issues the gate result cache supplied instead of the rules.
+    gate_reused_rows: int = 0
+    # Set in fail-fast mode: full evaluation and issue logging still running; resolves to the issue count.
+    issue_logging: Future | None = None
+    # Fail-fast mode only: the FAIL that blocked publishing. issues stays empty until issue_logging resolves.
+    decision_issue: QualityIssue | None = None
 
 
 def _parse_date(value: str | None) -> date | None:
@@ -27,17 +70,124 @@ def _parse_date(value: str | None) -> date | None:
     return date(int(cleaned[0:4]), int(cleaned[4:6]), int(cleaned[6:8]))
 
 
-def run_pipeline(session: Session, fixture_bundle: dict) -> PipelineRunResult:
+def _build_pipeline_rows(merged: list[dict]) -> tuple[dict[str, dict], int]:
+    # The id is company plus listing year, so a second row for the same pair would silently replace the first.
+    # KIND lists newest first; the first row is kept and the rest are logged and counted.
+    rows: dict[str, dict] = {}
+    duplicates = 0
+    for row in merged:
+        listing_date = _parse_date(row.get('listing_date'))
+        pipeline_id = pipeline_item_id(row['corp_name'], listing_date)
+        if pipeline_id in rows:
+            duplicates += 1
+            logger.warning(
+                'dropping duplicate pipeline row %s (%s, listing_date=%s); kept %s',
+                pipeline_id,
+                row['corp_name'],
+                row.get('listing_date'),
+                rows[pipeline_id]['corp_name'],
+            )
+            continue
+        rows[pipeline_id] = {
+            'pipeline_id': pipeline_id,
+            'corp_name': row['corp_name'],
+            'corp_code': row.get('corp_code'),
+            'expected_stock_code': None,
+            'stage': row.get('stage') or 'offering',
+            'key_dates': {'listing_date': row.get('listing_date')},
+            'offer_price': None,
+            'offer_amount': None,
+            'lead_manager': row.get('lead_manager'),
+            'source_kind_row_id': f"{row['corp_name']}|{row.get('listing_date') or ''}"[:64],
+            'source_dart_rcept_no': row.get('source_dart_rcept_no'),
+            'listing_date': listing_date,
+        }
+    return rows, duplicates
+
+
+def _record_aliases(session: Session, aliases: dict[str, str], new_ids: list[str]) -> None:
+    # A row whose id changed (listing moved to another year) keeps resolving by its old id.
+    for old_id, new_id in aliases.items():
+        session.execute(
+            update(IpoPipelineAlias).where(IpoPipelineAlias.pipeline_id == old_id).values(pipeline_id=new_id)
+        )
+    if new_ids:
+        session.execute(delete(IpoPipelineAlias).where(IpoPipelineAlias.alias_id.in_(new_ids)))
+    bulk_upsert(
+        session,
+        IpoPipelineAlias,
+        [{'alias_id': old_id, 'pipeline_id': new_id} for old_id, new_id in aliases.items()],
+        index_elements=['alias_id'],
+        update_columns=['pipeline_id'],
+    )
+
+
+def _publish_pipeline_rows(session: Session, desired: dict[str, dict]) -> tuple[int, int, int, int]:
+    # Diff against the published table so unchanged rows are never rewritten and readers never see it empty.
+    columns = [getattr(IpoPipelineItem, name) for name in _PUBLISHED_COLUMNS]
+    current = {row['pipeline_id']: dict(row) for row in session.execute(select(*columns)).mappings()}
+    inserts = [row for pipeline_id, row in desired.items() if pipeline_id not in current]
+    updates = [row for pipeline_id, row in desired.items() if pipeline_id in current and current[pipeline_id] != row]
+    deletes = [pipeline_id for pipeline_id in current if pipeline_id not in desired]
+
+    for start in range(0, len(inserts), _PUBLISH_CHUNK_SIZE):
+        session.execute(insert(IpoPipelineItem), inserts[start : start + _PUBLISH_CHUNK_SIZE])
+    for start in range(0, len(updates), _PUBLISH_CHUNK_SIZE):
+        session.execute(update(IpoPipelineItem), updates[start : start + _PUBLISH_CHUNK_SIZE])
+    for start in range(0, len(deletes), _PUBLISH_CHUNK_SIZE):
+        session.execute(
+            delete(IpoPipelineItem).where(IpoPipelineItem.pipeline_id.in_(deletes[start : start + _PUBLISH_CHUNK_SIZE]))
+        )
+    inserted_by_name = {normalize_corp_name(row['corp_name']): row['pipeline_id'] for row in inserts}
+    aliases = {
+        pipeline_id: inserted_by_name[name]
+        for pipeline_id in deletes
+        if (name := normalize_corp_name(current[pipeline_id]['corp_name'])) in inserted_by_name
+    }
+    if inserts:
+        _record_aliases(session, aliases, [row['pipeline_id'] for row in inserts])
+    unchanged = len(desired) - len(inserts) - len(updates)
+    return len(inserts), len(updates), len(deletes), unchanged
+
+
+def _defer_issue_logging(
+    session: Session, kind_rows: list[dict], dart_rows: list[dict], krx_rows: list[dict], batch_id: str | None
+) -> Future:
+    # get_bind() is a Connection when the session is bound to one; the worker needs the Engine to open its own.
+    return defer_quality_logging(
+        session.get_bind().engine,
+        lambda: run_quality_gate(kind_rows=kind_rows, dart_rows=dart_rows, krx_rows=krx_rows).issues,
+        batch_id=batch_id,
+    )
+
+
+def run_pipeline(session: Session, fixture_bundle: dict, *, fail_fast: bool = False) -> PipelineRunResult:
     batch_id = fixture_bundle.get('batch_id')
     kind_rows = normalize_kind_rows(fixture_bundle.get('kind_rows', []))
     dart_rows = normalize_dart_disclosures(fixture_bundle.get('dart_rows', []))
     krx_rows = fixture_bundle.get('krx_rows', [])
     merged = match_kind_with_dart(kind_rows, dart_rows)
+    # Disclosures are source history, kept whether or not this batch passes the gate.
+    upsert_dart_disclosures(session, fixture_bundle.get('dart_rows', []))
 
-    gate_result = run_quality_gate(kind_rows=kind_rows, dart_rows=dart_rows, krx_rows=krx_rows)
-    save_quality_issues(session, gate_result.issues, batch_id=batch_id)
+    if fail_fast:
+        # Decide on FAIL rules alone; every issue is evaluated and logged after commit, off this thread.
+        started = time.perf_counter()
+        decision_issue = find_first_fail(kind_rows=kind_rows, dart_rows=dart_rows, krx_rows=krx_rows)
+        issues = []
+        failed = decision_issue is not None
+        gate_timings = {'decision': time.perf_counter() - started}
+        gate_reused_rows = 0
+    else:
+        gate_result = run_quality_gate(kind_rows=kind_rows, dart_rows=dart_rows, krx_rows=krx_rows)
+        decision_issue = None
+        save_quality_issues(session, gate_result.issues, batch_id=batch_id)
+        issues = gate_result.issues
+        failed = gate_result.has_fail
+        gate_timings = gate_result.timings
+        gate_reused_rows = gate_result.reused_rows
 
-    if gate_result.has_fail:
+    if failed:
         save_publish_log(
             session,
             snapshot_type='ipo_pipeline',
@@ -47,28 +197,26 @@ def run_pipeline(session: Session, fixture_bundle: dict) -> PipelineRunResult:
             batch_id=batch_id,
         )
         session.commit()
-        return PipelineRunResult(published=False, issues=gate_result.issues)
-
-    # Publish path replaces previous snapshot rows with current merged set.
-    session.execute(delete(IpoPipelineItem))
-
-    for idx, row in enumerate(merged, start=1):
-        pipeline_id = f"{row['corp_name']}-{idx}"
-        item = IpoPipelineItem(
-            pipeline_id=pipeline_id,
-            corp_name=row['corp_name'],
-            corp_code=row.get('corp_code'),
-            expected_stock_code=None,
-            stage=row.get('stage') or 'offering',
-            key_dates={'listing_date': row.get('listing_date')},
-            offer_price=None,
-            offer_amount=None,
-            lead_manager=row.get('lead_manager'),
-            source_kind_row_id=str(idx),
-            source_dart_rcept_no=row.get('source_dart_rcept_no'),
-            listing_date=_parse_date(row.get('listing_date')),
+        return PipelineRunResult(
+            published=False,
+            issues=issues,
+            gate_timings=gate_timings,
+            gate_reused_rows=gate_reused_rows,
+            issue_logging=(
+                _defer_issue_logging(session, kind_rows, dart_rows, krx_rows, batch_id) if fail_fast else None
+            ),
+            decision_issue=decision_issue,
+        )
+
+    desired, duplicates = _build_pipeline_rows(merged)
+    inserted, updated, deleted, unchanged = _publish_pipeline_rows(session, desired)
+    snapshot_version = current_snapshot_version(session)
+    if snapshot_version is None or inserted or updated or deleted:
+        snapshot_version = publish_pipeline_snapshot(
+            session,
+            [pipeline_item_payload(row) for row in sorted(desired.values(), key=pipeline_item_order)],
+            batch_id=batch_id,
         )
-        session.merge(item)
 
     save_publish_log(
         session,
@@ -79,4 +227,17 @@ def run_pipeline(session: Session, fixture_bundle: dict) -> PipelineRunResult:
         batch_id=batch_id,
     )
     session.commit()
-    return PipelineRunResult(published=True, issues=gate_result.issues)
+    return PipelineRunResult(
+        published=True,
+        issues=issues,
+        inserted=inserted,
+        updated=updated,
+        deleted=deleted,
+        unchanged=unchanged,
+        duplicates=duplicates,
+        snapshot_version=snapshot_version,
+        gate_timings=gate_timings,
+        gate_reused_rows=gate_reused_rows,
+        issue_logging=_defer_issue_logging(session, kind_rows, dart_rows, krx_rows, batch_id) if fail_fast else None,
+        decision_issue=decision_issue,
+    )
@@ -1,4 +1,21 @@
+import gzip
+import hashlib
 import json
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.upsert import insert_ignore
+from app.models.snapshot import RawPayloadBlob, RawPayloadLog
+
+try:
+    import zstandard  # type: ignore
+except ModuleNotFoundError:
+    zstandard = None
 
 
 def save_raw_payload(source: str, endpoint: str, payload: dict) -> dict:
@@ -7,3 +24,159 @@ def save_raw_payload(source: str, endpoint: str, payload: dict) -> dict:
         "endpoint": endpoint,
         "payload": json.dumps(payload, ensure_ascii=False),
     }
+
+
+def canonical_payload_bytes(payload: object) -> bytes:
+    # Key order must not change the hash, or identical responses would never dedup.
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def compress_payload(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd codec requires the zstandard package")
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    raise ValueError(f"unknown raw archive codec: {codec}")
+
+
+def decompress_payload(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd codec requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "gzip":
+        return gzip.decompress(data)
+    raise ValueError(f"unknown raw archive codec: {codec}")
+
+
+@dataclass(slots=True)
+class RawArchiveStats:
+    payloads: int = 0
+    new_blobs: int = 0
+    deduped: int = 0
+    raw_bytes: int = 0
+    stored_bytes: int = 0
+
+
+@dataclass(slots=True)
+class ArchivedPayload:
+    source: str
+    endpoint: str
+    request_key: str | None
+    payload: object
+
+
+class RawPayloadArchive:
+    def __init__(self, session: Session, *, codec: str | None = None, file_root: str | Path | None = None) -> None:
+        self.session = session
+        self.codec = codec or default_codec()
+        self.file_root = Path(file_root) if file_root else None
+        self.stats = RawArchiveStats()
+        self._known_hashes: set[str] = set()
+
+    @classmethod
+    def from_env(cls, session: Session) -> "RawPayloadArchive":
+        return cls(session, codec=os.getenv("RAW_ARCHIVE_CODEC") or None, file_root=os.getenv("RAW_ARCHIVE_DIR") or None)
+
+    def _blob_path(self, content_hash: str, codec: str) -> Path:
+        if self.file_root is None:
+            raise RuntimeError(f"raw payload {content_hash} is stored on disk but RAW_ARCHIVE_DIR is not set")
+        return self.file_root / content_hash[:2] / f"{content_hash}.{codec}"
+
+    def _blob_exists(self, content_hash: str) -> bool:
+        if content_hash in self._known_hashes:
+            return True
+        exists = self.session.get(RawPayloadBlob, content_hash) is not None
+        if exists:
+            self._known_hashes.add(content_hash)
+        return exists
+
+    def archive(
+        self,
+        *,
+        source: str,
+        endpoint: str,
+        payload: object,
+        request_key: str | None = None,
+        batch_id: str | None = None,
+    ) -> str:
+        raw = canonical_payload_bytes(payload)
+        content_hash = hashlib.sha256(raw).hexdigest()
+        self.stats.payloads += 1
+        self.stats.raw_bytes += len(raw)
+        if self._blob_exists(content_hash):
+            self.stats.deduped += 1
+        else:
+            stored = compress_payload(raw, self.codec)
+            data: bytes | None = stored
+            if self.file_root is not None:
+                # A per-writer temp name, so two refreshes storing the same hash never write into one temp file.
+                path = self._blob_path(content_hash, self.codec)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+                tmp_path.write_bytes(stored)
+                tmp_path.replace(path)
+                data = None
+            # Another refresh may have stored the same content since the existence check; that is still a dedup.
+            inserted = insert_ignore(
+                self.session,
+                RawPayloadBlob,
+                {
+                    "content_hash": content_hash,
+                    "codec": self.codec,
+                    "raw_size": len(raw),
+                    "stored_size": len(stored),
+                    "data": data,
+                },
+                index_elements=["content_hash"],
+            )
+            self._known_hashes.add(content_hash)
+            if inserted:
+                self.stats.new_blobs += 1
+                self.stats.stored_bytes += len(stored)
+            else:
+                self.stats.deduped += 1
+        self.session.add(
+            RawPayloadLog(
+                source=source,
+                endpoint=endpoint,
+                request_key=request_key,
+                batch_id=batch_id,
+                content_hash=content_hash,
+            )
+        )
+        return content_hash
+
+    def load(self, content_hash: str) -> object:
+        blob = self.session.get(RawPayloadBlob, content_hash)
+        if blob is None:
+            raise KeyError(f"raw payload not found: {content_hash}")
+        stored = blob.data if blob.data is not None else self._blob_path(content_hash, blob.codec).read_bytes()
+        return json.loads(decompress_payload(stored, blob.codec))
+
+    def replay_batch(self, batch_id: str) -> list[ArchivedPayload]:
+        rows = (
+            self.session.execute(
+                select(RawPayloadLog).where(RawPayloadLog.batch_id == batch_id).order_by(RawPayloadLog.id.asc())
+            )
+            .scalars()
+            .all()
+        )
+        return [
+            ArchivedPayload(
+                source=row.source,
+                endpoint=row.endpoint,
+                request_key=row.request_key,
+                payload=self.load(row.content_hash) if row.content_hash else json.loads(row.payload or "null"),
+            )
+            for row in rows
+        ]
+
+    def metrics(self) -> dict[str, int]:
+        return asdict(self.stats)
@@ -0,0 +1,140 @@
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.etl.pipeline import run_pipeline
+from app.etl.raw_ingest import RawPayloadArchive
+from app.models.snapshot import RawPayloadLog
+
+BUNDLE_SOURCE = "PIPELINE"
+BUNDLE_ENDPOINT = "fixture_bundle"
+
+
+@dataclass(slots=True)
+class ReplayResult:
+    batch_id: str
+    published: bool
+    issue_count: int
+    issues_by_rule: dict[str, int] = field(default_factory=dict)
+    # Set instead of a run when the batch could not be loaded, e.g. no captured bundle or a missing blob.
+    error: str | None = None
+
+
+def capture_bundle(archive: RawPayloadArchive, bundle: dict) -> str:
+    # The manifest holds hashes only, so a bundle whose parts did not change adds no new blobs.
+    batch_id = bundle["batch_id"]
+    manifest = {
+        "batch_id": batch_id,
+        "kind_rows": archive.archive(
+            source="KIND", endpoint="pubofrprogcom_sub", payload=bundle.get("kind_rows", []), batch_id=batch_id
+        ),
+        "dart_rows": archive.archive(
+            source="DART", endpoint="list.json", payload=bundle.get("dart_rows", []), batch_id=batch_id
+        ),
+        "krx_rows": [
+            {
+                "dataset_key": row["dataset_key"],
+                "required_params": row.get("required_params"),
+                "request_params": row.get("request_params"),
+                "response": archive.archive(
+                    source="KRX",
+                    endpoint=row["dataset_key"],
+                    payload=row["response"],
+                    request_key=f"{row['dataset_key']}:{row.get('request_params', {}).get('basDd', '')}",
+                    batch_id=batch_id,
+                ),
+            }
+            for row in bundle.get("krx_rows", [])
+        ],
+    }
+    return archive.archive(source=BUNDLE_SOURCE, endpoint=BUNDLE_ENDPOINT, payload=manifest, batch_id=batch_id)
+
+
+def capture_bundle_safely(session: Session, bundle: dict) -> dict:
+    # Capturing must never block publishing; failures are reported alongside the run instead.
+    try:
+        archive = RawPayloadArchive.from_env(session)
+        with session.begin_nested():
+            capture_bundle(archive, bundle)
+        return archive.metrics()
+    except Exception as exc:  # pragma: no cover - runtime diagnostics
+        return {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def load_bundle(archive: RawPayloadArchive, batch_id: str) -> dict:
+    manifest_hash = archive.session.execute(
+        select(RawPayloadLog.content_hash)
+        .where(
+            RawPayloadLog.batch_id == batch_id,
+            RawPayloadLog.source == BUNDLE_SOURCE,
+            RawPayloadLog.endpoint == BUNDLE_ENDPOINT,
+        )
+        .order_by(RawPayloadLog.id.desc())
+        .limit(1)
+    ).scalar_one_or_none()
+    if manifest_hash is None:
+        raise KeyError(f"no captured bundle for batch: {batch_id}")
+    manifest = archive.load(manifest_hash)
+    return {
+        "batch_id": manifest["batch_id"],
+        "kind_rows": archive.load(manifest["kind_rows"]),
+        "dart_rows": archive.load(manifest["dart_rows"]),
+        "krx_rows": [{**row, "response": archive.load(row["response"])} for row in manifest["krx_rows"]],
+    }
+
+
+def _local_day_bound_utc(day: date, at: time) -> datetime:
+    # created_at is the database's now(), stored as naive UTC, so local day bounds are converted before comparing.
+    return datetime.combine(day, at).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def list_captured_batches(session: Session, start: date, end: date) -> list[str]:
+    rows = session.execute(
+        select(RawPayloadLog.batch_id)
+        .where(
+            RawPayloadLog.source == BUNDLE_SOURCE,
+            RawPayloadLog.endpoint == BUNDLE_ENDPOINT,
+            RawPayloadLog.created_at >= _local_day_bound_utc(start, time.min),
+            RawPayloadLog.created_at <= _local_day_bound_utc(end, time.max),
+        )
+        .order_by(RawPayloadLog.id.asc())
+    ).scalars()
+    return list(dict.fromkeys(batch_id for batch_id in rows if batch_id))
+
+
+def replay_bundle(bundle: dict) -> ReplayResult:
+    # Each replay publishes into its own throwaway in-memory database, never the one the bundle was read from, so
+    # a result does not depend on which other bundles were replayed before it.
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as scratch:
+        run = run_pipeline(scratch, bundle)
+    engine.dispose()
+    return ReplayResult(
+        batch_id=bundle.get("batch_id") or "unknown",
+        published=run.published,
+        issue_count=len(run.issues),
+        issues_by_rule=dict(Counter(issue.rule_code for issue in run.issues)),
+    )
+
+
+def replay_bundles(bundles: Iterable[dict]) -> list[ReplayResult]:
+    return [replay_bundle(bundle) for bundle in bundles]
+
+
+def replay_batches(archive: RawPayloadArchive, batch_ids: Iterable[str]) -> list[ReplayResult]:
+    # A batch that cannot be loaded is reported on its own result; the rest still replay.
+    results: list[ReplayResult] = []
+    for batch_id in batch_ids:
+        try:
+            bundle = load_bundle(archive, batch_id)
+        except KeyError as exc:
+            results.append(ReplayResult(batch_id=batch_id, published=False, issue_count=0, error=str(exc.args[0])))
+            continue
+        results.append(replay_bundle(bundle))
+    return results
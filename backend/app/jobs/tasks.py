@@ -2,6 +2,8 @@ from collections.abc import Callable
 
 from sqlalchemy.orm import Session
 
+from app.connectors.dart_connector import DartConnector
+from app.services.corp_master_service import refresh_corp_master
 from app.services.quality_summary_service import aggregate_quality_daily
 
 
@@ -20,3 +22,7 @@ def enqueue_refresh_for_disclosure(
 
 def run_quality_summary_job(session: Session, summary_date: str) -> int:
     return aggregate_quality_daily(session, summary_date)
+
+
+def run_corp_master_refresh_job(session: Session, connector: DartConnector) -> dict:
+    return refresh_corp_master(session, connector).as_dict()
@@ -1,19 +1,37 @@
 from app.models.corp import CorpMaster, CorpProfile
 from app.models.disclosure import DartDisclosure
-from app.models.ipo import IpoPipelineItem
-from app.models.quality import DataQualityIssue, DataQualitySummaryDaily, SnapshotPublishLog
-from app.models.snapshot import CompanySnapshot, DatasetRegistry, IpoPipelineSnapshot, RawPayloadLog
+from app.models.ipo import IpoPipelineAlias, IpoPipelineItem
+from app.models.quality import (
+    DataQualityIssue,
+    DataQualityIssueAggregate,
+    DataQualityIssueOccurrence,
+    DataQualitySummaryDaily,
+    SnapshotPublishLog,
+)
+from app.models.snapshot import (
+    CompanySnapshot,
+    DatasetRegistry,
+    IpoPipelineSnapshot,
+    IpoPipelineSnapshotPointer,
+    RawPayloadBlob,
+    RawPayloadLog,
+)
 
 __all__ = [
     "CompanySnapshot",
     "CorpMaster",
     "CorpProfile",
     "DataQualityIssue",
+    "DataQualityIssueAggregate",
+    "DataQualityIssueOccurrence",
     "DataQualitySummaryDaily",
     "DatasetRegistry",
     "DartDisclosure",
+    "IpoPipelineAlias",
     "IpoPipelineItem",
     "IpoPipelineSnapshot",
+    "IpoPipelineSnapshotPointer",
+    "RawPayloadBlob",
     "RawPayloadLog",
     "SnapshotPublishLog",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, Date, Numeric, String
+from sqlalchemy import JSON, Date, DateTime, Numeric, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -19,3 +19,11 @@ class IpoPipelineItem(Base):
     source_kind_row_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
     source_dart_rcept_no: Mapped[str | None] = mapped_column(String(20), nullable=True)
     listing_date: Mapped[Date | None] = mapped_column(Date, nullable=True)
+
+
+class IpoPipelineAlias(Base):
+    __tablename__ = "ipo_pipeline_alias"
+
+    alias_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    pipeline_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
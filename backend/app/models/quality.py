@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Date, DateTime, Float, Integer, String, Text, func
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -18,6 +18,43 @@ class DataQualityIssue(Base):
     observed_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
 
 
+class DataQualityIssueAggregate(Base):
+    # One row per recurring issue; each gate run bumps last_seen and occurrence_count instead of adding a row.
+    __tablename__ = "data_quality_issue_aggregate"
+    __table_args__ = (
+        UniqueConstraint("source", "rule_code", "entity_key", name="uq_data_quality_issue_aggregate_key"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    rule_code: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    severity: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+    entity_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    entity_key: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    last_batch_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    first_seen: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    last_seen: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now(), index=True)
+    occurrence_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+
+class DataQualityIssueOccurrence(Base):
+    # Occurrence log bucketed per aggregate, day and severity, so hourly repeats raise occurrence_count instead of
+    # adding rows. Severity is kept per bucket so a later rule change does not rewrite the counts of past days.
+    __tablename__ = "data_quality_issue_occurrence"
+    __table_args__ = (
+        UniqueConstraint("aggregate_id", "observed_date", "severity", name="uq_data_quality_issue_occurrence_day"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    aggregate_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    observed_date: Mapped[Date] = mapped_column(Date, nullable=False, index=True)
+    severity: Mapped[str] = mapped_column(String(10), nullable=False)
+    occurrence_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    last_batch_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    last_seen: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+
+
 class DataQualitySummaryDaily(Base):
     __tablename__ = "data_quality_summary_daily"
 
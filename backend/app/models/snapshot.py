@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, DateTime, String, Text, func
+from sqlalchemy import JSON, DateTime, Integer, LargeBinary, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -15,8 +15,19 @@ class CompanySnapshot(Base):
 class IpoPipelineSnapshot(Base):
     __tablename__ = "ipo_pipeline_snapshot"
 
-    snapshot_date: Mapped[str] = mapped_column(String(10), primary_key=True)
+    version: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    snapshot_date: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+    batch_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False)
     payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+
+
+class IpoPipelineSnapshotPointer(Base):
+    __tablename__ = "ipo_pipeline_snapshot_pointer"
+
+    name: Mapped[str] = mapped_column(String(30), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
 
 
@@ -38,5 +49,20 @@ class RawPayloadLog(Base):
     source: Mapped[str] = mapped_column(String(20), nullable=False)
     endpoint: Mapped[str] = mapped_column(String(255), nullable=False)
     request_key: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
-    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    # Legacy inline JSON; archived rows point at raw_payload_blob through content_hash instead.
+    payload: Mapped[str | None] = mapped_column(Text, nullable=True)
+    batch_id: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+
+
+class RawPayloadBlob(Base):
+    __tablename__ = "raw_payload_blob"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    codec: Mapped[str] = mapped_column(String(10), nullable=False)
+    raw_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    stored_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Null when the blob lives in the content-addressed file store.
+    data: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
@@ -1,6 +1,80 @@
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
 from app.quality.types import QualityGateResult, QualityIssue
 
 
+@dataclass(frozen=True, slots=True)
+class QualityRule:
+    rule_code: str
+    source: str
+    severity: str
+    title: str
+    description: str
+    operator_action: str
+    # Row fields (or derived fields) the check reads; the plan loads each of them once per row.
+    fields: tuple[str, ...] = ()
+    # Returns the issue message, or None when the row passes. Batch-level rules have no row check.
+    check: Callable[[dict], str | None] | None = None
+    # Row sources the check runs on; defaults to the rule's own source.
+    applies_to: tuple[str, ...] = ()
+    # Set to report issues under a fixed source/entity instead of the evaluated row's.
+    issue_source: str | None = None
+    entity_type: str | None = None
+    entity_key_field: str | None = None
+
+    @property
+    def targets(self) -> tuple[str, ...]:
+        return self.applies_to or (self.source,)
+
+    def issue(self, message: str, *, source: str, entity_type: str, entity_key: str) -> QualityIssue:
+        return QualityIssue(
+            source=self.issue_source or source,
+            rule_code=self.rule_code,
+            severity=self.severity,
+            entity_type=self.entity_type or entity_type,
+            entity_key=entity_key,
+            message=message,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedField:
+    name: str
+    requires: tuple[str, ...]
+    compute: Callable[[dict], object]
+
+
+class RulePlan:
+    # All rules for one source compiled into one pass: read the union of their fields, compute the
+    # derived fields they need, then run every check on the same values.
+    def __init__(self, source: str, rules: Iterable[QualityRule], derived: Iterable[DerivedField] = ()) -> None:
+        self.source = source
+        self.rules = tuple(rule for rule in rules if rule.check is not None and source in rule.targets)
+        needed = {field for rule in self.rules for field in rule.fields}
+        derived = tuple(derived)
+        for step in reversed(derived):
+            if step.name in needed:
+                needed.update(step.requires)
+        self.derived = tuple(step for step in derived if step.name in needed)
+        derived_names = {step.name for step in self.derived}
+        self.fields = tuple(sorted(needed - derived_names))
+
+    def evaluate(self, row: dict, *, source: str, entity_type: str, entity_key: str) -> list[QualityIssue]:
+        # Absent fields stay absent so checks keep dict.get(field, default) semantics.
+        values = {field: row[field] for field in self.fields if field in row}
+        for step in self.derived:
+            values[step.name] = step.compute(values)
+        issues: list[QualityIssue] = []
+        for rule in self.rules:
+            message = rule.check(values)
+            if message is None:
+                continue
+            key = row.get(rule.entity_key_field, "unknown") if rule.entity_key_field else entity_key
+            issues.append(rule.issue(message, source=source, entity_type=entity_type, entity_key=key))
+        return issues
+
+
 def run_rule_set(rule_fn, payload: dict, *, source: str, entity_type: str, entity_key: str) -> QualityGateResult:
     issues: list[QualityIssue] = rule_fn(payload, source=source, entity_type=entity_type, entity_key=entity_key)
     return QualityGateResult(issues=issues)
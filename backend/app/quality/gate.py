@@ -1,42 +1,181 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from app.quality.registry import RULESET_VERSION, fail_plan, rule_plan
 from app.quality.rules.cross_source import evaluate_cross_source
-from app.quality.rules.dart import evaluate_dart_rules
-from app.quality.rules.kind import evaluate_kind_rules
-from app.quality.rules.krx import evaluate_krx_rules
 from app.quality.types import QualityGateResult, QualityIssue
 
+# source -> (entity_type, row field used as entity_key). Order here is the issue order.
+_SOURCE_RULES = {
+    "DART": ("disclosure", "corp_code"),
+    "KIND": ("ipo", "corp_name"),
+    "KRX": ("dataset", "dataset_key"),
+}
+# A KRX row is a whole OutBlock_1 response, so each one is its own shard.
+_SHARD_ROWS = {"DART": 500, "KIND": 500, "KRX": 1}
+
+
+def row_fingerprint(source: str, row: dict) -> bytes:
+    # Pickle is several times cheaper than canonical JSON on large KRX blocks. Key order is part of the
+    # bytes, so a reordered row is only a cache miss, never a wrong hit.
+    return hashlib.blake2b(pickle.dumps((RULESET_VERSION, source, row), protocol=5), digest_size=16).digest()
+
+
+class GateResultCache:
+    # Per-row issues of earlier gate runs, least recently used evicted first.
+    def __init__(self, max_entries: int = 50_000) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, list[QualityIssue]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "GateResultCache":
+        return cls(max_entries=int(os.getenv("QUALITY_GATE_CACHE_SIZE", "50000")))
+
+    def get(self, fingerprint: bytes) -> list[QualityIssue] | None:
+        with self._lock:
+            issues = self._entries.get(fingerprint)
+            if issues is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(fingerprint)
+            self.hits += 1
+            return list(issues)
+
+    def put(self, fingerprint: bytes, issues: list[QualityIssue]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[fingerprint] = list(issues)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+gate_result_cache = GateResultCache.from_env()
+
+_gate_executor: ProcessPoolExecutor | None = None
+_gate_executor_workers = 0
+_gate_executor_lock = threading.Lock()
 
-def run_quality_gate(kind_rows: list[dict], dart_rows: list[dict], krx_rows: list[dict]) -> QualityGateResult:
-    issues: list[QualityIssue] = []
 
-    for row in dart_rows:
-        issues.extend(
-            evaluate_dart_rules(
-                row,
-                source="DART",
-                entity_type="disclosure",
-                entity_key=row.get("corp_code", "unknown"),
-            )
-        )
-
-    for row in kind_rows:
-        issues.extend(
-            evaluate_kind_rules(
-                row,
-                source="KIND",
-                entity_type="ipo",
-                entity_key=row.get("corp_name", "unknown"),
-            )
-        )
-
-    for row in krx_rows:
-        issues.extend(
-            evaluate_krx_rules(
-                row,
-                source="KRX",
-                entity_type="dataset",
-                entity_key=row.get("dataset_key", "unknown"),
-            )
-        )
+def gate_executor(workers: int) -> ProcessPoolExecutor:
+    # Worker processes are started once and reused; spawning per gate run would cost more than the rules.
+    global _gate_executor, _gate_executor_workers
+    with _gate_executor_lock:
+        if _gate_executor is None or _gate_executor_workers != workers:
+            if _gate_executor is not None:
+                _gate_executor.shutdown(wait=False)
+            _gate_executor = ProcessPoolExecutor(max_workers=workers)
+            _gate_executor_workers = workers
+        return _gate_executor
 
+
+def _evaluate_shard(source: str, rows: list[dict]) -> tuple[list[list[QualityIssue]], float]:
+    entity_type, key_field = _SOURCE_RULES[source]
+    plan = rule_plan(source)
+    started = time.perf_counter()
+    issues = [
+        plan.evaluate(row, source=source, entity_type=entity_type, entity_key=row.get(key_field, "unknown"))
+        for row in rows
+    ]
+    return issues, time.perf_counter() - started
+
+
+def _build_shards(rows_by_source: dict[str, list[dict]]) -> list[tuple[str, list[dict]]]:
+    shards: list[tuple[str, list[dict]]] = []
+    for source in _SOURCE_RULES:
+        rows = rows_by_source[source]
+        size = _SHARD_ROWS[source]
+        shards.extend((source, rows[start : start + size]) for start in range(0, len(rows), size))
+    return shards
+
+
+def run_quality_gate(
+    kind_rows: list[dict],
+    dart_rows: list[dict],
+    krx_rows: list[dict],
+    *,
+    workers: int | None = None,
+    cache: GateResultCache | None = None,
+) -> QualityGateResult:
+    started = time.perf_counter()
+    workers = workers if workers is not None else int(os.getenv("QUALITY_GATE_WORKERS", "1"))
+    cache = cache or gate_result_cache
+    # A disabled cache (QUALITY_GATE_CACHE_SIZE=0) never hits, so the rows are not fingerprinted at all.
+    use_cache = cache.max_entries > 0
+    rows_by_source = {"DART": dart_rows, "KIND": kind_rows, "KRX": krx_rows}
+
+    # Rows seen before with the same rule set reuse their issues; only the rest are evaluated.
+    fingerprints: dict[str, list[bytes | None]] = {}
+    cached: dict[str, list[list[QualityIssue] | None]] = {}
+    changed_rows: dict[str, list[dict]] = {}
+    for source, rows in rows_by_source.items():
+        if use_cache:
+            fingerprints[source] = [row_fingerprint(source, row) for row in rows]
+            cached[source] = [cache.get(fingerprint) for fingerprint in fingerprints[source]]
+        else:
+            fingerprints[source] = [None] * len(rows)
+            cached[source] = [None] * len(rows)
+        changed_rows[source] = [row for row, hit in zip(rows, cached[source]) if hit is None]
+    fingerprint_seconds = time.perf_counter() - started
+
+    shards = _build_shards(changed_rows)
+    if workers > 1 and len(shards) > 1:
+        sources, shard_rows = zip(*shards)
+        results = list(gate_executor(workers).map(_evaluate_shard, sources, shard_rows))
+    else:
+        results = [_evaluate_shard(source, rows) for source, rows in shards]
+
+    # map() keeps submission order, so evaluated rows come back in row order within each source.
+    evaluated: dict[str, list[list[QualityIssue]]] = {source: [] for source in _SOURCE_RULES}
+    timings = {source: 0.0 for source in _SOURCE_RULES}
+    for (source, _), (shard_issues, elapsed) in zip(shards, results):
+        evaluated[source].extend(shard_issues)
+        timings[source] += elapsed
+
+    issues: list[QualityIssue] = []
+    reused_rows = 0
+    for source in _SOURCE_RULES:
+        fresh = iter(evaluated[source])
+        for fingerprint, hit in zip(fingerprints[source], cached[source]):
+            if hit is None:
+                hit = next(fresh)
+                if fingerprint is not None:
+                    cache.put(fingerprint, hit)
+            else:
+                reused_rows += 1
+            issues.extend(hit)
+    timings["fingerprint"] = fingerprint_seconds
+
+    cross_started = time.perf_counter()
     issues.extend(evaluate_cross_source(kind_rows=kind_rows, dart_rows=dart_rows, krx_rows=krx_rows))
-    return QualityGateResult(issues=issues)
+    timings["CROSS"] = time.perf_counter() - cross_started
+    timings["total"] = time.perf_counter() - started
+    return QualityGateResult(issues=issues, timings=timings, reused_rows=reused_rows)
+
+
+def find_first_fail(kind_rows: list[dict], dart_rows: list[dict], krx_rows: list[dict]) -> QualityIssue | None:
+    # Publish decision only: stops at the first FAIL, in the same source order as the full gate.
+    rows_by_source = {"DART": dart_rows, "KIND": kind_rows, "KRX": krx_rows}
+    for source, (entity_type, key_field) in _SOURCE_RULES.items():
+        plan = fail_plan(source)
+        for row in rows_by_source[source]:
+            entity_key = row.get(key_field, "unknown")
+            for issue in plan.evaluate(row, source=source, entity_type=entity_type, entity_key=entity_key):
+                return issue
+    for issue in evaluate_cross_source(kind_rows=kind_rows, dart_rows=dart_rows, krx_rows=krx_rows):
+        if issue.severity == "FAIL":
+            return issue
+    return None
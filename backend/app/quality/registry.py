@@ -0,0 +1,33 @@
+import hashlib
+import inspect
+from functools import cache
+
+from app.quality.engine import RulePlan
+from app.quality.rules import common, cross_source, dart, kind, krx
+
+# Every rule, in catalog order. Within a source, the plan runs rules in this order too.
+RULE_REGISTRY = (*common.RULES, *dart.RULES, *kind.RULES, *krx.RULES, *cross_source.RULES)
+DERIVED_FIELDS = krx.DERIVED_FIELDS
+# Part of every cached gate result key. The rule modules' source is hashed along with the declarations, so
+# editing a check body or a helper it calls invalidates earlier results too.
+RULESET_VERSION = hashlib.blake2b(
+    repr(
+        [
+            (rule.rule_code, rule.severity, rule.fields, rule.targets, getattr(rule.check, "__qualname__", None))
+            for rule in RULE_REGISTRY
+        ]
+    ).encode("utf-8")
+    + "".join(inspect.getsource(module) for module in (common, cross_source, dart, kind, krx)).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+
+@cache
+def rule_plan(source: str) -> RulePlan:
+    return RulePlan(source, RULE_REGISTRY, DERIVED_FIELDS)
+
+
+@cache
+def fail_plan(source: str) -> RulePlan:
+    # Only FAIL rules decide publishing, so WARN-only work such as the KRX OutBlock_1 scan is skipped.
+    return RulePlan(source, [rule for rule in RULE_REGISTRY if rule.severity == "FAIL"], DERIVED_FIELDS)
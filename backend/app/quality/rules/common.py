@@ -1,7 +1,10 @@
 from datetime import datetime
 
+from app.quality.engine import QualityRule
 from app.quality.types import QualityIssue
 
+DART_REQUIRED_KEYS = ("corp_code", "rcept_no")
+
 
 def check_required_keys(payload: dict, required_keys: list[str]) -> list[QualityIssue]:
     missing = [key for key in required_keys if payload.get(key) in (None, "")]
@@ -41,3 +44,26 @@ def check_numeric(value: str | int | float | None, *, allow_negative: bool = Fal
     if not allow_negative and number < 0:
         return False
     return True
+
+
+def _check_dart_required_keys(values: dict) -> str | None:
+    missing = [key for key in DART_REQUIRED_KEYS if values.get(key) in (None, "")]
+    return f"missing required keys: {', '.join(missing)}" if missing else None
+
+
+RULES = (
+    QualityRule(
+        rule_code="COMMON_REQUIRED_KEYS",
+        source="COMMON",
+        severity="FAIL",
+        title="Required fields are missing",
+        description="A required field was empty or missing in the source payload.",
+        operator_action="Check source response payload and parser mapping for dropped keys.",
+        fields=DART_REQUIRED_KEYS,
+        check=_check_dart_required_keys,
+        applies_to=("DART",),
+        issue_source="COMMON",
+        entity_type="record",
+        entity_key_field="corp_code",
+    ),
+)
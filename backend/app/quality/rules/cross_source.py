@@ -1,5 +1,27 @@
+from app.quality.engine import QualityRule
 from app.quality.types import QualityIssue
 
+# Batch-level rules: declared here for the catalog, evaluated over whole row sets by evaluate_cross_source.
+LINKAGE_RATIO_RULE = QualityRule(
+    rule_code="CROSS_KIND_DART_LINKAGE_RATIO",
+    source="CROSS",
+    severity="WARN",
+    title="KIND-DART linkage ratio is low",
+    description="Name linkage ratio between KIND and DART rows is below threshold.",
+    operator_action="Review corp_name normalization and matching strategy.",
+    fields=("corp_name",),
+)
+POST_LISTING_KRX_RULE = QualityRule(
+    rule_code="CROSS_POST_LISTING_KRX_ATTACH",
+    source="CROSS",
+    severity="WARN",
+    title="Listed items without KRX attachment",
+    description="Listed KIND rows were found, but no KRX rows were attached.",
+    operator_action="Check KRX connectivity, permissions, and date parameters.",
+    fields=("stage",),
+)
+RULES = (LINKAGE_RATIO_RULE, POST_LISTING_KRX_RULE)
+
 
 def evaluate_cross_source(kind_rows: list[dict], dart_rows: list[dict], krx_rows: list[dict]) -> list[QualityIssue]:
     issues: list[QualityIssue] = []
@@ -12,26 +34,22 @@ def evaluate_cross_source(kind_rows: list[dict], dart_rows: list[dict], krx_rows
         ratio = len(linked) / len(kind_names)
         if ratio < 0.7:
             issues.append(
-                QualityIssue(
+                LINKAGE_RATIO_RULE.issue(
+                    f"kind-dart linkage ratio below threshold: {ratio:.2f}",
                     source="CROSS",
-                    rule_code="CROSS_KIND_DART_LINKAGE_RATIO",
-                    severity="WARN",
                     entity_type="batch",
                     entity_key="kind_dart",
-                    message=f"kind-dart linkage ratio below threshold: {ratio:.2f}",
                 )
             )
 
     listed_count = len([row for row in kind_rows if row.get("stage") in {"신규상장", "listed"}])
     if listed_count > 0 and len(krx_rows) == 0:
         issues.append(
-            QualityIssue(
+            POST_LISTING_KRX_RULE.issue(
+                "no KRX rows attached for listed items",
                 source="CROSS",
-                rule_code="CROSS_POST_LISTING_KRX_ATTACH",
-                severity="WARN",
                 entity_type="batch",
                 entity_key="kind_krx",
-                message="no KRX rows attached for listed items",
             )
         )
     return issues
@@ -1,32 +1,45 @@
 import re
 
-from app.quality.rules.common import check_required_keys
+from app.quality.engine import QualityRule, RulePlan
+from app.quality.rules import common
 from app.quality.types import QualityIssue
 
+_RCEPT_NO = re.compile(r"\d{14}")
+
+
+def _check_rcept_no_format(values: dict) -> str | None:
+    return None if _RCEPT_NO.fullmatch(str(values.get("rcept_no", ""))) else "rcept_no must be 14 digits"
+
+
+def _check_report_name(values: dict) -> str | None:
+    return None if values.get("report_nm") else "report_nm is empty"
+
+
+RULES = (
+    QualityRule(
+        rule_code="DART_RCEPT_NO_FORMAT",
+        source="DART",
+        severity="FAIL",
+        title="DART receipt number format error",
+        description="rcept_no should be a 14-digit identifier.",
+        operator_action="Verify DART API response and normalize invalid rcept_no values.",
+        fields=("rcept_no",),
+        check=_check_rcept_no_format,
+    ),
+    QualityRule(
+        rule_code="DART_REPORT_NAME_EMPTY",
+        source="DART",
+        severity="WARN",
+        title="DART report name is empty",
+        description="A filing row exists but report_nm is empty.",
+        operator_action="Review raw disclosure row and fallback report name mapping.",
+        fields=("report_nm",),
+        check=_check_report_name,
+    ),
+)
+
+_PLAN = RulePlan("DART", (*common.RULES, *RULES))
+
 
 def evaluate_dart_rules(payload: dict, *, source: str, entity_type: str, entity_key: str) -> list[QualityIssue]:
-    issues = check_required_keys(payload, ["corp_code", "rcept_no"])
-    rcept_no = str(payload.get("rcept_no", ""))
-    if not re.fullmatch(r"\d{14}", rcept_no):
-        issues.append(
-            QualityIssue(
-                source=source,
-                rule_code="DART_RCEPT_NO_FORMAT",
-                severity="FAIL",
-                entity_type=entity_type,
-                entity_key=entity_key,
-                message="rcept_no must be 14 digits",
-            )
-        )
-    if not payload.get("report_nm"):
-        issues.append(
-            QualityIssue(
-                source=source,
-                rule_code="DART_REPORT_NAME_EMPTY",
-                severity="WARN",
-                entity_type=entity_type,
-                entity_key=entity_key,
-                message="report_nm is empty",
-            )
-        )
-    return issues
+    return _PLAN.evaluate(payload, source=source, entity_type=entity_type, entity_key=entity_key)
@@ -1,34 +1,44 @@
+from app.quality.engine import QualityRule, RulePlan
 from app.quality.types import QualityIssue
 
 ALLOWED_STAGES = {"예비심사", "공모", "상장예정", "신규상장", "offering", "prelisting", "listed"}
+KEY_DATE_FIELDS = ("listing_date", "subscription_date", "demand_forecast_date")
+
+
+def _check_stage(values: dict) -> str | None:
+    stage = str(values.get("stage", "")).strip()
+    return None if stage in ALLOWED_STAGES else f"unsupported stage: {stage}"
+
+
+def _check_key_date(values: dict) -> str | None:
+    return None if any(values.get(key) for key in KEY_DATE_FIELDS) else "no key date found"
+
+
+RULES = (
+    QualityRule(
+        rule_code="KIND_STAGE_ALLOWED",
+        source="KIND",
+        severity="FAIL",
+        title="KIND stage is not supported",
+        description="stage value is outside the supported IPO stage set.",
+        operator_action="Update KIND stage mapping or parser if schema changed.",
+        fields=("stage",),
+        check=_check_stage,
+    ),
+    QualityRule(
+        rule_code="KIND_KEY_DATE_REQUIRED",
+        source="KIND",
+        severity="WARN",
+        title="KIND key date missing",
+        description="No listing/subscription/demand forecast date found for the row.",
+        operator_action="Validate date columns from KIND and parser column offsets.",
+        fields=KEY_DATE_FIELDS,
+        check=_check_key_date,
+    ),
+)
+
+_PLAN = RulePlan("KIND", RULES)
 
 
 def evaluate_kind_rules(payload: dict, *, source: str, entity_type: str, entity_key: str) -> list[QualityIssue]:
-    issues: list[QualityIssue] = []
-
-    stage = str(payload.get("stage", "")).strip()
-    if stage not in ALLOWED_STAGES:
-        issues.append(
-            QualityIssue(
-                source=source,
-                rule_code="KIND_STAGE_ALLOWED",
-                severity="FAIL",
-                entity_type=entity_type,
-                entity_key=entity_key,
-                message=f"unsupported stage: {stage}",
-            )
-        )
-
-    has_any_key_date = any(payload.get(key) for key in ("listing_date", "subscription_date", "demand_forecast_date"))
-    if not has_any_key_date:
-        issues.append(
-            QualityIssue(
-                source=source,
-                rule_code="KIND_KEY_DATE_REQUIRED",
-                severity="WARN",
-                entity_type=entity_type,
-                entity_key=entity_key,
-                message="no key date found",
-            )
-        )
-    return issues
+    return _PLAN.evaluate(payload, source=source, entity_type=entity_type, entity_key=entity_key)
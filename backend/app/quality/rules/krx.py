@@ -1,5 +1,12 @@
+import re
+
+from app.quality.engine import DerivedField, QualityRule, RulePlan
 from app.quality.types import QualityIssue
 
+_ABSENT = object()
+_PLAIN_NUMBER = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)")
+_NUMERIC_KEYS = ("TDD_CLSPRC", "CMPPREVDD_PRC", "FLUC_RT", "LIST_SHRS", "ACC_TRDVOL", "ACC_TRDVAL")
+
 
 def _is_placeholder(value: object) -> bool:
     if value is None:
@@ -24,112 +31,151 @@ def _is_numeric_like(value: object) -> bool:
     return cleaned.replace(".", "", 1).isdigit()
 
 
-def evaluate_krx_rules(payload: dict, *, source: str, entity_type: str, entity_key: str) -> list[QualityIssue]:
-    issues: list[QualityIssue] = []
-
-    required_params = payload.get("required_params", {})
-    request_params = payload.get("request_params", {})
-    missing_required = [key for key in required_params.keys() if key not in request_params and key != "trdDd"]
-    if missing_required:
-        issues.append(
-            QualityIssue(
-                source=source,
-                rule_code="KRX_REQUIRED_PARAMS",
-                severity="FAIL",
-                entity_type=entity_type,
-                entity_key=entity_key,
-                message=f"missing required params: {', '.join(missing_required)}",
-            )
-        )
-
-    response = payload.get("response", {})
-    out_block = response.get("OutBlock_1")
-    if out_block is None:
-        issues.append(
-            QualityIssue(
-                source=source,
-                rule_code="KRX_RESPONSE_SCHEMA",
-                severity="FAIL",
-                entity_type=entity_type,
-                entity_key=entity_key,
-                message="OutBlock_1 key missing",
-            )
-        )
-    elif isinstance(out_block, list) and len(out_block) == 0:
-        issues.append(
-            QualityIssue(
-                source=source,
-                rule_code="KRX_EMPTY_DATA",
-                severity="WARN",
-                entity_type=entity_type,
-                entity_key=entity_key,
-                message="OutBlock_1 is empty",
-            )
-        )
-    elif isinstance(out_block, list):
-        requested_bas_dd = str(request_params.get("basDd", "")).strip()
+def _is_invalid_numeric(value: object) -> bool:
+    return not _is_placeholder(value) and not _is_numeric_like(value)
+
+
+def _scan_out_block(out_block: list, requested_bas_dd: str) -> tuple[int, int, int]:
+    # One pass over the rows for all three row-level checks.
+    mismatch_count = 0
+    duplicate_count = 0
+    invalid_numeric_fields = 0
+    seen_isu_codes: set[str] = set()
+    for row in out_block:
+        if not isinstance(row, dict):
+            continue
         if requested_bas_dd:
-            mismatch_count = 0
-            for row in out_block:
-                if not isinstance(row, dict):
-                    continue
-                row_bas_dd = str(row.get("BAS_DD", "")).strip()
-                if row_bas_dd and row_bas_dd != requested_bas_dd:
-                    mismatch_count += 1
-            if mismatch_count > 0:
-                issues.append(
-                    QualityIssue(
-                        source=source,
-                        rule_code="KRX_BAS_DD_MISMATCH",
-                        severity="WARN",
-                        entity_type=entity_type,
-                        entity_key=entity_key,
-                        message=f"rows with mismatched BAS_DD: {mismatch_count}",
-                    )
-                )
-
-        isu_codes: list[str] = []
-        for row in out_block:
-            if isinstance(row, dict):
-                value = row.get("ISU_CD")
-                if isinstance(value, str) and value.strip():
-                    isu_codes.append(value.strip())
-        duplicate_count = len(isu_codes) - len(set(isu_codes))
-        if duplicate_count > 0:
-            issues.append(
-                QualityIssue(
-                    source=source,
-                    rule_code="KRX_DUPLICATE_ISU_CD",
-                    severity="WARN",
-                    entity_type=entity_type,
-                    entity_key=entity_key,
-                    message=f"duplicate ISU_CD rows: {duplicate_count}",
-                )
-            )
-
-        numeric_keys = {"TDD_CLSPRC", "CMPPREVDD_PRC", "FLUC_RT", "LIST_SHRS", "ACC_TRDVOL", "ACC_TRDVAL"}
-        invalid_numeric_fields = 0
-        for row in out_block:
-            if not isinstance(row, dict):
+            row_bas_dd = str(row.get("BAS_DD", "")).strip()
+            if row_bas_dd and row_bas_dd != requested_bas_dd:
+                mismatch_count += 1
+
+        isu_code = row.get("ISU_CD")
+        if isinstance(isu_code, str):
+            isu_code = isu_code.strip()
+            if isu_code:
+                if isu_code in seen_isu_codes:
+                    duplicate_count += 1
+                else:
+                    seen_isu_codes.add(isu_code)
+
+        for key in _NUMERIC_KEYS:
+            value = row.get(key, _ABSENT)
+            if value is _ABSENT:
+                continue
+            # Plain numbers such as "71500" or "-1.23" are valid without the general check.
+            if isinstance(value, str) and (value.isdigit() or _PLAIN_NUMBER.fullmatch(value)):
                 continue
-            for key in numeric_keys:
-                if key not in row:
-                    continue
-                value = row.get(key)
-                if _is_placeholder(value):
-                    continue
-                if not _is_numeric_like(value):
-                    invalid_numeric_fields += 1
-        if invalid_numeric_fields > 0:
-            issues.append(
-                QualityIssue(
-                    source=source,
-                    rule_code="KRX_NUMERIC_FIELD_INVALID",
-                    severity="WARN",
-                    entity_type=entity_type,
-                    entity_key=entity_key,
-                    message=f"invalid numeric field count: {invalid_numeric_fields}",
-                )
-            )
-
-    return issues
+            if _is_invalid_numeric(value):
+                invalid_numeric_fields += 1
+    return mismatch_count, duplicate_count, invalid_numeric_fields
+
+
+def _out_block(values: dict) -> object:
+    return values.get("response", {}).get("OutBlock_1")
+
+
+def _block_counts(values: dict) -> tuple[int, int, int] | None:
+    # The row-level rules share one scan of OutBlock_1; it only runs when the block has rows.
+    out_block = values["out_block"]
+    if not isinstance(out_block, list) or not out_block:
+        return None
+    return _scan_out_block(out_block, str(values.get("request_params", {}).get("basDd", "")).strip())
+
+
+DERIVED_FIELDS = (
+    DerivedField(name="out_block", requires=("response",), compute=_out_block),
+    DerivedField(name="out_block_counts", requires=("out_block", "request_params"), compute=_block_counts),
+)
+
+
+def _check_required_params(values: dict) -> str | None:
+    request_params = values.get("request_params", {})
+    missing = [key for key in values.get("required_params", {}) if key not in request_params and key != "trdDd"]
+    return f"missing required params: {', '.join(missing)}" if missing else None
+
+
+def _check_response_schema(values: dict) -> str | None:
+    return "OutBlock_1 key missing" if values["out_block"] is None else None
+
+
+def _check_empty_data(values: dict) -> str | None:
+    out_block = values["out_block"]
+    return "OutBlock_1 is empty" if isinstance(out_block, list) and not out_block else None
+
+
+def _count_check(index: int, label: str):
+    def check(values: dict) -> str | None:
+        counts = values["out_block_counts"]
+        return f"{label}: {counts[index]}" if counts and counts[index] > 0 else None
+
+    return check
+
+
+RULES = (
+    QualityRule(
+        rule_code="KRX_REQUIRED_PARAMS",
+        source="KRX",
+        severity="FAIL",
+        title="KRX required request params missing",
+        description="Required API request parameters were not provided.",
+        operator_action="Check configured KRX path requirements and request_params mapping.",
+        fields=("required_params", "request_params"),
+        check=_check_required_params,
+    ),
+    QualityRule(
+        rule_code="KRX_RESPONSE_SCHEMA",
+        source="KRX",
+        severity="FAIL",
+        title="KRX response schema mismatch",
+        description="OutBlock_1 was missing from KRX response payload.",
+        operator_action="Inspect raw KRX response and adjust schema parser.",
+        fields=("out_block",),
+        check=_check_response_schema,
+    ),
+    QualityRule(
+        rule_code="KRX_EMPTY_DATA",
+        source="KRX",
+        severity="WARN",
+        title="KRX returned empty rows",
+        description="OutBlock_1 exists but row list is empty.",
+        operator_action="Retry with a valid basDd and confirm API approval scope.",
+        fields=("out_block",),
+        check=_check_empty_data,
+    ),
+    QualityRule(
+        rule_code="KRX_BAS_DD_MISMATCH",
+        source="KRX",
+        severity="WARN",
+        title="KRX row date mismatch",
+        description="Returned BAS_DD differs from the requested basDd.",
+        operator_action="Confirm API behavior for non-trading days and adjust basDd input.",
+        fields=("out_block_counts",),
+        check=_count_check(0, "rows with mismatched BAS_DD"),
+    ),
+    QualityRule(
+        rule_code="KRX_DUPLICATE_ISU_CD",
+        source="KRX",
+        severity="WARN",
+        title="KRX duplicate ISU code rows",
+        description="Duplicate ISU_CD values were detected in the same payload.",
+        operator_action="Deduplicate rows before publish and inspect endpoint semantics.",
+        fields=("out_block_counts",),
+        check=_count_check(1, "duplicate ISU_CD rows"),
+    ),
+    QualityRule(
+        rule_code="KRX_NUMERIC_FIELD_INVALID",
+        source="KRX",
+        severity="WARN",
+        title="KRX numeric field parse issue",
+        description="Numeric columns include non-numeric values.",
+        operator_action="Adjust numeric sanitization for commas/sign/placeholder patterns.",
+        fields=("out_block_counts",),
+        check=_count_check(2, "invalid numeric field count"),
+    ),
+)
+
+_PLAN = RulePlan("KRX", RULES, DERIVED_FIELDS)
+
+
+def evaluate_krx_rules(payload: dict, *, source: str, entity_type: str, entity_key: str) -> list[QualityIssue]:
+    return _PLAN.evaluate(payload, source=source, entity_type=entity_type, entity_key=entity_key)
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass(slots=True)
+# Frozen: the gate result cache hands the same issue objects to every run that reuses them.
+@dataclass(frozen=True, slots=True)
 class QualityIssue:
     source: str
     rule_code: str
@@ -14,6 +15,10 @@ class QualityIssue:
 @dataclass(slots=True)
 class QualityGateResult:
     issues: list[QualityIssue]
+    # Seconds spent per source; summed over shards, so with workers it can exceed the wall-clock "total".
+    timings: dict[str, float] = field(default_factory=dict)
+    # Rows whose issues came from the gate result cache instead of being evaluated.
+    reused_rows: int = 0
 
     @property
     def has_fail(self) -> bool:
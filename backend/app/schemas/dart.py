@@ -14,6 +14,10 @@ class DartDisclosureItem(TypedDict, total=False):
 class DartListResponse(TypedDict, total=False):
     status: str
     message: str
+    page_no: int
+    page_count: int
+    total_count: int
+    total_page: int
     list: list[DartDisclosureItem]
 
 
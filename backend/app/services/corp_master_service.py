@@ -0,0 +1,91 @@
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.connectors.dart_connector import DartApiError, DartConnector
+from app.db.upsert import bulk_upsert
+from app.etl.corp_codes import iter_corp_code_batches
+from app.models.corp import CorpMaster
+
+_UPDATE_COLUMNS = ("corp_name", "eng_name", "stock_code", "modify_date")
+_REPORT_SAMPLE_LIMIT = 100
+
+
+@dataclass(slots=True)
+class CorpMasterRefreshResult:
+    rows: int
+    batches: int
+    changed: bool
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # corpCode.zip bytes served from the local bulk store instead of downloaded.
+    bytes_saved: int = 0
+    changed_corp_codes: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def upsert_corp_master_batch(session: Session, rows: list[dict]) -> int:
+    return bulk_upsert(session, CorpMaster, rows, index_elements=["corp_code"], update_columns=_UPDATE_COLUMNS)
+
+
+def _stored_modify_dates(session: Session, corp_codes: list[str]) -> dict[str, date | None]:
+    # One indexed lookup per batch instead of loading all ~100k stored rows up front.
+    return dict(
+        session.execute(
+            select(CorpMaster.corp_code, CorpMaster.modify_date).where(CorpMaster.corp_code.in_(corp_codes))
+        ).all()
+    )
+
+
+def upsert_corp_master(
+    session: Session,
+    batches: Iterable[list[dict]],
+    *,
+    full: bool = False,
+) -> CorpMasterRefreshResult:
+    # DART bumps modify_date whenever any field of a company changes, so equal dates mean nothing to write.
+    result = CorpMasterRefreshResult(rows=0, batches=0, changed=True)
+    for batch in batches:
+        stored = _stored_modify_dates(session, [row["corp_code"] for row in batch])
+        pending: list[dict] = []
+        for row in batch:
+            corp_code = row["corp_code"]
+            if corp_code not in stored:
+                result.inserted += 1
+            elif full or stored[corp_code] != row["modify_date"]:
+                result.updated += 1
+            else:
+                result.unchanged += 1
+                continue
+            pending.append(row)
+            if len(result.changed_corp_codes) < _REPORT_SAMPLE_LIMIT:
+                result.changed_corp_codes.append(corp_code)
+        if pending:
+            result.rows += upsert_corp_master_batch(session, pending)
+            result.batches += 1
+    session.commit()
+    return result
+
+
+def refresh_corp_master(
+    session: Session,
+    connector: DartConnector,
+    *,
+    batch_size: int = 500,
+    full: bool = False,
+) -> CorpMasterRefreshResult:
+    fetched = connector.fetch_corp_codes()
+    if not fetched.payload.startswith(b"PK"):
+        raise DartApiError(f"DART corpCode download failed: {fetched.payload[:200].decode('utf-8', 'replace')}")
+    has_rows = session.execute(select(CorpMaster.corp_code).limit(1)).first() is not None
+    if not fetched.changed and has_rows and not full:
+        return CorpMasterRefreshResult(rows=0, batches=0, changed=False, bytes_saved=fetched.bytes_saved)
+    result = upsert_corp_master(session, iter_corp_code_batches(fetched.payload, batch_size=batch_size), full=full)
+    result.bytes_saved = fetched.bytes_saved
+    return result
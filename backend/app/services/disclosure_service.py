@@ -0,0 +1,105 @@
+import re
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.upsert import bulk_upsert
+from app.models.disclosure import DartDisclosure
+
+_UPDATE_COLUMNS = (
+    "corp_code",
+    "report_nm",
+    "rcept_dt",
+    "flr_nm",
+    "is_final",
+    "is_amended",
+)
+# Not every list.json response carries the disclosure type, so a row without one keeps the stored value.
+_COALESCE_COLUMNS = ("pblntf_ty", "pblntf_detail_ty")
+_BRACKET_TAG = re.compile(r"\[([^\]]+)\]")
+_FINAL_TAG = "발행조건확정"
+_AMENDED_MARKER = "정정"
+
+
+def derive_disclosure_flags(report_nm: str | None) -> tuple[bool, bool]:
+    # DART prefixes report names with tags such as [기재정정] or [발행조건확정].
+    tags = _BRACKET_TAG.findall(report_nm or "")
+    is_final = any(tag.strip() == _FINAL_TAG for tag in tags)
+    is_amended = any(_AMENDED_MARKER in tag for tag in tags)
+    return is_final, is_amended
+
+
+def _parse_rcept_dt(value: str | None) -> date | None:
+    cleaned = (value or "").replace("-", "").strip()
+    if len(cleaned) != 8 or not cleaned.isdigit():
+        return None
+    return date(int(cleaned[0:4]), int(cleaned[4:6]), int(cleaned[6:8]))
+
+
+def _to_disclosure_row(item: dict) -> dict | None:
+    rcept_no = str(item.get("rcept_no") or "").strip()
+    corp_code = str(item.get("corp_code") or "").strip()
+    if not rcept_no or not corp_code:
+        return None
+    report_nm = str(item.get("report_nm") or "").strip()
+    is_final, is_amended = derive_disclosure_flags(report_nm)
+    return {
+        "rcept_no": rcept_no,
+        "corp_code": corp_code,
+        "report_nm": report_nm,
+        "rcept_dt": _parse_rcept_dt(item.get("rcept_dt")),
+        "flr_nm": item.get("flr_nm"),
+        "pblntf_ty": item.get("pblntf_ty"),
+        "pblntf_detail_ty": item.get("pblntf_detail_ty"),
+        "is_final": is_final,
+        "is_amended": is_amended,
+    }
+
+
+def upsert_dart_disclosures(session: Session, items: list[dict], *, batch_size: int = 500) -> int:
+    # Keyed by rcept_no so a page overlap never puts the same key twice in one statement.
+    rows_by_rcept_no: dict[str, dict] = {}
+    for item in items:
+        row = _to_disclosure_row(item)
+        if row is not None:
+            rows_by_rcept_no[row["rcept_no"]] = row
+    rows = list(rows_by_rcept_no.values())
+    written = 0
+    for start in range(0, len(rows), batch_size):
+        written += bulk_upsert(
+            session,
+            DartDisclosure,
+            rows[start : start + batch_size],
+            index_elements=["rcept_no"],
+            update_columns=_UPDATE_COLUMNS,
+            coalesce_columns=_COALESCE_COLUMNS,
+        )
+    return written
+
+
+def list_disclosures(session: Session, corp_code: str, *, limit: int = 100) -> list[dict]:
+    rows = (
+        session.execute(
+            select(DartDisclosure)
+            .where(DartDisclosure.corp_code == corp_code)
+            .order_by(DartDisclosure.rcept_dt.desc(), DartDisclosure.rcept_no.desc())
+            .limit(limit)
+        )
+        .scalars()
+        .all()
+    )
+    return [
+        {
+            "rcept_no": row.rcept_no,
+            "corp_code": row.corp_code,
+            "report_nm": row.report_nm,
+            "rcept_dt": row.rcept_dt.isoformat() if row.rcept_dt else None,
+            "flr_nm": row.flr_nm,
+            "pblntf_ty": row.pblntf_ty,
+            "pblntf_detail_ty": row.pblntf_detail_ty,
+            "is_final": row.is_final,
+            "is_amended": row.is_amended,
+        }
+        for row in rows
+    ]
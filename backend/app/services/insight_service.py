@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.models.ipo import IpoPipelineItem
-from app.models.quality import DataQualityIssue
+from app.models.quality import DataQualityIssueAggregate
+from app.services.pipeline_snapshot_service import load_current_pipeline_snapshot, load_pipeline_item_payloads
 
 
 def _build_company_key(corp_code: str | None, corp_name: str) -> str:
@@ -83,9 +84,14 @@ def get_validation_framework() -> dict:
     }
 
 
+def _load_pipeline_rows(session: Session) -> list[dict]:
+    snapshot = load_current_pipeline_snapshot(session)
+    return snapshot.payload["items"] if snapshot is not None else load_pipeline_item_payloads(session)
+
+
 def get_insight_overview(session: Session) -> dict:
-    rows = session.execute(select(IpoPipelineItem)).scalars().all()
-    corp_codes = [row.corp_code for row in rows if row.corp_code]
+    rows = _load_pipeline_rows(session)
+    corp_codes = [row["corp_code"] for row in rows if row["corp_code"]]
     quality_counts = _load_quality_counts_by_corp_code(session, corp_codes)
 
     stage_counts: dict[str, int] = {}
@@ -93,12 +99,12 @@ def get_insight_overview(session: Session) -> dict:
     lead_manager_counts: dict[str, int] = {}
 
     for row in rows:
-        stage_counts[row.stage] = stage_counts.get(row.stage, 0) + 1
-        counts = quality_counts.get(row.corp_code or "", {"PASS": 0, "WARN": 0, "FAIL": 0})
+        stage_counts[row["stage"]] = stage_counts.get(row["stage"], 0) + 1
+        counts = quality_counts.get(row["corp_code"] or "", {"PASS": 0, "WARN": 0, "FAIL": 0})
         risk = _risk_label(fail_count=counts["FAIL"], warn_count=counts["WARN"])
         risk_counts[risk] += 1
-        if row.lead_manager:
-            lead_manager_counts[row.lead_manager] = lead_manager_counts.get(row.lead_manager, 0) + 1
+        if row["lead_manager"]:
+            lead_manager_counts[row["lead_manager"]] = lead_manager_counts.get(row["lead_manager"], 0) + 1
 
     top_lead_managers = [
         {"lead_manager": key, "count": value}
@@ -136,9 +142,13 @@ def _load_quality_counts_by_corp_code(session: Session, corp_codes: list[str]) -
     if not corp_codes:
         return {}
     quality_rows = session.execute(
-        select(DataQualityIssue.entity_key, DataQualityIssue.severity, func.count(DataQualityIssue.id))
-        .where(DataQualityIssue.entity_key.in_(corp_codes))
-        .group_by(DataQualityIssue.entity_key, DataQualityIssue.severity)
+        select(
+            DataQualityIssueAggregate.entity_key,
+            DataQualityIssueAggregate.severity,
+            func.sum(DataQualityIssueAggregate.occurrence_count),
+        )
+        .where(DataQualityIssueAggregate.entity_key.in_(corp_codes))
+        .group_by(DataQualityIssueAggregate.entity_key, DataQualityIssueAggregate.severity)
     ).all()
     quality_counts: dict[str, dict[str, int]] = {}
     for entity_key, severity, count in quality_rows:
@@ -155,34 +165,36 @@ def list_companies_for_explorer(
     stage: str | None = None,
     risk_label: str | None = None,
 ) -> list[dict]:
-    stmt = select(IpoPipelineItem).order_by(IpoPipelineItem.listing_date.desc().nullslast(), IpoPipelineItem.corp_name.asc())
+    rows = _load_pipeline_rows(session)
     if query:
-        q = query.strip()
+        q = query.strip().casefold()
         if q:
-            pattern = f"%{q}%"
-            stmt = stmt.where(or_(IpoPipelineItem.corp_name.ilike(pattern), IpoPipelineItem.corp_code.ilike(pattern)))
+            rows = [row for row in rows if q in row["corp_name"].casefold() or q in (row["corp_code"] or "").casefold()]
     if stage:
-        stmt = stmt.where(IpoPipelineItem.stage == stage)
+        rows = [row for row in rows if row["stage"] == stage]
+    # Newest listing first, undated last, ties by name; ISO dates sort as strings.
+    rows = sorted(rows, key=lambda row: row["corp_name"])
+    rows.sort(key=lambda row: row["listing_date"] or "", reverse=True)
 
     fetch_limit = min(1000, max(limit, limit * 5 if risk_label else limit))
-    rows = session.execute(stmt.limit(fetch_limit)).scalars().all()
-    corp_codes = [row.corp_code for row in rows if row.corp_code]
+    rows = rows[:fetch_limit]
+    corp_codes = [row["corp_code"] for row in rows if row["corp_code"]]
     quality_counts = _load_quality_counts_by_corp_code(session, corp_codes)
 
     items: list[dict] = []
     for row in rows:
-        counts = quality_counts.get(row.corp_code or "", {"PASS": 0, "WARN": 0, "FAIL": 0})
+        counts = quality_counts.get(row["corp_code"] or "", {"PASS": 0, "WARN": 0, "FAIL": 0})
         row_risk_label = _risk_label(fail_count=counts["FAIL"], warn_count=counts["WARN"])
         if risk_label and row_risk_label != risk_label:
             continue
         items.append(
             {
-                "company_key": _build_company_key(row.corp_code, row.corp_name),
-                "corp_code": row.corp_code,
-                "corp_name": row.corp_name,
-                "stage": row.stage,
-                "listing_date": row.listing_date.isoformat() if row.listing_date else None,
-                "lead_manager": row.lead_manager,
+                "company_key": _build_company_key(row["corp_code"], row["corp_name"]),
+                "corp_code": row["corp_code"],
+                "corp_name": row["corp_name"],
+                "stage": row["stage"],
+                "listing_date": row["listing_date"],
+                "lead_manager": row["lead_manager"],
                 "quality": counts,
                 "risk_label": row_risk_label,
             }
@@ -226,9 +238,13 @@ def get_company_insight_detail(session: Session, *, company_key: str) -> dict |
     quality_by_source: dict[str, int] = {}
     if row.corp_code:
         quality_rows = session.execute(
-            select(DataQualityIssue.source, DataQualityIssue.severity, func.count(DataQualityIssue.id))
-            .where(DataQualityIssue.entity_key == row.corp_code)
-            .group_by(DataQualityIssue.source, DataQualityIssue.severity)
+            select(
+                DataQualityIssueAggregate.source,
+                DataQualityIssueAggregate.severity,
+                func.sum(DataQualityIssueAggregate.occurrence_count),
+            )
+            .where(DataQualityIssueAggregate.entity_key == row.corp_code)
+            .group_by(DataQualityIssueAggregate.source, DataQualityIssueAggregate.severity)
         ).all()
         for source, severity, count in quality_rows:
             quality_by_source[str(source)] = quality_by_source.get(str(source), 0) + int(count)
@@ -1,18 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
 from datetime import datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import RowMapping, func, select
 from sqlalchemy.orm import Session
 
 from app.connectors.dart_connector import DartConnector
+from app.connectors.dart_crawler import DartDisclosureCrawler
+from app.connectors.http_client import default_pool
 from app.connectors.kind_connector import KindConnector
-from app.connectors.krx_connector import KrxAccessDeniedError, KrxAuthError, KrxConnector, KrxRequestError
+from app.connectors.krx_connector import (
+    KrxAccessDeniedError,
+    KrxAuthError,
+    KrxConnector,
+    KrxRequestError,
+    open_api_rate_limiter,
+    open_api_response_cache,
+)
 from app.etl.pipeline import run_pipeline
-from app.models.ipo import IpoPipelineItem
+from app.etl.replay import capture_bundle_safely
+from app.models.ipo import IpoPipelineAlias, IpoPipelineItem
+from app.quality.gate import gate_result_cache
+from app.services.pipeline_snapshot_service import (
+    current_snapshot_version,
+    load_current_pipeline_snapshot,
+    load_pipeline_item_payloads,
+    pipeline_item_payload,
+    publish_pipeline_snapshot,
+)
 
 _KRX_CATEGORY_ENV_KEYS: dict[str, str] = {
     "index": "KRX_API_INDEX_PATH",
@@ -47,10 +66,20 @@ def resolve_krx_openapi_paths(env: dict[str, str] | None = None) -> dict[str, li
     return resolved
 
 
-def _fetch_krx_with_retry(
+def _live_fetch_concurrency() -> int:
+    return max(1, int(os.getenv("LIVE_FETCH_MAX_CONCURRENCY", "8")))
+
+
+def _live_fail_fast() -> bool:
+    return os.getenv("QUALITY_GATE_FAIL_FAST", "1") != "0"
+
+
+async def _fetch_krx_with_retry(
     connector: KrxConnector,
     api_path: str,
     bas_dd: str,
+    limit: asyncio.Semaphore,
+    timing: dict[str, float] | None = None,
     max_attempts: int = 3,
     initial_backoff: float = 0.2,
 ) -> tuple[dict, int]:
@@ -59,11 +88,14 @@ def _fetch_krx_with_retry(
     last_request_error: KrxRequestError | None = None
     for attempt in range(1, max_attempts + 1):
         try:
-            return connector.fetch_open_api(api_path, {"basDd": bas_dd}), attempt
+            async with limit:
+                if timing is not None:
+                    timing.setdefault("started", time.perf_counter())
+                return await connector.fetch_open_api_async(api_path, {"basDd": bas_dd}), attempt
         except KrxAccessDeniedError as exc:
             last_auth_error = exc
             if attempt < max_attempts:
-                time.sleep(backoff)
+                await asyncio.sleep(backoff)
                 backoff = min(backoff * 2, 1.0)
                 continue
             raise
@@ -73,7 +105,7 @@ def _fetch_krx_with_retry(
         except KrxRequestError as exc:
             last_request_error = exc
             if attempt < max_attempts:
-                time.sleep(backoff)
+                await asyncio.sleep(backoff)
                 backoff = min(backoff * 2, 1.0)
                 continue
             raise
@@ -84,10 +116,24 @@ def _fetch_krx_with_retry(
     raise RuntimeError("unexpected krx fetch retry state")
 
 
-def _collect_krx_path_result(*, krx_api_key: str, api_path: str, bas_dd: str) -> dict:
+async def _collect_krx_path_result(
+    *, krx_api_key: str, api_path: str, bas_dd: str, limit: asyncio.Semaphore
+) -> dict:
+    timing: dict[str, float] = {"submitted": time.perf_counter()}
+    result = await _run_krx_path(krx_api_key=krx_api_key, api_path=api_path, bas_dd=bas_dd, limit=limit, timing=timing)
+    finished = time.perf_counter()
+    started = timing.get("started", finished)
+    result["queue_wait_ms"] = round((started - timing["submitted"]) * 1000, 1)
+    result["run_ms"] = round((finished - started) * 1000, 1)
+    return result
+
+
+async def _run_krx_path(
+    *, krx_api_key: str, api_path: str, bas_dd: str, limit: asyncio.Semaphore, timing: dict[str, float]
+) -> dict:
     connector = KrxConnector(api_key=krx_api_key)
     try:
-        payload, attempts = _fetch_krx_with_retry(connector, api_path, bas_dd)
+        payload, attempts = await _fetch_krx_with_retry(connector, api_path, bas_dd, limit, timing)
         out_block = payload.get("OutBlock_1")
         if not isinstance(out_block, list):
             return {"path": api_path, "status": "schema_mismatch", "rows": 0, "attempts": attempts}
@@ -106,16 +152,52 @@ def _collect_krx_path_result(*, krx_api_key: str, api_path: str, bas_dd: str) ->
         return {"path": api_path, "status": "error", "rows": 0, "attempts": 1, "error": f"{type(exc).__name__}: {exc}"}
 
 
-def _to_item_payload(item: IpoPipelineItem) -> dict:
-    return {
-        "pipeline_id": item.pipeline_id,
-        "corp_code": item.corp_code,
-        "corp_name": item.corp_name,
-        "stage": item.stage,
-        "listing_date": item.listing_date.isoformat() if item.listing_date else None,
-        "lead_manager": item.lead_manager,
-        "source_dart_rcept_no": item.source_dart_rcept_no,
-    }
+async def _collect_kind_rows(limit: asyncio.Semaphore) -> tuple[list[dict], str | None]:
+    try:
+        async with limit:
+            return await KindConnector().fetch_public_offering_companies_async(), None
+    except Exception as exc:  # pragma: no cover - runtime diagnostics
+        return [], f"{type(exc).__name__}: {exc}"
+
+
+async def _collect_dart_rows(
+    *, dart_api_key: str, corp_code: str, bas_dd: str, limit: asyncio.Semaphore
+) -> tuple[list[dict], str | None]:
+    try:
+        dart_bgn_de, dart_end_de = _resolve_dart_window(bas_dd)
+        async with limit:
+            rows = await DartDisclosureCrawler(DartConnector(api_key=dart_api_key)).crawl(
+                dart_bgn_de,
+                dart_end_de,
+                corp_code=corp_code,
+            )
+        return rows, None
+    except Exception as exc:  # pragma: no cover - runtime diagnostics
+        return [], f"{type(exc).__name__}: {exc}"
+
+
+async def _collect_live_sources(
+    *,
+    corp_code: str,
+    bas_dd: str,
+    dart_api_key: str | None,
+    krx_api_key: str | None,
+    krx_jobs: list[tuple[str, str]],
+) -> tuple[tuple[list[dict], str | None], tuple[list[dict], str | None] | None, list[dict]]:
+    # One event loop and one concurrency cap for every source, so the refresh waits on the slowest call only.
+    limit = asyncio.Semaphore(_live_fetch_concurrency())
+    kind_task = _collect_kind_rows(limit)
+    dart_task = (
+        _collect_dart_rows(dart_api_key=dart_api_key, corp_code=corp_code, bas_dd=bas_dd, limit=limit)
+        if dart_api_key
+        else asyncio.sleep(0, result=None)
+    )
+    krx_tasks = [
+        _collect_krx_path_result(krx_api_key=krx_api_key or "", api_path=api_path, bas_dd=bas_dd, limit=limit)
+        for _, api_path in krx_jobs
+    ]
+    kind_result, dart_result, *krx_results = await asyncio.gather(kind_task, dart_task, *krx_tasks)
+    return kind_result, dart_result, krx_results
 
 
 def _resolve_dart_window(bas_dd: str, lookback_days: int = 365) -> tuple[str, str]:
@@ -124,21 +206,43 @@ def _resolve_dart_window(bas_dd: str, lookback_days: int = 365) -> tuple[str, st
     return begin_date.strftime("%Y%m%d"), target_date.strftime("%Y%m%d")
 
 
+def get_pipeline_snapshot(session: Session) -> dict:
+    snapshot = load_current_pipeline_snapshot(session)
+    if snapshot is None:
+        return {"items": [], "total": 0, "snapshot_version": None}
+    return {**snapshot.payload, "snapshot_version": snapshot.version}
+
+
 def list_pipeline_items(session: Session) -> list[dict]:
-    rows = session.execute(select(IpoPipelineItem).order_by(IpoPipelineItem.pipeline_id.asc())).scalars().all()
-    return [_to_item_payload(row) for row in rows]
+    return get_pipeline_snapshot(session)["items"]
+
+
+def _load_item_row(session: Session, pipeline_id: str) -> RowMapping | None:
+    return (
+        session.execute(select(IpoPipelineItem.__table__).where(IpoPipelineItem.pipeline_id == pipeline_id))
+        .mappings()
+        .first()
+    )
 
 
 def get_pipeline_item(session: Session, pipeline_id: str) -> dict | None:
-    row = session.get(IpoPipelineItem, pipeline_id)
+    row = _load_item_row(session, pipeline_id)
+    if row is None:
+        alias = session.get(IpoPipelineAlias, pipeline_id)
+        row = _load_item_row(session, alias.pipeline_id) if alias else None
     if row is None:
         return None
-    return _to_item_payload(row)
+    return pipeline_item_payload(row)
 
 
 def ensure_demo_pipeline_if_empty(session: Session) -> None:
+    if current_snapshot_version(session) is not None:
+        return
     count = session.execute(select(func.count(IpoPipelineItem.pipeline_id))).scalar_one()
     if count > 0:
+        # Items published before snapshots existed; serve them from a first snapshot.
+        publish_pipeline_snapshot(session, load_pipeline_item_payloads(session), batch_id=None)
+        session.commit()
         return
     demo_bundle = {
         "batch_id": "demo-seed-batch",
@@ -169,43 +273,41 @@ def refresh_pipeline_live(session: Session, *, corp_code: str, bas_dd: str) -> d
     dart_api_key = os.getenv("DART_API_KEY")
     krx_api_key = os.getenv("KRX_API_KEY")
 
-    kind_connector = KindConnector()
-    dart_connector = DartConnector(api_key=dart_api_key or "")
-
-    kind_rows: list[dict] = []
-    dart_rows: list[dict] = []
     krx_rows: list[dict] = []
-
-    kind_error: str | None = None
-    dart_error: str | None = None
     krx_status: dict[str, str] = {}
     krx_status_detail: dict[str, list[dict]] = {}
 
-    try:
-        kind_rows = kind_connector.fetch_public_offering_companies()
-        krx_status["kind"] = f"ok:{len(kind_rows)}"
-    except Exception as exc:  # pragma: no cover - runtime diagnostics
-        kind_error = f"{type(exc).__name__}: {exc}"
-        krx_status["kind"] = "error"
+    krx_paths = resolve_krx_openapi_paths()
+    krx_jobs = (
+        [(category, api_path) for category, api_paths in krx_paths.items() for api_path in api_paths]
+        if krx_api_key
+        else []
+    )
+    (kind_rows, kind_error), dart_result, krx_results = asyncio.run(
+        _collect_live_sources(
+            corp_code=corp_code,
+            bas_dd=bas_dd,
+            dart_api_key=dart_api_key,
+            krx_api_key=krx_api_key,
+            krx_jobs=krx_jobs,
+        )
+    )
+    krx_status["kind"] = "error" if kind_error else f"ok:{len(kind_rows)}"
 
-    if dart_api_key:
-        try:
-            dart_bgn_de, dart_end_de = _resolve_dart_window(bas_dd)
-            dart_rows = dart_connector.fetch_list(
-                corp_code=corp_code,
-                page_no=1,
-                page_count=100,
-                bgn_de=dart_bgn_de,
-                end_de=dart_end_de,
-            )
-            krx_status["dart"] = f"ok:{len(dart_rows)}"
-        except Exception as exc:  # pragma: no cover - runtime diagnostics
-            dart_error = f"{type(exc).__name__}: {exc}"
-            krx_status["dart"] = "error"
-    else:
+    dart_rows: list[dict] = []
+    dart_error: str | None = None
+    if dart_result is None:
         krx_status["dart"] = "missing_key"
+    else:
+        dart_rows, dart_error = dart_result
+        krx_status["dart"] = "error" if dart_error else f"ok:{len(dart_rows)}"
+
+    # Every (category, path) job ran in one batch; regroup in config order for stable status output.
+    results_by_category: dict[str, list[dict]] = {}
+    for (category, _), path_result in zip(krx_jobs, krx_results):
+        results_by_category.setdefault(category, []).append(path_result)
 
-    for category, api_paths in resolve_krx_openapi_paths().items():
+    for category, api_paths in krx_paths.items():
         krx_status_detail[category] = []
         if not api_paths:
             krx_status[category] = "not_configured"
@@ -218,15 +320,7 @@ def refresh_pipeline_live(session: Session, *, corp_code: str, bas_dd: str) -> d
         denied_count = 0
         schema_count = 0
         error_count = 0
-        max_workers = min(8, max(1, len(api_paths)))
-        path_results: list[dict] = []
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [
-                executor.submit(_collect_krx_path_result, krx_api_key=krx_api_key, api_path=api_path, bas_dd=bas_dd)
-                for api_path in api_paths
-            ]
-            for future in as_completed(futures):
-                path_results.append(future.result())
+        path_results = results_by_category.get(category, [])
 
         for result in sorted(path_results, key=lambda item: item["path"]):
             status = result["status"]
@@ -253,6 +347,8 @@ def refresh_pipeline_live(session: Session, *, corp_code: str, bas_dd: str) -> d
                 "status": status,
                 "rows": result["rows"],
                 "attempts": result["attempts"],
+                "queue_wait_ms": result["queue_wait_ms"],
+                "run_ms": result["run_ms"],
             }
             if "error" in result:
                 detail_entry["error"] = result["error"]
@@ -274,19 +370,24 @@ def refresh_pipeline_live(session: Session, *, corp_code: str, bas_dd: str) -> d
             krx_status[category] = "error"
 
     batch_id = f"live-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-    result = run_pipeline(
-        session,
-        {
-            "batch_id": batch_id,
-            "kind_rows": kind_rows,
-            "dart_rows": dart_rows,
-            "krx_rows": krx_rows,
-        },
-    )
+    bundle = {
+        "batch_id": batch_id,
+        "kind_rows": kind_rows,
+        "dart_rows": dart_rows,
+        "krx_rows": krx_rows,
+    }
+    raw_archive = capture_bundle_safely(session, bundle)
+    result = run_pipeline(session, bundle, fail_fast=_live_fail_fast())
     return {
         "batch_id": batch_id,
         "published": result.published,
-        "issue_count": len(result.issues),
+        # Every issue of the batch; unknown (null) while fail-fast logging is still evaluating them.
+        "issue_count": None if result.issue_logging is not None else len(result.issues),
+        "decision_issue": asdict(result.decision_issue) if result.decision_issue is not None else None,
+        "gate_timings": result.gate_timings,
+        "gate_reused_rows": result.gate_reused_rows,
+        "gate_result_cache": gate_result_cache.metrics(),
+        "issue_logging": "deferred" if result.issue_logging is not None else "inline",
         "kind_rows": len(kind_rows),
         "dart_rows": len(dart_rows),
         "krx_rows": len(krx_rows),
@@ -294,4 +395,8 @@ def refresh_pipeline_live(session: Session, *, corp_code: str, bas_dd: str) -> d
         "dart_error": dart_error,
         "source_status": krx_status,
         "source_status_detail": krx_status_detail,
+        "http_pool": default_pool.stats(),
+        "krx_rate_limit": open_api_rate_limiter.metrics(),
+        "krx_response_cache": open_api_response_cache.metrics() if open_api_response_cache else None,
+        "raw_archive": raw_archive,
     }
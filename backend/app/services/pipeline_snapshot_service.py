@@ -0,0 +1,77 @@
+import os
+from collections.abc import Mapping
+from datetime import date
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.models.ipo import IpoPipelineItem
+from app.models.snapshot import IpoPipelineSnapshot, IpoPipelineSnapshotPointer
+
+CURRENT_SNAPSHOT = "current"
+
+
+def pipeline_item_payload(row: Mapping) -> dict:
+    listing_date = row["listing_date"]
+    return {
+        "pipeline_id": row["pipeline_id"],
+        "corp_code": row["corp_code"],
+        "corp_name": row["corp_name"],
+        "stage": row["stage"],
+        "listing_date": listing_date.isoformat() if listing_date else None,
+        "lead_manager": row["lead_manager"],
+        "source_dart_rcept_no": row["source_dart_rcept_no"],
+    }
+
+
+def pipeline_item_order(row: Mapping) -> tuple:
+    # Public list order: by listing date, undated offerings last, then by name.
+    listing_date = row["listing_date"]
+    return (listing_date is None, listing_date or date.min, row["corp_name"], row["pipeline_id"])
+
+
+def load_pipeline_item_payloads(session: Session) -> list[dict]:
+    rows = session.execute(select(IpoPipelineItem.__table__)).mappings().all()
+    return [pipeline_item_payload(row) for row in sorted(rows, key=pipeline_item_order)]
+
+
+def current_snapshot_version(session: Session) -> int | None:
+    pointer = session.get(IpoPipelineSnapshotPointer, CURRENT_SNAPSHOT)
+    return pointer.version if pointer else None
+
+
+def publish_pipeline_snapshot(
+    session: Session,
+    items: list[dict],
+    *,
+    batch_id: str | None,
+    retention: int | None = None,
+) -> int:
+    # Snapshots are never modified; publishing adds a version and moves the pointer in the caller's transaction.
+    snapshot = IpoPipelineSnapshot(
+        snapshot_date=date.today().isoformat(),
+        batch_id=batch_id,
+        item_count=len(items),
+        payload={"items": items, "total": len(items)},
+    )
+    session.add(snapshot)
+    session.flush()
+
+    pointer = session.get(IpoPipelineSnapshotPointer, CURRENT_SNAPSHOT)
+    if pointer is None:
+        session.add(IpoPipelineSnapshotPointer(name=CURRENT_SNAPSHOT, version=snapshot.version))
+    else:
+        pointer.version = snapshot.version
+        pointer.updated_at = func.now()
+
+    keep = retention or int(os.getenv("PIPELINE_SNAPSHOT_RETENTION", "20"))
+    session.execute(delete(IpoPipelineSnapshot).where(IpoPipelineSnapshot.version <= snapshot.version - keep))
+    return snapshot.version
+
+
+def load_current_pipeline_snapshot(session: Session) -> IpoPipelineSnapshot | None:
+    return session.execute(
+        select(IpoPipelineSnapshot)
+        .join(IpoPipelineSnapshotPointer, IpoPipelineSnapshotPointer.version == IpoPipelineSnapshot.version)
+        .where(IpoPipelineSnapshotPointer.name == CURRENT_SNAPSHOT)
+    ).scalar_one_or_none()
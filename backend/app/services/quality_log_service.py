@@ -1,22 +1,105 @@
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
-from app.models.quality import DataQualityIssue, SnapshotPublishLog
+from app.db.upsert import bulk_upsert
+from app.models.quality import DataQualityIssueAggregate, DataQualityIssueOccurrence, SnapshotPublishLog
 from app.quality.types import QualityIssue
 
+logger = logging.getLogger(__name__)
+
+_deferred_executor: ThreadPoolExecutor | None = None
+_deferred_executor_lock = threading.Lock()
+
 
-def save_quality_issues(session: Session, issues: list[QualityIssue], *, batch_id: str | None) -> None:
+_aggregates = DataQualityIssueAggregate.__table__
+
+
+def _load_aggregate_ids(session: Session, keys: list[tuple[str, str, str]]) -> dict[tuple[str, str, str], int]:
+    # entity_key is indexed on its own and nearly unique, so filtering on it and matching the rest here is cheapest.
+    wanted = set(keys)
+    rows = session.execute(
+        select(_aggregates.c.source, _aggregates.c.rule_code, _aggregates.c.entity_key, _aggregates.c.id).where(
+            _aggregates.c.entity_key.in_({entity_key for _, _, entity_key in keys})
+        )
+    ).all()
+    return {
+        (source, rule_code, entity_key): row_id
+        for source, rule_code, entity_key, row_id in rows
+        if (source, rule_code, entity_key) in wanted
+    }
+
+
+def save_quality_issues(
+    session: Session,
+    issues: list[QualityIssue],
+    *,
+    batch_id: str | None,
+    chunk_size: int | None = None,
+) -> int:
+    # Issues recur every run, so each (source, rule_code, entity_key) is one aggregate row bumped in place, and the
+    # occurrence log gets at most one row per aggregate and day. The latest message and severity win.
+    if not issues:
+        return 0
+    size = chunk_size or int(os.getenv("QUALITY_ISSUE_INSERT_CHUNK", "1000"))
+    grouped: dict[tuple[str, str, str], dict] = {}
     for issue in issues:
-        session.add(
-            DataQualityIssue(
-                source=issue.source,
-                rule_code=issue.rule_code,
-                severity=issue.severity,
-                entity_type=issue.entity_type,
-                entity_key=issue.entity_key,
-                message=issue.message,
-                batch_id=batch_id,
-            )
+        key = (issue.source, issue.rule_code, issue.entity_key)
+        slot = grouped.get(key)
+        if slot is None:
+            grouped[key] = {
+                "source": issue.source,
+                "rule_code": issue.rule_code,
+                "severity": issue.severity,
+                "entity_type": issue.entity_type,
+                "entity_key": issue.entity_key,
+                "message": issue.message,
+                "occurrence_count": 1,
+            }
+        else:
+            slot.update(severity=issue.severity, message=issue.message, occurrence_count=slot["occurrence_count"] + 1)
+
+    # One database timestamp for the whole call, so every row of a batch lands on the same day bucket.
+    seen_at = session.execute(select(func.now())).scalar_one()
+    # Both writes are INSERT ... ON CONFLICT with the counters added in SQL, so concurrent writers of the same key
+    # (deferred worker, celery job, scripts) merge instead of failing on the unique constraints.
+    keys = list(grouped)
+    for start in range(0, len(keys), size):
+        chunk = keys[start : start + size]
+        bulk_upsert(
+            session,
+            DataQualityIssueAggregate,
+            [{**grouped[key], "last_batch_id": batch_id, "first_seen": seen_at, "last_seen": seen_at} for key in chunk],
+            index_elements=["source", "rule_code", "entity_key"],
+            update_columns=["severity", "message", "last_batch_id", "last_seen"],
+            increment_columns=["occurrence_count"],
+        )
+        ids = _load_aggregate_ids(session, chunk)
+        bulk_upsert(
+            session,
+            DataQualityIssueOccurrence,
+            [
+                {
+                    "aggregate_id": ids[key],
+                    "observed_date": seen_at.date(),
+                    "severity": grouped[key]["severity"],
+                    "occurrence_count": grouped[key]["occurrence_count"],
+                    "last_batch_id": batch_id,
+                    "last_seen": seen_at,
+                }
+                for key in chunk
+            ],
+            index_elements=["aggregate_id", "observed_date", "severity"],
+            update_columns=["last_batch_id", "last_seen"],
+            increment_columns=["occurrence_count"],
         )
+    return len(issues)
 
 
 def save_publish_log(
@@ -37,3 +120,35 @@ def save_publish_log(
             batch_id=batch_id,
         )
     )
+
+
+def _deferred_logging_executor() -> ThreadPoolExecutor:
+    # One worker, so deferred batches are written in submission order and never contend with each other.
+    global _deferred_executor
+    with _deferred_executor_lock:
+        if _deferred_executor is None:
+            _deferred_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quality-log")
+        return _deferred_executor
+
+
+def _report_deferred_failure(future: Future) -> None:
+    if future.exception() is not None:
+        logger.error("deferred quality issue logging failed", exc_info=future.exception())
+
+
+def defer_quality_logging(
+    bind: Engine,
+    evaluate: Callable[[], list[QualityIssue]],
+    *,
+    batch_id: str | None,
+) -> Future:
+    def run() -> int:
+        issues = evaluate()
+        with Session(bind) as session:
+            count = save_quality_issues(session, issues, batch_id=batch_id)
+            session.commit()
+        return count
+
+    future = _deferred_logging_executor().submit(run)
+    future.add_done_callback(_report_deferred_failure)
+    return future
@@ -1,9 +1,14 @@
 from datetime import date, datetime, time
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
-from app.models.quality import DataQualityIssue, DataQualitySummaryDaily
+from app.models.quality import (
+    DataQualityIssue,
+    DataQualityIssueAggregate,
+    DataQualityIssueOccurrence,
+    DataQualitySummaryDaily,
+)
 
 
 def aggregate_quality_daily(session: Session, summary_date: str) -> int:
@@ -11,21 +16,30 @@ def aggregate_quality_daily(session: Session, summary_date: str) -> int:
     day_start = datetime.combine(target_day, time.min)
     day_end = datetime.combine(target_day, time.max)
 
-    rows = (
-        session.execute(
-            select(DataQualityIssue).where(
-                DataQualityIssue.observed_at >= day_start,
-                DataQualityIssue.observed_at <= day_end,
-            )
+    occurrence_counts = session.execute(
+        select(
+            DataQualityIssueAggregate.source,
+            DataQualityIssueOccurrence.severity,
+            func.sum(DataQualityIssueOccurrence.occurrence_count),
+        )
+        .join(DataQualityIssueOccurrence, DataQualityIssueOccurrence.aggregate_id == DataQualityIssueAggregate.id)
+        .where(DataQualityIssueOccurrence.observed_date == target_day)
+        .group_by(DataQualityIssueAggregate.source, DataQualityIssueOccurrence.severity)
+    ).all()
+    # data_quality_issue is no longer written by the gate, but rows from older workers still count for their day.
+    legacy_counts = session.execute(
+        select(DataQualityIssue.source, DataQualityIssue.severity, func.count(DataQualityIssue.id))
+        .where(
+            DataQualityIssue.observed_at >= day_start,
+            DataQualityIssue.observed_at <= day_end,
         )
-        .scalars()
-        .all()
-    )
+        .group_by(DataQualityIssue.source, DataQualityIssue.severity)
+    ).all()
 
     grouped: dict[str, dict[str, int]] = {}
-    for row in rows:
-        stats = grouped.setdefault(row.source, {"PASS": 0, "WARN": 0, "FAIL": 0})
-        stats[row.severity] = stats.get(row.severity, 0) + 1
+    for source, severity, count in [*occurrence_counts, *legacy_counts]:
+        stats = grouped.setdefault(source, {"PASS": 0, "WARN": 0, "FAIL": 0})
+        stats[severity] = stats.get(severity, 0) + int(count or 0)
 
     if not grouped:
         return 0
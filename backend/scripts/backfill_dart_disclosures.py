@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.connectors.dart_connector import DartConnector
+from app.connectors.dart_crawler import DartDisclosureCrawler
+from app.db.url import normalize_database_url
+from app.services.disclosure_service import upsert_dart_disclosures
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Backfill dart_disclosure from list.json; resumable via a checkpoint.")
+    parser.add_argument("--from", dest="bgn_de", required=True, help="first receipt date (YYYYMMDD)")
+    parser.add_argument("--to", dest="end_de", required=True, help="last receipt date (YYYYMMDD)")
+    parser.add_argument("--corp-code", help="crawl one company instead of the whole market")
+    parser.add_argument("--pblntf-ty", help="disclosure type filter for market-wide crawls, e.g. C")
+    parser.add_argument("--checkpoint", default="data/dart_backfill.json", help="checkpoint file for resuming")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="target database")
+    parser.add_argument("--api-key", default=os.getenv("DART_API_KEY"), help="DART API key")
+    return parser
+
+
+async def backfill(args: argparse.Namespace, session: Session) -> tuple[int, int]:
+    crawler = DartDisclosureCrawler(DartConnector(api_key=args.api_key))
+    chunks = written = 0
+    async for window, rows in crawler.iter_windows(
+        args.bgn_de,
+        args.end_de,
+        corp_code=args.corp_code,
+        pblntf_ty=args.pblntf_ty,
+        checkpoint_path=args.checkpoint,
+    ):
+        # Commit before asking for the next chunk; that is when the checkpoint moves past this one.
+        written += upsert_dart_disclosures(session, rows)
+        session.commit()
+        chunks += 1
+        print(f"{window.key} rows={len(rows)}")
+    return chunks, written
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if not args.api_key:
+        print("DART_API_KEY missing")
+        return 2
+
+    database_url = normalize_database_url(args.database_url, default="sqlite:///./anti_gravity.db")
+    engine = create_engine(database_url, future=True)
+    with Session(engine) as session:
+        chunks, written = asyncio.run(backfill(args, session))
+    print("chunks=", chunks, "written=", written)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
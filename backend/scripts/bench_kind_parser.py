@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import html
+import re
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.connectors.kind_connector import KindConnector
+
+FIXTURE_DIR = ROOT_DIR / "tests" / "fixtures" / "kind"
+
+
+def legacy_parse_company_table(document: str) -> list[dict[str, str]]:
+    # Previous implementation, kept here as the benchmark baseline.
+    def clean_cell(value: str) -> str:
+        stripped = re.sub(r"<br\s*/?>", " ", value, flags=re.IGNORECASE)
+        stripped = re.sub(r"<.*?>", "", stripped)
+        return html.unescape(stripped).replace("\xa0", " ").strip()
+
+    rows = re.findall(r"<tr[^>]*>(.*?)</tr>", document, re.IGNORECASE | re.DOTALL)
+    items: list[dict[str, str]] = []
+    for row in rows:
+        cells = re.findall(r"<td[^>]*>(.*?)</td>", row, re.IGNORECASE | re.DOTALL)
+        if len(cells) < 5:
+            continue
+        cleaned = [clean_cell(cell) for cell in cells]
+        if len(cells) >= 9:
+            market_match = re.search(r"alt=['\"]([^'\"]+)['\"]", cells[0], re.IGNORECASE)
+            market = clean_cell(market_match.group(1)) if market_match else ""
+            corp_name, listing_date, lead_manager = cleaned[0], cleaned[7], cleaned[8]
+            stage = KindConnector._normalize_stage(listing_date)
+        else:
+            corp_name, market = cleaned[0], cleaned[1]
+            stage = cleaned[2] or KindConnector._normalize_stage(cleaned[3] if len(cleaned) > 3 else None)
+            listing_date = cleaned[3] if len(cleaned) > 3 else ""
+            lead_manager = cleaned[4] if len(cleaned) > 4 else ""
+        if not corp_name:
+            continue
+        items.append(
+            {"corp_name": corp_name, "market": market, "stage": stage, "listing_date": listing_date, "lead_manager": lead_manager}
+        )
+    return items
+
+
+def build_page(fixture: Path, rows: int) -> str:
+    document = fixture.read_text(encoding="utf-8")
+    start = document.index("<tr")
+    end = document.index("</tr>") + len("</tr>")
+    return document[:start] + "\n".join(document[start:end] for _ in range(rows)) + document[end:]
+
+
+def measure(parse: Callable[[str], list[dict[str, str]]], document: str, repeat: int) -> tuple[float, int]:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse(document)
+    elapsed = (time.perf_counter() - started) / repeat
+    tracemalloc.start()
+    parse(document)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare the KIND table parser against the legacy regex parser.")
+    parser.add_argument("--rows", type=int, default=3000, help="rows on the synthetic page (currentPageSize)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fixture", type=Path, default=FIXTURE_DIR / "pubofrprogcom_sub.html")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    document = build_page(args.fixture, args.rows)
+    if legacy_parse_company_table(document) != KindConnector._parse_company_table(document):
+        print("parser output mismatch")
+        return 1
+
+    legacy_seconds, legacy_peak = measure(legacy_parse_company_table, document, args.repeat)
+    current_seconds, current_peak = measure(KindConnector._parse_company_table, document, args.repeat)
+    print(f"rows={args.rows} bytes={len(document.encode('utf-8'))}")
+    print(f"legacy  {legacy_seconds * 1000:8.1f} ms  peak={legacy_peak / 1024:8.1f} KiB")
+    print(f"current {current_seconds * 1000:8.1f} ms  peak={current_peak / 1024:8.1f} KiB")
+    print(f"speedup {legacy_seconds / current_seconds:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
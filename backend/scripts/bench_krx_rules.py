@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.quality.rules.krx import _is_numeric_like, _is_placeholder, _scan_out_block
+
+
+def legacy_row_counts(out_block: list, requested_bas_dd: str) -> tuple[int, int, int]:
+    # Previous implementation of the row-level checks, kept here as the benchmark baseline.
+    mismatch_count = 0
+    if requested_bas_dd:
+        for row in out_block:
+            if not isinstance(row, dict):
+                continue
+            row_bas_dd = str(row.get("BAS_DD", "")).strip()
+            if row_bas_dd and row_bas_dd != requested_bas_dd:
+                mismatch_count += 1
+
+    isu_codes: list[str] = []
+    for row in out_block:
+        if isinstance(row, dict):
+            value = row.get("ISU_CD")
+            if isinstance(value, str) and value.strip():
+                isu_codes.append(value.strip())
+    duplicate_count = len(isu_codes) - len(set(isu_codes))
+
+    numeric_keys = {"TDD_CLSPRC", "CMPPREVDD_PRC", "FLUC_RT", "LIST_SHRS", "ACC_TRDVOL", "ACC_TRDVAL"}
+    invalid_numeric_fields = 0
+    for row in out_block:
+        if not isinstance(row, dict):
+            continue
+        for key in numeric_keys:
+            if key not in row:
+                continue
+            value = row.get(key)
+            if _is_placeholder(value):
+                continue
+            if not _is_numeric_like(value):
+                invalid_numeric_fields += 1
+    return mismatch_count, duplicate_count, invalid_numeric_fields
+
+
+def build_payload(rows: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    out_block = []
+    for index in range(rows):
+        price = rng.randrange(500, 900_000, 5)
+        out_block.append(
+            {
+                "BAS_DD": "20250131" if index % 500 else "20250130",
+                "ISU_CD": f"KR7{index % (rows - 3):06d}003",
+                "ISU_NM": f"종목{index}",
+                "MKT_NM": "KOSPI",
+                "TDD_CLSPRC": str(price),
+                "CMPPREVDD_PRC": str(rng.randrange(-2000, 2000, 5)),
+                "FLUC_RT": f"{rng.uniform(-30, 30):.2f}",
+                "LIST_SHRS": str(rng.randrange(1_000_000, 900_000_000)),
+                "ACC_TRDVOL": str(rng.randrange(0, 5_000_000)) if index % 700 else "-",
+                "ACC_TRDVAL": str(rng.randrange(0, 90_000_000_000)) if index % 900 else "n/a",
+            }
+        )
+    return {
+        "dataset_key": "openapi.stock.sto.stk_bydd_trd",
+        "required_params": {"basDd": "required"},
+        "request_params": {"basDd": "20250131"},
+        "response": {"OutBlock_1": out_block},
+    }
+
+
+def measure(scan: Callable[[list, str], tuple[int, int, int]], out_block: list, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        scan(out_block, "20250131")
+    return (time.perf_counter() - started) / repeat
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare single-pass KRX OutBlock_1 checks with the three-pass rules.")
+    parser.add_argument("--rows", type=int, default=2800, help="rows in the synthetic sto/stk_bydd_trd block")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    out_block = build_payload(args.rows, args.seed)["response"]["OutBlock_1"]
+    counts = _scan_out_block(out_block, "20250131")
+    if legacy_row_counts(out_block, "20250131") != counts:
+        print("rule output mismatch")
+        return 1
+
+    legacy_seconds = measure(legacy_row_counts, out_block, args.repeat)
+    current_seconds = measure(_scan_out_block, out_block, args.repeat)
+    print(f"rows={args.rows} mismatched_bas_dd={counts[0]} duplicate_isu_cd={counts[1]} invalid_numeric={counts[2]}")
+    print(f"legacy  {legacy_seconds * 1000:8.2f} ms")
+    print(f"current {current_seconds * 1000:8.2f} ms")
+    print(f"speedup {legacy_seconds / current_seconds:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
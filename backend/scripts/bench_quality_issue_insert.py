@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.db.base import Base
+from app.models import DataQualityIssue, DataQualityIssueAggregate, DataQualityIssueOccurrence
+from app.quality.types import QualityIssue
+from app.services.quality_log_service import save_quality_issues
+
+_TABLES = [DataQualityIssue.__table__, DataQualityIssueAggregate.__table__, DataQualityIssueOccurrence.__table__]
+
+
+def legacy_save_quality_issues(session: Session, issues: list[QualityIssue], *, batch_id: str | None) -> None:
+    # Previous implementation, kept here as the benchmark baseline: one data_quality_issue row per occurrence.
+    rows = [
+        {
+            "source": issue.source,
+            "rule_code": issue.rule_code,
+            "severity": issue.severity,
+            "entity_type": issue.entity_type,
+            "entity_key": issue.entity_key,
+            "message": issue.message,
+            "batch_id": batch_id,
+        }
+        for issue in issues
+    ]
+    for start in range(0, len(rows), 1000):
+        session.execute(insert(DataQualityIssue.__table__), rows[start : start + 1000])
+
+
+def legacy_issue_listing(session: Session) -> int:
+    return len(session.execute(select(DataQualityIssue).where(DataQualityIssue.source == "KRX")).all())
+
+
+def aggregated_issue_listing(session: Session) -> int:
+    aggregate = DataQualityIssueAggregate
+    return len(session.execute(select(aggregate).where(aggregate.source == "KRX")).all())
+
+
+def build_issues(count: int) -> list[QualityIssue]:
+    return [
+        QualityIssue(
+            source="KRX",
+            rule_code="KRX_NUMERIC_FIELD_INVALID",
+            severity="WARN",
+            entity_type="dataset",
+            entity_key=f"sto/stk_bydd_trd:{index:06d}",
+            message=f"row {index} TDD_CLSPRC is not numeric",
+        )
+        for index in range(count)
+    ]
+
+
+def measure(
+    database_url: str,
+    save: Callable[..., object],
+    listing: Callable[[Session], int],
+    issues: list[QualityIssue],
+    runs: int,
+) -> tuple[float, float, int]:
+    # The same issues recur every run, as they do between hourly refreshes.
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine, tables=_TABLES)
+    Base.metadata.create_all(engine, tables=_TABLES)
+    with Session(engine) as session:
+        started = time.perf_counter()
+        for run in range(runs):
+            save(session, issues, batch_id=f"bench-{run}")
+            session.commit()
+        write_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        listing(session)
+        read_seconds = time.perf_counter() - started
+        stored = sum(session.execute(select(func.count()).select_from(table)).scalar_one() for table in _TABLES)
+    engine.dispose()
+    return write_seconds, read_seconds, stored
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare per-occurrence and aggregated quality issue storage.")
+    parser.add_argument("--issues", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=24, help="gate runs that report the same issues")
+    parser.add_argument(
+        "--database-url",
+        default="sqlite+pysqlite:///:memory:",
+        help="the quality issue tables at this URL are dropped and recreated",
+    )
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    issues = build_issues(args.issues)
+    legacy = measure(args.database_url, legacy_save_quality_issues, legacy_issue_listing, issues, args.runs)
+    aggregated = measure(args.database_url, save_quality_issues, aggregated_issue_listing, issues, args.runs)
+    print(f"issues={args.issues} runs={args.runs}")
+    for label, (write_seconds, read_seconds, stored) in (("legacy", legacy), ("aggregated", aggregated)):
+        print(
+            f"{label:<10} write {write_seconds * 1000:9.1f} ms"
+            f"  issue listing {read_seconds * 1000:8.1f} ms  rows {stored}"
+        )
+    print(f"rows ratio {legacy[2] / aggregated[2]:.1f}x  listing speedup {legacy[1] / aggregated[1]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.db.url import normalize_database_url
+from app.etl.raw_ingest import RawPayloadArchive
+from app.etl.replay import list_captured_batches, replay_batches
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Re-run captured pipeline batches offline against the current rules.")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="database holding the raw archive")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, help="first capture date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, help="last capture date (YYYY-MM-DD)")
+    parser.add_argument("--batch-id", action="append", default=[], help="replay a specific batch; repeatable")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if not args.batch_id and not args.start:
+        print("pass --batch-id or --from/--to")
+        return 2
+
+    engine = create_engine(normalize_database_url(args.database_url, default="sqlite:///./anti_gravity.db"), future=True)
+    with Session(engine) as session:
+        batch_ids = list(args.batch_id)
+        if args.start:
+            batch_ids.extend(list_captured_batches(session, args.start, args.end or date.today()))
+        archive = RawPayloadArchive.from_env(session)
+        results = replay_batches(archive, dict.fromkeys(batch_ids))
+
+    rule_totals: Counter[str] = Counter()
+    for result in results:
+        if result.error:
+            print(f"{result.batch_id} error={result.error}")
+            continue
+        rule_totals.update(result.issues_by_rule)
+        print(f"{result.batch_id} published={result.published} issues={result.issue_count}")
+    print(
+        "batches=",
+        len(results),
+        "blocked=",
+        sum(1 for result in results if not result.published and not result.error),
+        "errors=",
+        sum(1 for result in results if result.error),
+    )
+    print("issues_by_rule=", dict(rule_totals))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import sys
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -16,8 +16,8 @@ from app.connectors.dart_connector import DartConnector
 from app.connectors.kind_connector import KindConnector
 from app.connectors.krx_connector import KrxAuthError, KrxConnector
 from app.etl.pipeline import run_pipeline
+from app.etl.replay import capture_bundle_safely
 from app.jobs.tasks import run_quality_summary_job
-from app.models.quality import DataQualityIssue
 
 
 def load_env_from_repo_root() -> dict[str, str]:
@@ -129,16 +129,12 @@ def main() -> int:
     }
 
     with Session(engine) as session:
+        raw_archive = capture_bundle_safely(session, bundle)
         result = run_pipeline(session, bundle)
         summary_rows = run_quality_summary_job(session, datetime.now().date().isoformat())
-        batch_issues = (
-            session.execute(select(DataQualityIssue).where(DataQualityIssue.batch_id == batch_id))
-            .scalars()
-            .all()
-        )
 
     severity_counts: dict[str, int] = {}
-    for issue in batch_issues:
+    for issue in result.issues:
         severity_counts[issue.severity] = severity_counts.get(issue.severity, 0) + 1
 
     print("pipeline_batch_id=", batch_id)
@@ -146,7 +142,8 @@ def main() -> int:
     print("kind_rows=", len(kind_rows), "kind_error=", kind_error)
     print("dart_rows=", len(dart_rows), "dart_error=", dart_error)
     print("krx_status=", krx_status)
-    print("issues_total=", len(batch_issues), "severity=", severity_counts)
+    print("raw_archive=", raw_archive)
+    print("issues_total=", len(result.issues), "severity=", severity_counts)
     print("daily_summary_sources=", summary_rows)
     return 0
 
@@ -19,3 +19,18 @@ def test_company_financials_api() -> None:
     body = response.json()
     assert body["corp_code"] == "00126380"
     assert "financials" in body
+
+
+def test_company_disclosures_api() -> None:
+    client = TestClient(app)
+    response = client.get("/api/v1/company/00126380/disclosures")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["corp_code"] == "00126380"
+    assert body["total"] == len(body["items"])
+
+
+def test_company_disclosures_api_rejects_unbounded_limit() -> None:
+    client = TestClient(app)
+    response = client.get("/api/v1/company/00126380/disclosures", params={"limit": 100000})
+    assert response.status_code == 422
@@ -1,6 +1,50 @@
+from datetime import date, datetime
+
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from app.api.endpoints import quality
+from app.db.base import Base
 from app.main import app
+from app.models.quality import DataQualityIssueAggregate, DataQualityIssueOccurrence
+
+
+@pytest.fixture
+def issue_history(monkeypatch: pytest.MonkeyPatch) -> None:
+    # KRX_EMPTY_DATA seen in January and March only.
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:", future=True, poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        aggregate = DataQualityIssueAggregate(
+            source="KRX",
+            rule_code="KRX_EMPTY_DATA",
+            severity="WARN",
+            entity_type="dataset",
+            entity_key="sto/stk_bydd_trd",
+            message="empty OutBlock_1",
+            first_seen=datetime(2026, 1, 10, 9, 0),
+            last_seen=datetime(2026, 3, 10, 9, 0),
+            occurrence_count=2,
+        )
+        session.add(aggregate)
+        session.flush()
+        for day in (date(2026, 1, 10), date(2026, 3, 10)):
+            session.add(
+                DataQualityIssueOccurrence(
+                    aggregate_id=aggregate.id,
+                    observed_date=day,
+                    severity="WARN",
+                    occurrence_count=1,
+                    last_seen=datetime.combine(day, datetime.min.time()),
+                )
+            )
+        session.commit()
+    monkeypatch.setattr(quality, "SessionLocal", sessionmaker(bind=engine))
 
 
 def test_quality_summary_api_returns_source_counts() -> None:
@@ -58,3 +102,12 @@ def test_quality_rules_api_filters_by_source_and_severity() -> None:
     for row in body["items"]:
         assert row["source"] == "KRX"
         assert row["severity"] == "FAIL"
+
+
+def test_quality_issues_date_range_needs_an_occurrence_inside_it(issue_history: None) -> None:
+    client = TestClient(app)
+    february = client.get("/api/v1/quality/issues", params={"from": "2026-02-01", "to": "2026-02-28"}).json()
+    march = client.get("/api/v1/quality/issues", params={"from": "2026-03-01", "to": "2026-03-31"}).json()
+    assert february["total"] == 0
+    assert march["total"] == 1
+    assert march["items"][0]["occurrence_count"] == 2
@@ -1,4 +1,7 @@
+import io
 import os
+import zipfile
+from collections.abc import Callable
 
 import pytest
 from sqlalchemy import create_engine
@@ -13,3 +16,25 @@ def db_engine() -> Engine:
         yield engine
     finally:
         engine.dispose()
+
+
+def _build_corp_code_zip(count: int) -> bytes:
+    items = "".join(
+        "<list>"
+        f"<corp_code>{index:08d}</corp_code>"
+        f"<corp_name>회사{index}</corp_name>"
+        f"<corp_eng_name>Company {index}</corp_eng_name>"
+        f"<stock_code>{'%06d' % index if index % 2 else ' '}</stock_code>"
+        "<modify_date>20260214</modify_date>"
+        "</list>"
+        for index in range(1, count + 1)
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("CORPCODE.xml", f'<?xml version="1.0" encoding="UTF-8"?><result>{items}</result>')
+    return buffer.getvalue()
+
+
+@pytest.fixture()
+def corp_code_zip() -> Callable[[int], bytes]:
+    return _build_corp_code_zip
@@ -3,7 +3,9 @@ from pathlib import Path
 
 import pytest
 
-from app.connectors.dart_connector import DartApiError, DartConnector
+from app.connectors.bulk_file_store import BulkFileStore
+from app.connectors.dart_connector import DartApiError, DartConnector, DartRateLimitError
+from app.connectors.http_client import ConditionalResponse
 
 
 FIXTURE_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "dart"
@@ -76,3 +78,96 @@ def test_fetch_estk_rs_returns_payload(mock_dart: DartConnector) -> None:
 def test_fetch_document_zip_returns_bytes(mock_dart: DartConnector) -> None:
     payload = mock_dart.fetch_document_zip("20260214000001")
     assert payload.startswith(b"PK")
+
+
+class ConditionalHttpClient:
+    def __init__(self, payload: bytes = b"PK\x03\x04corpcodes") -> None:
+        self.payload = payload
+        self.conditional_calls: list[tuple[str | None, str | None]] = []
+
+    def get_conditional(
+        self,
+        url: str,
+        params: dict,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> ConditionalResponse:
+        self.conditional_calls.append((etag, last_modified))
+        if etag == '"v1"':
+            return ConditionalResponse(not_modified=True, body=b"", etag=etag, last_modified=last_modified)
+        return ConditionalResponse(not_modified=False, body=self.payload, etag='"v1"', last_modified=None)
+
+
+def test_fetch_corp_codes_revalidates_with_stored_etag(tmp_path: Path) -> None:
+    http_client = ConditionalHttpClient()
+    store = BulkFileStore(tmp_path)
+    dart = DartConnector(api_key="test-key", http_client=http_client, bulk_store=store)
+
+    first = dart.fetch_corp_codes()
+    second = dart.fetch_corp_codes()
+
+    assert first.changed is True
+    assert second.changed is False
+    assert second.not_modified is True
+    assert second.payload == first.payload
+    assert second.bytes_saved == len(first.payload)
+    assert http_client.conditional_calls == [(None, None), ('"v1"', None)]
+    assert store.metrics()["bytes_saved"] == len(first.payload)
+
+
+def test_fetch_corp_codes_keeps_archive_on_error_body(tmp_path: Path) -> None:
+    store = BulkFileStore(tmp_path)
+    DartConnector(api_key="test-key", http_client=ConditionalHttpClient(), bulk_store=store).fetch_corp_codes()
+
+    stored = store.load("corpCode.zip")
+    store.save("corpCode.zip", stored.payload, etag=None, last_modified=None)
+    error_client = ConditionalHttpClient(payload=b"<result><status>020</status></result>")
+
+    result = DartConnector(api_key="test-key", http_client=error_client, bulk_store=store).fetch_corp_codes()
+
+    assert result.payload.startswith(b"<result>")
+    assert store.load("corpCode.zip").payload.startswith(b"PK")
+
+
+def test_fetch_document_is_served_locally_once_stored(tmp_path: Path) -> None:
+    http_client = ConditionalHttpClient()
+    dart = DartConnector(api_key="test-key", http_client=http_client, bulk_store=BulkFileStore(tmp_path))
+
+    first = dart.fetch_document("20260214000001")
+    second = dart.fetch_document("20260214000001")
+
+    assert second.payload == first.payload
+    assert second.changed is False
+    assert len(http_client.conditional_calls) == 1
+
+
+def test_fetch_list_page_supports_market_wide_query(mock_dart: DartConnector) -> None:
+    response = mock_dart.fetch_list_page(bgn_de="20250101", end_de="20250331", pblntf_ty="C")
+    _, params = mock_dart.http_client.calls[0]  # type: ignore[attr-defined]
+    assert response["total_count"] == 1
+    assert "corp_code" not in params
+    assert params["pblntf_ty"] == "C"
+
+
+def test_fetch_list_raises_rate_limit_error_on_status_020() -> None:
+    class ThrottledHttpClient:
+        def get_json(self, url: str, params: dict) -> dict:
+            _ = (url, params)
+            return {"status": "020", "message": "요청 제한을 초과하였습니다."}
+
+    with pytest.raises(DartRateLimitError):
+        DartConnector(api_key="test-key", http_client=ThrottledHttpClient()).fetch_list("00126380")
+
+
+def test_payload_without_matching_meta_is_not_served(tmp_path: Path) -> None:
+    store = BulkFileStore(tmp_path)
+    store.save("corpCode.zip", b"PK-old", etag='"v1"', last_modified=None)
+    # A crash after the payload write but before the meta write.
+    (tmp_path / "corpCode.zip.bin").write_bytes(b"PK-new")
+
+    assert store.load("corpCode.zip") is None
+    store.save("corpCode.zip", b"PK-new", etag='"v2"', last_modified=None)
+    assert store.load("corpCode.zip").etag == '"v2"'
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["corpCode.zip.bin", "corpCode.zip.meta.json"]
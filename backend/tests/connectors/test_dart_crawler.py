@@ -0,0 +1,119 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.connectors.dart_connector import DartApiError, DartRateLimitError
+from app.connectors.dart_crawler import DartDisclosureCrawler, split_crawl_windows
+
+
+class FakeListConnector:
+    def __init__(
+        self,
+        total_page: int = 1,
+        fail_on: str | None = None,
+        rate_limited: int = 0,
+        fail_on_page: int | None = None,
+    ) -> None:
+        self.total_page = total_page
+        self.fail_on = fail_on
+        self.fail_on_page = fail_on_page
+        self.rate_limited = rate_limited
+        self.calls: list[dict] = []
+
+    async def fetch_list_page_async(self, page_no: int = 1, page_count: int = 100, **params: str | None) -> dict:
+        self.calls.append({"page_no": page_no, **params})
+        await asyncio.sleep(0)
+        if self.rate_limited:
+            self.rate_limited -= 1
+            raise DartRateLimitError("DART API status=020: 요청 제한을 초과하였습니다.")
+        if params["bgn_de"] == self.fail_on or page_no == self.fail_on_page:
+            raise DartApiError("DART API status=800: 시스템 점검")
+        return {
+            "status": "000",
+            "list": [{"rcept_no": f"{params['bgn_de']}-{page_no}"}],
+            "page_no": page_no,
+            "total_page": self.total_page,
+        }
+
+
+def test_split_crawl_windows_respects_market_wide_limit() -> None:
+    windows = split_crawl_windows("20250101", "20251231", 90)
+
+    assert len(windows) == 5
+    assert windows[0].key == "20250101-20250331"
+    assert windows[-1].end_de == "20251231"
+    assert split_crawl_windows("20250101", "20251231", None)[0].key == "20250101-20251231"
+
+
+def test_crawler_fetches_every_page_reported_by_total_page() -> None:
+    connector = FakeListConnector(total_page=3)
+
+    rows = asyncio.run(DartDisclosureCrawler(connector).crawl("20250101", "20251231", corp_code="00126380"))
+
+    assert [row["rcept_no"] for row in rows] == ["20250101-1", "20250101-2", "20250101-3"]
+    assert {call["corp_code"] for call in connector.calls} == {"00126380"}
+
+
+def test_crawler_splits_market_wide_query_by_pblntf_ty() -> None:
+    connector = FakeListConnector()
+
+    rows = asyncio.run(DartDisclosureCrawler(connector).crawl("20250101", "20251231", pblntf_ty="C"))
+
+    assert len(rows) == 5
+    assert all(call["corp_code"] is None and call["pblntf_ty"] == "C" for call in connector.calls)
+
+
+def test_crawler_retries_rate_limited_pages() -> None:
+    connector = FakeListConnector(rate_limited=2)
+
+    rows = asyncio.run(
+        DartDisclosureCrawler(connector, initial_backoff=0).crawl("20250101", "20250131", corp_code="00126380")
+    )
+
+    assert len(rows) == 1
+    assert len(connector.calls) == 3
+
+
+def test_crawler_resumes_from_checkpoint(tmp_path: Path) -> None:
+    checkpoint_path = tmp_path / "dart_crawl.json"
+
+    async def consume(connector: FakeListConnector) -> list[str]:
+        crawler = DartDisclosureCrawler(connector)
+        seen: list[str] = []
+        async for window, _ in crawler.iter_windows("20250101", "20251231", checkpoint_path=checkpoint_path):
+            seen.append(window.bgn_de)
+        return seen
+
+    with pytest.raises(DartApiError):
+        asyncio.run(consume(FakeListConnector(fail_on="20250630")))
+
+    resumed = asyncio.run(consume(FakeListConnector()))
+
+    assert resumed == ["20250630", "20250928", "20251227"]
+
+
+def test_corp_scoped_crawl_resumes_from_the_last_consumed_page(tmp_path: Path) -> None:
+    checkpoint_path = tmp_path / "dart_crawl.json"
+
+    async def consume(connector: FakeListConnector) -> list:
+        crawler = DartDisclosureCrawler(connector, pages_per_chunk=2)
+        rows: list = []
+        async for _, chunk in crawler.iter_windows(
+            "20250101", "20251231", corp_code="00126380", checkpoint_path=checkpoint_path
+        ):
+            rows.extend(chunk)
+        return rows
+
+    def crawl(connector: FakeListConnector) -> list:
+        return asyncio.run(consume(connector))
+
+    with pytest.raises(DartApiError):
+        crawl(FakeListConnector(total_page=6, fail_on_page=4))
+
+    connector = FakeListConnector(total_page=6)
+    rows = crawl(connector)
+
+    assert sorted(call["page_no"] for call in connector.calls) == [4, 5, 6]
+    assert [row["rcept_no"] for row in rows] == ["20250101-4", "20250101-5", "20250101-6"]
+    assert crawl(FakeListConnector(total_page=6)) == []
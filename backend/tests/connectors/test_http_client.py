@@ -0,0 +1,109 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+
+import pytest
+
+from app.connectors.http_client import ConnectionPool, HttpClient
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: object) -> None:
+        _ = (format, args)
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/json"):
+            self._reply(200, json.dumps({"peer": self.client_address[1]}).encode("utf-8"))
+        elif self.path.startswith("/login"):
+            self._reply(200, b"ok", {"Set-Cookie": "JSESSIONID=abc; Path=/"})
+        elif self.path.startswith("/whoami"):
+            self._reply(200, (self.headers.get("Cookie") or "").encode("utf-8"))
+        elif self.path.startswith("/archive"):
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._reply(304, b"")
+            else:
+                self._reply(200, b"PKzip", {"ETag": '"v1"', "Last-Modified": "Mon, 16 Feb 2026 00:00:00 GMT"})
+        elif self.path.startswith("/moved"):
+            self._reply(302, b"", {"Location": "/json"})
+        else:
+            self._reply(404, b'{"respMsg":"not found"}')
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0"))
+        self._reply(200, self.rfile.read(length))
+
+
+@pytest.fixture()
+def server_url() -> str:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_client_reuses_keep_alive_connection(server_url: str) -> None:
+    pool = ConnectionPool(max_per_host=2, idle_timeout=30)
+    client = HttpClient(pool=pool)
+
+    first = client.get_json(f"{server_url}/json", {})
+    second = client.get_json(f"{server_url}/json", {"page": 2})
+
+    assert first["peer"] == second["peer"]
+    assert pool.stats()["127.0.0.1"] == {"hits": 1, "misses": 1, "expired": 0}
+
+
+def test_http_client_drops_idle_connections_after_timeout(server_url: str) -> None:
+    pool = ConnectionPool(max_per_host=2, idle_timeout=0)
+    client = HttpClient(pool=pool)
+
+    client.get_json(f"{server_url}/json", {})
+    client.get_json(f"{server_url}/json", {})
+
+    assert pool.stats()["127.0.0.1"] == {"hits": 0, "misses": 2, "expired": 1}
+
+
+def test_http_client_keeps_cookies_and_follows_redirects(server_url: str) -> None:
+    client = HttpClient(pool=ConnectionPool())
+
+    client.get_text(f"{server_url}/login", {})
+    assert client.get_text(f"{server_url}/whoami", {}) == "JSESSIONID=abc"
+    assert "peer" in client.get_json(f"{server_url}/moved", {})
+    assert client.post_text(f"{server_url}/echo", {"bld": "x"}) == "bld=x"
+
+
+def test_http_client_raises_http_error_with_body(server_url: str) -> None:
+    client = HttpClient(pool=ConnectionPool())
+
+    with pytest.raises(HTTPError) as exc_info:
+        client.get_json(f"{server_url}/missing", {})
+
+    assert exc_info.value.code == 404
+    assert b"not found" in exc_info.value.read()
+
+
+def test_http_client_conditional_get_returns_not_modified(server_url: str) -> None:
+    client = HttpClient(pool=ConnectionPool())
+
+    first = client.get_conditional(f"{server_url}/archive", {})
+    second = client.get_conditional(f"{server_url}/archive", {}, etag=first.etag, last_modified=first.last_modified)
+
+    assert first.not_modified is False
+    assert first.body == b"PKzip"
+    assert first.etag == '"v1"'
+    assert second.not_modified is True
+    assert second.body == b""
@@ -1,6 +1,7 @@
+import asyncio
 from pathlib import Path
 
-from app.connectors.kind_connector import KindConnector
+from app.connectors.kind_connector import KindConnector, KindPagedFetch, KindRowCache
 
 
 LEGACY_FIXTURE_PATH = Path(__file__).resolve().parents[1] / "fixtures" / "kind" / "pubofrprogcom.html"
@@ -30,3 +31,126 @@ def test_parse_legacy_fixture_table() -> None:
     assert items
     assert items[0]["corp_name"] == "알파테크"
     assert items[0]["stage"] == "공모"
+
+
+def test_fetch_public_offering_companies_async_matches_sync() -> None:
+    connector = KindConnector(http_client=FakeKindClient())
+    items = asyncio.run(connector.fetch_public_offering_companies_async())
+    assert items == connector.fetch_public_offering_companies()
+
+
+def test_parse_company_table_cleans_markup_and_entities() -> None:
+    html = (
+        "<TABLE><TR><TH>회사명</TH></TR>"
+        "<TR><TD><a href='#'>베타&amp;코</a></TD><TD>코스피</TD><TD></TD>"
+        "<TD>2020-01-02</TD><TD>미래<br/>증권</TD></TR></TABLE>"
+    )
+    items = KindConnector._parse_company_table(html)
+    assert items == [
+        {
+            "corp_name": "베타&코",
+            "market": "코스피",
+            "stage": "listed",
+            "listing_date": "2020-01-02",
+            "lead_manager": "미래 증권",
+        }
+    ]
+
+
+class PagedKindClient:
+    def __init__(self, companies: list[tuple[str, str]]) -> None:
+        self.companies = companies
+        self.pages_requested: list[int] = []
+
+    def get_text(self, url: str, params: dict, headers: dict | None = None) -> str:
+        return "<html>main</html>"
+
+    def post_text(self, url: str, data: dict, headers: dict | None = None) -> str:
+        page_index, page_size = int(data["pageIndex"]), int(data["currentPageSize"])
+        self.pages_requested.append(page_index)
+        page = self.companies[(page_index - 1) * page_size : page_index * page_size]
+        rows = "".join(
+            f"<tr><td>{name}</td><td>KOSDAQ</td><td>공모</td><td>{listing_date}</td><td>미래증권</td></tr>"
+            for name, listing_date in page
+        )
+        return f"<table>{rows}</table>"
+
+
+def test_fetch_pages_in_parallel_until_short_page() -> None:
+    client = PagedKindClient([(f"회사{index}", "2026-03-15") for index in range(5)])
+    connector = KindConnector(http_client=client, row_cache=KindRowCache(), page_size=2, parallel_pages=2)
+
+    fetch = asyncio.run(connector.fetch_new_public_offering_companies_async(set()))
+
+    assert [row["corp_name"] for row in fetch.rows] == [f"회사{index}" for index in range(5)]
+    assert fetch.pages == 3
+    assert fetch.complete is True
+    assert sorted(client.pages_requested) == [1, 2, 3]
+
+
+def test_incremental_fetch_stops_at_first_known_row() -> None:
+    companies = [(f"회사{index}", "2026-03-15") for index in range(6)]
+    client = PagedKindClient(companies)
+    connector = KindConnector(http_client=client, row_cache=KindRowCache(), page_size=2, parallel_pages=1)
+    asyncio.run(connector.fetch_public_offering_companies_async())
+
+    client.companies = [("신규", "2026-04-01"), ("회사0", "2026-03-20")] + companies[1:]
+    client.pages_requested = []
+    known = connector.row_cache.known_fingerprints()
+    fetch = asyncio.run(connector.fetch_new_public_offering_companies_async(known))
+    rows = connector.row_cache.merge(fetch)
+
+    assert [row["corp_name"] for row in fetch.rows] == ["신규", "회사0"]
+    assert fetch.complete is False
+    assert client.pages_requested == [1, 2]
+    assert [row["corp_name"] for row in rows] == ["신규", "회사0", "회사1", "회사2", "회사3", "회사4", "회사5"]
+    assert rows[1]["listing_date"] == "2026-03-20"
+
+
+def test_row_cache_forces_full_walk_after_resync_interval() -> None:
+    cache = KindRowCache(full_resync_seconds=0)
+    connector = KindConnector(http_client=PagedKindClient([("회사0", "2026-03-15")]), row_cache=cache)
+    connector.fetch_public_offering_companies()
+
+    assert cache.known_fingerprints() == set()
+
+
+def test_changed_stage_is_picked_up_by_the_incremental_walk() -> None:
+    client = PagedKindClient([(f"회사{index}", "2026-03-15") for index in range(4)])
+    connector = KindConnector(http_client=client, row_cache=KindRowCache(), page_size=2, parallel_pages=1)
+    connector.fetch_public_offering_companies()
+
+    original = client.post_text
+    client.post_text = lambda url, data, headers=None: original(url, data, headers).replace(
+        "<td>회사0</td><td>KOSDAQ</td><td>공모</td>", "<td>회사0</td><td>KOSDAQ</td><td>신규상장</td>"
+    )
+    rows = connector.fetch_public_offering_companies()
+
+    assert rows[0]["stage"] == "신규상장"
+    assert len(rows) == 4
+
+
+def test_cached_prelisting_row_turns_listed_once_its_date_passes() -> None:
+    cache = KindRowCache()
+    row = {
+        "corp_name": "알파테크",
+        "market": "KOSDAQ",
+        "stage": "prelisting",
+        "listing_date": "2020-01-02",
+        "lead_manager": "",
+    }
+    rows = cache.merge(KindPagedFetch(rows=[row], pages=1, complete=True))
+
+    assert rows[0]["stage"] == "listed"
+
+
+def test_walk_capped_at_max_pages_still_enables_incremental_fetches() -> None:
+    client = PagedKindClient([(f"회사{index}", "2026-03-15") for index in range(10)])
+    connector = KindConnector(http_client=client, row_cache=KindRowCache(), page_size=2, parallel_pages=1)
+    connector.max_pages = 2
+    connector.fetch_public_offering_companies()
+    client.pages_requested = []
+    connector.fetch_public_offering_companies()
+
+    assert connector.row_cache.known_fingerprints()
+    assert client.pages_requested == [1]
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import io
 from pathlib import Path
@@ -8,6 +9,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
 from app.connectors.krx_connector import KrxAccessDeniedError, KrxAuthError, KrxConnector
+from app.connectors.session_manager import SessionManager
 from app.db.base import Base
 from app.models.snapshot import DatasetRegistry
 from app.services.dataset_registry_service import DatasetRegistryService
@@ -23,8 +25,11 @@ class FakeKrxClient:
         self.last_url: str | None = None
         self.last_data: dict | None = None
         self.last_headers: dict[str, str] | None = None
+        self.preflight_count = 0
+        self.expired_posts = 0
 
     def get_text(self, url: str, params: dict, headers: dict[str, str] | None = None) -> str:
+        self.preflight_count += 1
         self.preflight_url = url
         self.preflight_headers = headers
         return "ok"
@@ -33,6 +38,9 @@ class FakeKrxClient:
         self.last_url = url
         self.last_data = data
         self.last_headers = headers
+        if self.expired_posts:
+            self.expired_posts -= 1
+            raise ValueError("session expired: LOGOUT page instead of JSON")
         return json.loads(FIXTURE_PATH.read_text(encoding="utf-8"))
 
 
@@ -142,3 +150,40 @@ def test_krx_open_api_access_denied_maps_to_access_denied_error() -> None:
 
     with pytest.raises(KrxAccessDeniedError, match="Access Denied"):
         connector.fetch_open_api("sto/stk_isu_base_info", {"basDd": "20250131"})
+
+
+def test_krx_open_api_async_uses_same_request_shape() -> None:
+    fake_http = FakeOpenApiClient()
+    connector = KrxConnector(http_client=fake_http, api_key="sample-key")
+
+    data = asyncio.run(connector.fetch_open_api_async("sto/stk_isu_base_info", {"basDd": "20250131"}))
+
+    assert "OutBlock_1" in data
+    assert fake_http.last_url == "https://data-dbg.krx.co.kr/svc/apis/sto/stk_isu_base_info"
+    assert fake_http.last_headers is not None
+    assert fake_http.last_headers["AUTH_KEY"] == "sample-key"
+
+
+def test_krx_open_api_async_maps_access_denied_error() -> None:
+    connector = KrxConnector(http_client=AccessDeniedOpenApiClient(), api_key="bad-key")
+
+    with pytest.raises(KrxAccessDeniedError, match="Access Denied"):
+        asyncio.run(connector.fetch_open_api_async("sto/stk_isu_base_info", {"basDd": "20250131"}))
+
+
+def test_krx_connector_reuses_primed_session_and_reprimes_on_expiry() -> None:
+    fake_http = FakeKrxClient()
+    session = SessionManager(ttl_seconds=600)
+    first = KrxConnector(http_client=fake_http, session=session)
+    second = KrxConnector(http_client=fake_http, session=session)
+
+    first.fetch_dataset("dbms/MDC/STAT/standard/MDCSTAT01501", {"trdDd": "20260213"})
+    second.fetch_dataset("dbms/MDC/STAT/standard/MDCSTAT01501", {"trdDd": "20260214"})
+    assert fake_http.preflight_count == 1
+
+    fake_http.expired_posts = 1
+    data = second.fetch_dataset("dbms/MDC/STAT/standard/MDCSTAT01501", {"trdDd": "20260215"})
+
+    assert "OutBlock_1" in data
+    assert fake_http.preflight_count == 2
+    assert session.metrics()["reprimes"] == 1
@@ -0,0 +1,136 @@
+import asyncio
+import io
+import threading
+import time
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from app.connectors.krx_connector import KrxAccessDeniedError, KrxConnector, KrxRequestError
+from app.connectors.rate_limit import AdaptiveConcurrencyLimiter, SourceRateLimiter, TokenBucket
+
+
+def test_token_bucket_paces_requests_after_burst() -> None:
+    bucket = TokenBucket(rate_per_second=20.0, burst=1)
+
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.09
+    assert bucket.acquired == 3
+
+
+def test_adaptive_concurrency_backs_off_and_ramps_up() -> None:
+    limiter = AdaptiveConcurrencyLimiter(8, min_limit=1, max_limit=8)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 4
+
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(throttled=False)
+    assert limiter.limit > 4
+    assert limiter.throttled == 1
+    assert limiter.successes == 20
+
+
+def test_adaptive_concurrency_caps_in_flight_async() -> None:
+    limiter = AdaptiveConcurrencyLimiter(2, max_limit=2)
+    peak = {"now": 0, "max": 0}
+
+    async def worker() -> None:
+        await limiter.acquire_async()
+        peak["now"] += 1
+        peak["max"] = max(peak["max"], peak["now"])
+        await asyncio.sleep(0.02)
+        peak["now"] -= 1
+        limiter.release(throttled=False)
+
+    async def run_all() -> None:
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+    asyncio.run(run_all())
+    assert peak["max"] == 2
+
+
+def test_krx_connector_reports_throttle_to_shared_limiter() -> None:
+    class ThrottledClient:
+        def get_json(self, url: str, params: dict, headers: dict[str, str] | None = None) -> dict:
+            body = io.BytesIO(b"<html><title>Access Denied</title></html>")
+            raise HTTPError(url=url, code=403, msg="Forbidden", hdrs=None, fp=body)
+
+    limiter = SourceRateLimiter(rate_per_second=100.0, burst=10, initial_concurrency=4, max_concurrency=8)
+    first = KrxConnector(http_client=ThrottledClient(), api_key="key", rate_limiter=limiter)
+    second = KrxConnector(http_client=ThrottledClient(), api_key="key", rate_limiter=limiter)
+
+    for connector in (first, second):
+        with pytest.raises(KrxAccessDeniedError):
+            connector.fetch_open_api("sto/stk_bydd_trd", {"basDd": "20250131"})
+
+    metrics = limiter.metrics()
+    assert metrics["throttled"] == 2
+    assert metrics["concurrency_limit"] == 1
+    assert metrics["in_flight"] == 0
+
+
+def test_connection_errors_inside_a_slot_count_as_throttled() -> None:
+    class ResetClient:
+        def get_json(self, url: str, params: dict, headers: dict[str, str] | None = None) -> dict:
+            raise URLError(ConnectionResetError("connection reset by peer"))
+
+    limiter = SourceRateLimiter(rate_per_second=100.0, burst=10, initial_concurrency=4, max_concurrency=8)
+    connector = KrxConnector(http_client=ResetClient(), api_key="key", rate_limiter=limiter)
+
+    with pytest.raises(URLError):
+        connector.fetch_open_api("sto/stk_bydd_trd", {"basDd": "20250131"})
+    with pytest.raises(URLError):
+        asyncio.run(connector.fetch_open_api_async("sto/stk_bydd_trd", {"basDd": "20250131"}))
+
+    metrics = limiter.metrics()
+    assert metrics["throttled"] == 2
+    assert metrics["successes"] == 0
+    assert metrics["in_flight"] == 0
+
+
+def test_async_waiter_is_woken_by_release_from_another_thread() -> None:
+    limiter = AdaptiveConcurrencyLimiter(1, max_limit=1)
+    limiter.acquire()
+
+    async def wait_for_slot() -> float:
+        started = time.monotonic()
+        await limiter.acquire_async()
+        return time.monotonic() - started
+
+    timer = threading.Timer(0.05, limiter.release, kwargs={"throttled": False})
+    timer.start()
+    waited = asyncio.run(wait_for_slot())
+    timer.join()
+
+    assert 0.04 <= waited < 1.0
+    assert limiter.in_flight == 1
+
+
+def test_client_errors_do_not_shrink_the_shared_limit() -> None:
+    class BadPathClient:
+        def __init__(self, code: int) -> None:
+            self.code = code
+
+        def get_json(self, url: str, params: dict, headers: dict[str, str] | None = None) -> dict:
+            raise HTTPError(url=url, code=self.code, msg="error", hdrs=None, fp=io.BytesIO(b"{}"))
+
+    limiter = SourceRateLimiter(rate_per_second=100.0, burst=10, initial_concurrency=4, max_concurrency=8)
+    for code in (400, 404):
+        with pytest.raises(KrxRequestError):
+            KrxConnector(http_client=BadPathClient(code), api_key="key", rate_limiter=limiter).fetch_open_api(
+                "sto/unknown", {"basDd": "20250131"}
+            )
+    with pytest.raises(ValueError):
+        with limiter.slot():
+            raise ValueError("Expecting value: line 1 column 1")
+
+    metrics = limiter.metrics()
+    assert metrics["throttled"] == 0
+    assert metrics["concurrency_limit"] == 4
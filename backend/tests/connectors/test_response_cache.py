@@ -0,0 +1,97 @@
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from app.connectors.krx_connector import KrxConnector
+from app.connectors.rate_limit import SourceRateLimiter
+from app.connectors.response_cache import KRX_TIMEZONE, ResponseCache, build_cache_key, resolve_bas_dd_ttl
+
+
+class CountingOpenApiClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_json(self, url: str, params: dict, headers: dict[str, str] | None = None) -> dict:
+        self.calls += 1
+        return {"OutBlock_1": [{"BAS_DD": params["basDd"], "ISU_CD": "KR7005930003"}]}
+
+
+def _connector(client: CountingOpenApiClient, cache: ResponseCache) -> KrxConnector:
+    limiter = SourceRateLimiter(rate_per_second=100.0, burst=10, initial_concurrency=4, max_concurrency=8)
+    return KrxConnector(http_client=client, api_key="key", rate_limiter=limiter, response_cache=cache)
+
+
+def test_past_bas_dd_is_served_from_cache(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    client = CountingOpenApiClient()
+    connector = _connector(client, cache)
+
+    first = connector.fetch_open_api("sto/stk_bydd_trd", {"basDd": "20250131"})
+    second = _connector(client, cache).fetch_open_api("sto/stk_bydd_trd", {"basDd": "20250131"})
+
+    assert first == second
+    assert client.calls == 1
+    assert cache.metrics()["hits"] == 1
+    assert cache.metrics()["hit_ratio"] == 0.5
+
+
+def test_different_params_use_different_keys() -> None:
+    assert build_cache_key("sto/stk_bydd_trd", {"basDd": "20250131"}) != build_cache_key(
+        "sto/stk_bydd_trd", {"basDd": "20250203"}
+    )
+    assert build_cache_key("idx/kospi_dd_trd", {"basDd": "20250131"}) != build_cache_key(
+        "sto/stk_bydd_trd", {"basDd": "20250131"}
+    )
+
+
+def test_ttl_is_immutable_for_closed_days_and_short_for_today() -> None:
+    assert resolve_bas_dd_ttl({"basDd": "20250130"}, today_ttl=300, today="20250131") is None
+    assert resolve_bas_dd_ttl({"basDd": "20250131"}, today_ttl=300, today="20250131") == 300
+    assert resolve_bas_dd_ttl({}, today_ttl=300, today="20250131") == 300
+
+
+def test_empty_block_for_closed_day_is_not_cached_forever(tmp_path: Path) -> None:
+    assert resolve_bas_dd_ttl({"basDd": "20250130"}, today_ttl=300, today="20250131", has_rows=False) == 300
+
+    cache = ResponseCache(tmp_path)
+    client = CountingOpenApiClient()
+    connector = _connector(client, cache)
+    connector.cache_today_ttl = -1
+    key = build_cache_key("sto/stk_bydd_trd", {"basDd": "20250130"})
+    connector._store_open_api(key, {"basDd": "20250130"}, {"OutBlock_1": []})
+
+    # The empty entry expires on the short TTL, so the published rows are fetched and then kept.
+    assert connector.fetch_open_api("sto/stk_bydd_trd", {"basDd": "20250130"})["OutBlock_1"]
+    assert client.calls == 1
+
+
+def test_expired_entry_is_refetched(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    cache.put("abc", {"OutBlock_1": []}, ttl_seconds=-1)
+
+    assert cache.get("abc") is None
+    assert cache.metrics()["misses"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    payload = {"OutBlock_1": [{"ISU_CD": "X" * 40}]}
+    cache.put("aa-old", payload, ttl_seconds=None)
+    cache.put("bb-new", payload, ttl_seconds=None)
+    old_path = tmp_path / "aa" / "aa-old.json"
+    cache.max_bytes = old_path.stat().st_size * 2 + 10
+    stale = time.time() - 60
+    os.utime(old_path, (stale, stale))
+
+    cache.put("cc-newest", payload, ttl_seconds=None)
+
+    assert cache.get("aa-old") is None
+    assert cache.get("cc-newest") == payload
+    assert cache.metrics()["evictions"] >= 1
+
+
+def test_today_is_the_seoul_trading_date() -> None:
+    seoul_today = datetime.now(KRX_TIMEZONE).strftime("%Y%m%d")
+
+    assert resolve_bas_dd_ttl({"basDd": seoul_today}, today_ttl=300) == 300
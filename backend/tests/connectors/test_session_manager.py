@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+from http.cookiejar import Cookie, CookieJar
+
+import pytest
+
+from app.connectors.http_client import HttpClient
+from app.connectors.session_manager import SessionManager
+
+
+def _cookie(expires: int | None) -> Cookie:
+    return Cookie(
+        version=0,
+        name="JSESSIONID",
+        value="abc",
+        port=None,
+        port_specified=False,
+        domain="data.krx.co.kr",
+        domain_specified=True,
+        domain_initial_dot=False,
+        path="/",
+        path_specified=True,
+        secure=False,
+        expires=expires,
+        discard=expires is None,
+        comment=None,
+        comment_url=None,
+        rest={},
+    )
+
+
+def test_session_manager_primes_once_per_cookie_jar() -> None:
+    manager = SessionManager(ttl_seconds=600)
+    client = HttpClient()
+    primes: list[int] = []
+
+    for _ in range(3):
+        manager.ensure_primed(client, lambda: primes.append(1))
+    manager.ensure_primed(HttpClient(), lambda: primes.append(2))
+
+    assert primes == [1, 2]
+    assert manager.metrics() == {"primes": 2, "reuses": 2, "reprimes": 0}
+
+
+def test_session_manager_reprimes_after_invalidate_and_cookie_expiry() -> None:
+    manager = SessionManager(ttl_seconds=600)
+    jar = CookieJar()
+    client = HttpClient(cookie_jar=jar)
+    primes: list[int] = []
+
+    manager.ensure_primed(client, lambda: primes.append(1))
+    manager.invalidate(client)
+    manager.ensure_primed(client, lambda: jar.set_cookie(_cookie(int(time.time()) - 1)))
+    manager.ensure_primed(client, lambda: primes.append(3))
+
+    assert primes == [1, 3]
+    assert manager.metrics()["reprimes"] == 1
+
+
+def test_session_manager_primes_once_for_concurrent_async_callers() -> None:
+    manager = SessionManager(ttl_seconds=600)
+    client = HttpClient()
+    primes: list[int] = []
+
+    def prime() -> None:
+        time.sleep(0.01)
+        primes.append(1)
+
+    async def run() -> None:
+        await asyncio.gather(*(manager.ensure_primed_async(client, prime) for _ in range(5)))
+
+    asyncio.run(run())
+
+    assert primes == [1]
+
+
+def test_slow_prime_does_not_block_other_clients() -> None:
+    manager = SessionManager(ttl_seconds=600)
+    slow_client, fast_client = HttpClient(), HttpClient()
+    release = threading.Event()
+
+    slow = threading.Thread(target=manager.ensure_primed, args=(slow_client, release.wait))
+    slow.start()
+    started = time.monotonic()
+    manager.ensure_primed(fast_client, lambda: None)
+    elapsed = time.monotonic() - started
+    release.set()
+    slow.join()
+
+    assert elapsed < 0.5
+    assert manager.metrics()["primes"] == 2
+
+
+def test_failed_prime_lets_a_waiting_caller_retry() -> None:
+    manager = SessionManager(ttl_seconds=600)
+    client = HttpClient()
+    attempts: list[int] = []
+
+    def flaky_prime() -> None:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        manager.ensure_primed(client, flaky_prime)
+    manager.ensure_primed(client, flaky_prime)
+
+    assert len(attempts) == 2
+    assert manager.metrics()["primes"] == 1
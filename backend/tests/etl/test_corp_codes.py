@@ -0,0 +1,19 @@
+from collections.abc import Callable
+from datetime import date
+
+from app.etl.corp_codes import iter_corp_code_batches
+
+
+def test_iter_corp_code_batches_streams_rows_in_batches(corp_code_zip: Callable[[int], bytes]) -> None:
+    batches = list(iter_corp_code_batches(corp_code_zip(5), batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    first = batches[0][0]
+    assert first == {
+        "corp_code": "00000001",
+        "corp_name": "회사1",
+        "eng_name": "Company 1",
+        "stock_code": "000001",
+        "modify_date": date(2026, 2, 14),
+    }
+    assert batches[0][1]["stock_code"] is None
@@ -1,4 +1,6 @@
-from app.etl.normalize import normalize_dart_disclosures, normalize_kind_rows
+from datetime import date
+
+from app.etl.normalize import normalize_corp_name, normalize_dart_disclosures, normalize_kind_rows, pipeline_item_id
 
 
 def test_normalize_kind_rows() -> None:
@@ -29,3 +31,11 @@ def test_normalize_dart_disclosures() -> None:
     normalized = normalize_dart_disclosures(raw_rows)
     assert normalized[0]["corp_code"] == "00126380"
     assert normalized[0]["rcept_no"] == "20260214000001"
+
+
+def test_pipeline_item_id_is_stable_per_company_and_cycle() -> None:
+    assert normalize_corp_name("㈜알파 테크") == normalize_corp_name("알파테크")
+    listing = date(2026, 3, 15)
+    assert pipeline_item_id("㈜알파 테크", listing) == pipeline_item_id("알파테크", date(2026, 4, 1))
+    assert pipeline_item_id("알파테크", listing) != pipeline_item_id("알파테크", date(2027, 3, 15))
+    assert len(pipeline_item_id("알파테크", None)) <= 64
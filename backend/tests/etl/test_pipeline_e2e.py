@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 
 from app.db.base import Base
 from app.etl.pipeline import run_pipeline
+from app.models.disclosure import DartDisclosure
 from app.models.ipo import IpoPipelineItem
 
 
@@ -36,6 +37,7 @@ def test_pipeline_builds_ipo_item_from_kind_and_dart() -> None:
         item = session.execute(select(IpoPipelineItem)).scalar_one()
         assert item.corp_code == '00126380'
         assert item.stage == 'offering'
+        assert session.get(DartDisclosure, '20260214000001').corp_code == '00126380'
 
 
 def test_pipeline_replaces_previous_snapshot_items() -> None:
@@ -1,10 +1,13 @@
-from sqlalchemy import create_engine, select
+from sqlalchemy import Engine, create_engine, select
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.db.base import Base
+from app.etl import pipeline
 from app.etl.pipeline import run_pipeline
-from app.models.ipo import IpoPipelineItem
-from app.models.quality import SnapshotPublishLog
+from app.models.ipo import IpoPipelineAlias, IpoPipelineItem
+from app.models.quality import DataQualityIssueAggregate, SnapshotPublishLog
+from app.services.ipo_service import get_pipeline_item, get_pipeline_snapshot
 
 
 def test_fail_issue_blocks_snapshot_publish() -> None:
@@ -67,3 +70,119 @@ def test_warn_issue_allows_snapshot_publish() -> None:
         result = run_pipeline(session, fixture_bundle)
         assert result.published is True
         assert session.execute(select(IpoPipelineItem)).all()
+
+
+def test_publish_applies_only_changed_rows() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+
+    def bundle(batch_id: str, kind_rows: list[dict]) -> dict:
+        return {"batch_id": batch_id, "kind_rows": kind_rows, "dart_rows": []}
+
+    alpha = {"corp_name": "알파테크", "market": "KOSDAQ", "stage": "공모", "listing_date": "2026-03-15", "lead_manager": "미래증권"}
+    beta = {"corp_name": "베타바이오", "market": "KOSDAQ", "stage": "공모", "listing_date": "2026-03-20", "lead_manager": "한빛증권"}
+    with Session(engine) as session:
+        first = run_pipeline(session, bundle("batch-diff-1", [alpha, beta]))
+        assert (first.inserted, first.updated, first.deleted, first.unchanged) == (2, 0, 0, 0)
+
+        again = run_pipeline(session, bundle("batch-diff-2", [alpha, beta]))
+        assert (again.inserted, again.updated, again.deleted, again.unchanged) == (0, 0, 0, 2)
+
+        changed = run_pipeline(session, bundle("batch-diff-3", [alpha | {"lead_manager": "대한증권"}]))
+        assert (changed.inserted, changed.updated, changed.deleted, changed.unchanged) == (0, 1, 1, 0)
+        item = session.execute(select(IpoPipelineItem)).scalar_one()
+        assert item.lead_manager == "대한증권"
+
+
+def test_pipeline_ids_survive_reordering_and_alias_changed_ids() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    alpha = {"corp_name": "알파테크", "market": "KOSDAQ", "stage": "공모", "listing_date": "2026-03-15", "lead_manager": "미래증권"}
+    beta = {"corp_name": "베타바이오", "market": "KOSDAQ", "stage": "공모", "listing_date": "2026-03-20", "lead_manager": "한빛증권"}
+    dart_alpha = {"corp_code": "00126380", "corp_name": "알파테크", "rcept_no": "20260214000001", "report_nm": "", "rcept_dt": "20260214"}
+    with Session(engine) as session:
+        run_pipeline(session, {"batch_id": "batch-order-1", "kind_rows": [alpha, beta], "dart_rows": []})
+        before = set(session.execute(select(IpoPipelineItem.pipeline_id)).scalars())
+
+        reordered = run_pipeline(session, {"batch_id": "batch-order-2", "kind_rows": [beta, alpha], "dart_rows": []})
+        assert reordered.unchanged == 2
+        assert set(session.execute(select(IpoPipelineItem.pipeline_id)).scalars()) == before
+
+        old_alpha_id = session.execute(
+            select(IpoPipelineItem.pipeline_id).where(IpoPipelineItem.corp_name == "알파테크")
+        ).scalar_one()
+        # A DART match in one batch only, as when a refresh crawls another corp_code, must not change the id.
+        matched = run_pipeline(session, {"batch_id": "batch-order-3", "kind_rows": [beta, alpha], "dart_rows": [dart_alpha]})
+        assert (matched.inserted, matched.updated, matched.deleted) == (0, 1, 0)
+        unmatched = run_pipeline(session, {"batch_id": "batch-order-4", "kind_rows": [beta, alpha], "dart_rows": []})
+        assert (unmatched.inserted, unmatched.deleted) == (0, 0)
+        assert set(session.execute(select(IpoPipelineItem.pipeline_id)).scalars()) == before
+
+        moved = {**alpha, "listing_date": "2027-01-10"}
+        run_pipeline(session, {"batch_id": "batch-order-5", "kind_rows": [beta, moved], "dart_rows": [dart_alpha]})
+        alias = session.get(IpoPipelineAlias, old_alpha_id)
+        assert alias is not None
+        assert get_pipeline_item(session, old_alpha_id)["pipeline_id"] == alias.pipeline_id
+        assert get_pipeline_item(session, old_alpha_id)["corp_code"] == "00126380"
+
+
+def test_fail_fast_blocks_on_first_fail_and_logs_issues_later() -> None:
+    # One shared connection, so the deferred writer thread sees the same in-memory database.
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:", future=True, poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    fixture_bundle = {
+        "batch_id": "batch-fast-1",
+        "kind_rows": [
+            {"corp_name": "알파테크", "market": "KOSDAQ", "stage": "UNKNOWN", "listing_date": "2026-03-15", "lead_manager": "미래증권"},
+            {"corp_name": "베타바이오", "market": "KOSDAQ", "stage": "UNKNOWN", "listing_date": "", "lead_manager": "한빛증권"},
+        ],
+        "dart_rows": [],
+    }
+    with Session(engine) as session:
+        result = run_pipeline(session, fixture_bundle, fail_fast=True)
+        assert result.published is False
+        assert result.decision_issue.rule_code == "KIND_STAGE_ALLOWED"
+        assert result.issues == []
+        assert result.issue_logging is not None
+        assert result.issue_logging.result(timeout=10) == 4
+        logged = session.execute(
+            select(DataQualityIssueAggregate.rule_code).order_by(DataQualityIssueAggregate.id)
+        ).scalars().all()
+        assert logged == ["KIND_STAGE_ALLOWED", "KIND_STAGE_ALLOWED", "KIND_KEY_DATE_REQUIRED", "CROSS_KIND_DART_LINKAGE_RATIO"]
+        assert session.execute(select(SnapshotPublishLog.published)).scalar_one() is False
+
+
+def test_publish_counts_duplicate_ids_and_orders_snapshot_by_listing_date() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    kind_rows = [
+        {"corp_name": "베타바이오", "market": "KOSDAQ", "stage": "공모", "listing_date": "2026-05-20", "lead_manager": "한빛증권"},
+        {"corp_name": "(주)베타바이오", "market": "KOSDAQ", "stage": "공모", "listing_date": "2026-06-01", "lead_manager": "한빛증권"},
+        {"corp_name": "감마로직", "market": "KOSDAQ", "stage": "공모", "listing_date": "", "lead_manager": "미래증권"},
+        {"corp_name": "알파테크", "market": "KOSDAQ", "stage": "공모", "listing_date": "2026-03-15", "lead_manager": "미래증권"},
+    ]
+    with Session(engine) as session:
+        result = run_pipeline(session, {"batch_id": "batch-dup-1", "kind_rows": kind_rows, "dart_rows": []})
+        assert result.published is True
+        assert (result.inserted, result.duplicates) == (3, 1)
+        snapshot = get_pipeline_snapshot(session)
+        assert [item["corp_name"] for item in snapshot["items"]] == ["알파테크", "베타바이오", "감마로직"]
+
+
+def test_fail_fast_logging_gets_the_engine_of_a_connection_bound_session(monkeypatch) -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    binds: list[object] = []
+    monkeypatch.setattr(pipeline, "defer_quality_logging", lambda bind, evaluate, *, batch_id: binds.append(bind))
+    fixture_bundle = {
+        "batch_id": "batch-fast-2",
+        "kind_rows": [{"corp_name": "알파테크", "stage": "UNKNOWN", "listing_date": "2026-03-15"}],
+        "dart_rows": [],
+    }
+    with engine.connect() as connection, Session(bind=connection) as session:
+        run_pipeline(session, fixture_bundle, fail_fast=True)
+
+    assert binds == [engine]
+    assert isinstance(binds[0], Engine)
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.etl.raw_ingest import RawPayloadArchive
+from app.models.snapshot import RawPayloadBlob, RawPayloadLog
+
+
+def _krx_payload(close: str) -> dict:
+    return {"OutBlock_1": [{"ISU_CD": "005930", "TDD_CLSPRC": close, "ISU_NM": "삼성전자"}] * 50}
+
+
+def test_archive_compresses_and_dedups_identical_payloads() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        archive = RawPayloadArchive(session, codec="gzip")
+        first = archive.archive(source="KRX", endpoint="sto/stk_bydd_trd", payload=_krx_payload("70000"), batch_id="b1")
+        reordered = {"OutBlock_1": [dict(reversed(list(row.items()))) for row in _krx_payload("70000")["OutBlock_1"]]}
+        second = archive.archive(source="KRX", endpoint="sto/stk_bydd_trd", payload=reordered, batch_id="b2")
+        archive.archive(source="KRX", endpoint="sto/stk_bydd_trd", payload=_krx_payload("71000"), batch_id="b2")
+        session.commit()
+
+        assert first == second
+        assert session.scalar(select(func.count()).select_from(RawPayloadBlob)) == 2
+        assert session.scalar(select(func.count()).select_from(RawPayloadLog)) == 3
+        assert archive.metrics()["deduped"] == 1
+        assert archive.stats.stored_bytes < archive.stats.raw_bytes / 10
+
+
+def test_replay_batch_restores_payloads_from_file_store(tmp_path: Path) -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        archive = RawPayloadArchive(session, codec="gzip", file_root=tmp_path)
+        archive.archive(source="KIND", endpoint="pubofrprogcom_sub", payload=[{"corp_name": "알파테크"}], batch_id="b1")
+        archive.archive(
+            source="KRX",
+            endpoint="sto/stk_bydd_trd",
+            payload=_krx_payload("70000"),
+            request_key="sto/stk_bydd_trd:20260213",
+            batch_id="b1",
+        )
+        session.add(RawPayloadLog(source="DART", endpoint="list.json", payload='{"status": "000"}', batch_id="b1"))
+        session.commit()
+
+        replayed = RawPayloadArchive(session, file_root=tmp_path).replay_batch("b1")
+
+        assert [item.source for item in replayed] == ["KIND", "KRX", "DART"]
+        assert replayed[0].payload == [{"corp_name": "알파테크"}]
+        assert replayed[1].request_key == "sto/stk_bydd_trd:20260213"
+        assert replayed[1].payload == _krx_payload("70000")
+        assert replayed[2].payload == {"status": "000"}
+        assert session.execute(select(RawPayloadBlob.data)).scalars().all() == [None, None]
+        assert len(list(tmp_path.glob("*/*.gzip"))) == 2
+
+
+def test_blob_stored_concurrently_by_another_refresh_is_a_dedup(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'archive.db'}", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as first_session, Session(engine) as second_session:
+        first = RawPayloadArchive(first_session, codec="gzip")
+        second = RawPayloadArchive(second_session, codec="gzip")
+        # Both refreshes checked before either stored the blob.
+        second._blob_exists = lambda content_hash: False
+        first.archive(source="KRX", endpoint="sto/stk_bydd_trd", payload=_krx_payload("70000"), batch_id="b1")
+        first_session.commit()
+        second.archive(source="KRX", endpoint="sto/stk_bydd_trd", payload=_krx_payload("70000"), batch_id="b2")
+        second_session.commit()
+
+        assert second.metrics()["deduped"] == 1
+        assert second_session.scalar(select(func.count()).select_from(RawPayloadBlob)) == 1
+        assert second_session.scalar(select(func.count()).select_from(RawPayloadLog)) == 2
+
+
+def test_file_backed_blob_without_file_root_raises(tmp_path: Path) -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        content_hash = RawPayloadArchive(session, codec="gzip", file_root=tmp_path).archive(
+            source="KIND", endpoint="pubofrprogcom_sub", payload=[{"corp_name": "알파테크"}]
+        )
+        with pytest.raises(RuntimeError, match="RAW_ARCHIVE_DIR"):
+            RawPayloadArchive(session).load(content_hash)
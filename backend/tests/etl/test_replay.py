@@ -0,0 +1,85 @@
+from datetime import date, timezone
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.etl.raw_ingest import RawPayloadArchive
+from app.etl.replay import capture_bundle, list_captured_batches, load_bundle, replay_batches, replay_bundles
+from app.models.ipo import IpoPipelineItem
+from app.models.snapshot import RawPayloadBlob, RawPayloadLog
+
+
+def _bundle(batch_id: str, report_nm: str) -> dict:
+    return {
+        "batch_id": batch_id,
+        "kind_rows": [{"corp_name": "alpha-tech", "market": "KOSDAQ", "stage": "offering", "listing_date": "2026-03-15"}],
+        "dart_rows": [
+            {
+                "corp_code": "00126380",
+                "corp_name": "alpha-tech",
+                "rcept_no": "20260214000001",
+                "report_nm": report_nm,
+                "rcept_dt": "20260214",
+            }
+        ],
+        "krx_rows": [
+            {
+                "dataset_key": "openapi.stock.sto.stk_bydd_trd",
+                "required_params": {"basDd": "required"},
+                "request_params": {"basDd": "20260213"},
+                "response": {"OutBlock_1": [{"ISU_CD": "005930"}]},
+            }
+        ],
+    }
+
+
+def test_capture_and_replay_bundles_offline() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        archive = RawPayloadArchive(session, codec="gzip")
+        capture_bundle(archive, _bundle("live-1", "securities filing"))
+        capture_bundle(archive, _bundle("live-2", ""))
+        session.commit()
+
+        # Both bundles share KIND and KRX parts, so only the DART rows and manifests add blobs.
+        assert session.scalar(select(func.count()).select_from(RawPayloadBlob)) == 6
+        batch_ids = list_captured_batches(session, date.today(), date.today())
+        assert batch_ids == ["live-1", "live-2"]
+        assert load_bundle(archive, "live-1") == _bundle("live-1", "securities filing")
+
+        results = replay_bundles(load_bundle(archive, batch_id) for batch_id in batch_ids)
+
+        assert [result.published for result in results] == [True, True]
+        assert results[1].issues_by_rule.get("DART_REPORT_NAME_EMPTY") == 1
+        assert session.scalar(select(func.count()).select_from(IpoPipelineItem)) == 0
+
+
+def test_replay_reports_missing_batches_and_isolates_each_bundle() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        archive = RawPayloadArchive(session, codec="gzip")
+        capture_bundle(archive, _bundle("live-1", "securities filing"))
+        session.commit()
+
+        results = replay_batches(archive, ["missing", "live-1", "live-1"])
+
+    assert results[0].error == "no captured bundle for batch: missing"
+    assert results[0].published is False
+    # The second replay of the same bundle starts from an empty database, so it reports exactly what the first did.
+    assert results[1] == results[2]
+    assert results[1].error is None
+
+
+def test_listed_batches_use_local_day_bounds_against_utc_timestamps() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        capture_bundle(RawPayloadArchive(session, codec="gzip"), _bundle("live-1", ""))
+        session.commit()
+        stored = session.scalar(select(RawPayloadLog.created_at).where(RawPayloadLog.batch_id == "live-1"))
+        local_day = stored.replace(tzinfo=timezone.utc).astimezone().date()
+
+        assert list_captured_batches(session, local_day, local_day) == ["live-1"]
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from datetime import datetime
 
 from sqlalchemy import create_engine, select
@@ -5,7 +6,9 @@ from sqlalchemy.orm import Session
 
 from app.db.base import Base
 from app.jobs.tasks import run_quality_summary_job
-from app.models.quality import DataQualityIssue, DataQualitySummaryDaily
+from app.models.quality import DataQualityIssue, DataQualityIssueOccurrence, DataQualitySummaryDaily
+from app.quality.types import QualityIssue
+from app.services.quality_log_service import save_quality_issues
 
 
 def test_quality_summary_job_writes_daily_rows() -> None:
@@ -43,3 +46,48 @@ def test_quality_summary_job_writes_daily_rows() -> None:
         assert rows
         assert rows[0].source == "DART"
         assert rows[0].fail_count == 1
+
+
+def test_quality_summary_job_counts_aggregated_occurrences() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    issue = QualityIssue(
+        source="KRX",
+        rule_code="KRX_EMPTY_DATA",
+        severity="WARN",
+        entity_type="dataset",
+        entity_key="sto/stk_bydd_trd",
+        message="empty OutBlock_1",
+    )
+    with Session(engine) as session:
+        save_quality_issues(session, [issue, issue], batch_id="b1")
+        save_quality_issues(session, [issue], batch_id="b2")
+        session.commit()
+        observed_day = session.execute(select(DataQualityIssueOccurrence.observed_date)).scalar_one()
+
+        run_quality_summary_job(session, observed_day.isoformat())
+        row = session.execute(select(DataQualitySummaryDaily)).scalar_one()
+        assert (row.source, row.warn_count, row.fail_count) == ("KRX", 3, 0)
+
+
+def test_quality_summary_keeps_the_severity_each_occurrence_had() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    warn = QualityIssue(
+        source="KIND",
+        rule_code="KIND_STAGE_ALLOWED",
+        severity="WARN",
+        entity_type="ipo",
+        entity_key="알파테크",
+        message="unsupported stage: UNKNOWN",
+    )
+    with Session(engine) as session:
+        save_quality_issues(session, [warn], batch_id="b1")
+        # The rule is promoted to FAIL; the earlier WARN occurrence must stay a WARN.
+        save_quality_issues(session, [replace(warn, severity="FAIL")], batch_id="b2")
+        session.commit()
+        observed_day = session.execute(select(DataQualityIssueOccurrence.observed_date)).scalars().first()
+
+        run_quality_summary_job(session, observed_day.isoformat())
+        row = session.execute(select(DataQualitySummaryDaily)).scalar_one()
+        assert (row.warn_count, row.fail_count) == (1, 1)
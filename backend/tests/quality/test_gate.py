@@ -0,0 +1,76 @@
+import dataclasses
+
+import pytest
+
+from app.quality.gate import GateResultCache, find_first_fail, run_quality_gate
+
+
+def _rows() -> tuple[list[dict], list[dict], list[dict]]:
+    kind_rows = [
+        {"corp_name": f"회사{index}", "stage": "공모" if index % 3 else "UNKNOWN", "listing_date": "2026-03-15"}
+        for index in range(1200)
+    ]
+    dart_rows = [
+        {"corp_code": f"{index:08d}", "corp_name": f"회사{index}", "rcept_no": "2026021400000" if index % 4 else "20260214000001", "report_nm": ""}
+        for index in range(1100)
+    ]
+    krx_rows = [
+        {
+            "dataset_key": f"openapi.stock.path{index}",
+            "required_params": {"basDd": "required"},
+            "request_params": {"basDd": "20250131"},
+            "response": {"OutBlock_1": [{"BAS_DD": "20250130", "ISU_CD": "KR7000000001", "ACC_TRDVOL": "abc"}] * 2},
+        }
+        for index in range(3)
+    ]
+    return kind_rows, dart_rows, krx_rows
+
+
+def test_parallel_gate_matches_sequential_issue_order() -> None:
+    kind_rows, dart_rows, krx_rows = _rows()
+    sequential = run_quality_gate(kind_rows, dart_rows, krx_rows, workers=1, cache=GateResultCache(0))
+    parallel = run_quality_gate(kind_rows, dart_rows, krx_rows, workers=2, cache=GateResultCache(0))
+    assert parallel.issues == sequential.issues
+    assert list(dict.fromkeys(issue.source for issue in sequential.issues)) == ["DART", "KIND", "KRX"]
+
+
+def test_gate_reports_time_per_source() -> None:
+    kind_rows, dart_rows, krx_rows = _rows()
+    result = run_quality_gate(kind_rows, dart_rows, krx_rows, workers=1, cache=GateResultCache(0))
+    assert set(result.timings) == {"DART", "KIND", "KRX", "CROSS", "fingerprint", "total"}
+    assert all(seconds >= 0 for seconds in result.timings.values())
+
+
+def test_gate_reuses_issues_of_unchanged_rows() -> None:
+    kind_rows, dart_rows, krx_rows = _rows()
+    cache = GateResultCache()
+    first = run_quality_gate(kind_rows, dart_rows, krx_rows, workers=1, cache=cache)
+    assert first.reused_rows == 0
+
+    kind_rows[5] = {**kind_rows[5], "stage": "UNKNOWN"}
+    second = run_quality_gate(kind_rows, dart_rows, krx_rows, workers=1, cache=cache)
+    uncached = run_quality_gate(kind_rows, dart_rows, krx_rows, workers=1, cache=GateResultCache(0))
+    assert second.reused_rows == len(kind_rows) + len(dart_rows) + len(krx_rows) - 1
+    assert second.issues == uncached.issues
+    assert second.issues != first.issues
+
+
+def test_first_fail_stops_at_the_first_fail_in_gate_order() -> None:
+    kind_rows, dart_rows, krx_rows = _rows()
+    full = run_quality_gate(kind_rows, dart_rows, krx_rows, workers=1)
+    first = find_first_fail(kind_rows, dart_rows, krx_rows)
+    assert first == next(issue for issue in full.issues if issue.severity == "FAIL")
+    assert find_first_fail(kind_rows[1:3], [], krx_rows) is None
+
+
+def test_disabled_cache_skips_fingerprinting_and_cached_issues_are_immutable() -> None:
+    kind_rows, dart_rows, krx_rows = _rows()
+    disabled = GateResultCache(0)
+    run_quality_gate(kind_rows, dart_rows, krx_rows, workers=1, cache=disabled)
+    assert disabled.metrics() == {"entries": 0, "hits": 0, "misses": 0}
+
+    cache = GateResultCache()
+    issue = run_quality_gate(kind_rows, dart_rows, krx_rows, workers=1, cache=cache).issues[0]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        issue.severity = "PASS"
+    assert run_quality_gate(kind_rows, dart_rows, krx_rows, workers=1, cache=cache).issues[0] == issue
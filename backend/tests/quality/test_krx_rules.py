@@ -59,3 +59,31 @@ def test_krx_rule_warns_invalid_numeric_field() -> None:
         entity_key="openapi.stock.sto.stk_bydd_trd",
     )
     assert any(issue.rule_code == "KRX_NUMERIC_FIELD_INVALID" and issue.severity == "WARN" for issue in issues)
+
+
+def test_krx_rule_counts_row_checks_in_one_pass() -> None:
+    issues = evaluate_krx_rules(
+        {
+            "dataset_key": "openapi.stock.sto.stk_bydd_trd",
+            "required_params": {"basDd": "required"},
+            "request_params": {"basDd": "20250131"},
+            "response": {
+                "OutBlock_1": [
+                    {"BAS_DD": "20250131", "ISU_CD": "KR7000000001", "TDD_CLSPRC": "71500", "FLUC_RT": "-1.23"},
+                    {"BAS_DD": "20250130", "ISU_CD": " KR7000000001 ", "TDD_CLSPRC": "1,234", "FLUC_RT": "+.5"},
+                    {"BAS_DD": "", "ISU_CD": "KR7000000002", "ACC_TRDVOL": "-", "ACC_TRDVAL": "N/A", "LIST_SHRS": 100},
+                    {"BAS_DD": "20250129", "ISU_CD": "KR7000000001", "TDD_CLSPRC": "1.2.3", "FLUC_RT": "."},
+                    {"ISU_CD": "", "CMPPREVDD_PRC": ["1"], "ACC_TRDVOL": "n/a", "ACC_TRDVAL": None},
+                    "not-a-row",
+                ]
+            },
+        },
+        source="KRX",
+        entity_type="dataset",
+        entity_key="openapi.stock.sto.stk_bydd_trd",
+    )
+    assert [(issue.rule_code, issue.message) for issue in issues] == [
+        ("KRX_BAS_DD_MISMATCH", "rows with mismatched BAS_DD: 2"),
+        ("KRX_DUPLICATE_ISU_CD", "duplicate ISU_CD rows: 2"),
+        ("KRX_NUMERIC_FIELD_INVALID", "invalid numeric field count: 4"),
+    ]
@@ -0,0 +1,61 @@
+from collections import Counter
+
+from app.quality.catalog import RULE_CATALOG
+from app.quality.engine import QualityRule, RulePlan
+from app.quality.registry import RULE_REGISTRY, rule_plan
+
+
+class _CountingRow(dict):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.reads: Counter[str] = Counter()
+
+    def __getitem__(self, key: str) -> object:
+        self.reads[key] += 1
+        return super().__getitem__(key)
+
+
+def test_catalog_is_built_from_the_registry_in_order() -> None:
+    codes = [rule["rule_code"] for rule in RULE_CATALOG]
+    assert codes == [rule.rule_code for rule in RULE_REGISTRY]
+    assert len(codes) == len(set(codes))
+    assert codes[:3] == ["COMMON_REQUIRED_KEYS", "DART_RCEPT_NO_FORMAT", "DART_REPORT_NAME_EMPTY"]
+    assert codes[-2:] == ["CROSS_KIND_DART_LINKAGE_RATIO", "CROSS_POST_LISTING_KRX_ATTACH"]
+
+
+def test_plan_reads_each_field_once_per_row() -> None:
+    row = _CountingRow(corp_code="", rcept_no="123", report_nm="")
+    issues = rule_plan("DART").evaluate(row, source="DART", entity_type="disclosure", entity_key="")
+    assert [issue.rule_code for issue in issues] == [
+        "COMMON_REQUIRED_KEYS",
+        "DART_RCEPT_NO_FORMAT",
+        "DART_REPORT_NAME_EMPTY",
+    ]
+    assert issues[0].source == "COMMON"
+    assert issues[0].entity_type == "record"
+    assert set(row.reads.values()) == {1}
+
+
+def test_added_rule_shares_the_row_pass() -> None:
+    calls: list[str] = []
+
+    def check(values: dict) -> str | None:
+        calls.append(values["stage"])
+        return None
+
+    extra = QualityRule(
+        rule_code="KIND_EXTRA",
+        source="KIND",
+        severity="WARN",
+        title="",
+        description="",
+        operator_action="",
+        fields=("stage",),
+        check=check,
+    )
+    plan = RulePlan("KIND", (*[rule for rule in RULE_REGISTRY if "KIND" in rule.targets], extra))
+    row = _CountingRow(stage="공모", listing_date="2026-03-15")
+    assert plan.evaluate(row, source="KIND", entity_type="ipo", entity_key="alpha") == []
+    assert calls == ["공모"]
+    assert row.reads["stage"] == 1
+    assert rule_plan("CROSS").rules == ()
@@ -0,0 +1,67 @@
+from collections.abc import Callable
+from datetime import date
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.connectors.bulk_file_store import BulkFetchResult
+from app.db.base import Base
+from app.models.corp import CorpMaster
+from app.services.corp_master_service import refresh_corp_master
+
+
+class FakeDartConnector:
+    def __init__(self, payload: bytes, changed: bool = True) -> None:
+        self.payload = payload
+        self.changed = changed
+
+    def fetch_corp_codes(self) -> BulkFetchResult:
+        bytes_saved = 0 if self.changed else len(self.payload)
+        return BulkFetchResult(payload=self.payload, changed=self.changed, bytes_saved=bytes_saved)
+
+
+def test_refresh_corp_master_upserts_in_batches(corp_code_zip: Callable[[int], bytes]) -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(CorpMaster(corp_code="00000001", corp_name="구회사", stock_code=None))
+        session.commit()
+
+        result = refresh_corp_master(session, FakeDartConnector(corp_code_zip(7)), batch_size=3)
+
+        assert (result.rows, result.batches, result.changed) == (7, 3, True)
+        assert session.scalar(select(func.count()).select_from(CorpMaster)) == 7
+        updated = session.get(CorpMaster, "00000001")
+        session.refresh(updated)
+        assert updated.corp_name == "회사1"
+        assert updated.stock_code == "000001"
+
+
+def test_refresh_corp_master_skips_unchanged_archive(corp_code_zip: Callable[[int], bytes]) -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        payload = corp_code_zip(2)
+        refresh_corp_master(session, FakeDartConnector(payload))
+
+        result = refresh_corp_master(session, FakeDartConnector(payload, changed=False))
+
+        assert result.changed is False
+        assert result.rows == 0
+        assert result.as_dict()["bytes_saved"] == len(payload)
+
+
+def test_refresh_corp_master_writes_only_rows_with_new_modify_date(corp_code_zip: Callable[[int], bytes]) -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        refresh_corp_master(session, FakeDartConnector(corp_code_zip(4)))
+        session.get(CorpMaster, "00000002").modify_date = date(2025, 1, 1)
+        session.commit()
+
+        result = refresh_corp_master(session, FakeDartConnector(corp_code_zip(5)))
+
+        assert (result.inserted, result.updated, result.unchanged) == (1, 1, 3)
+        assert result.rows == 2
+        assert result.changed_corp_codes == ["00000002", "00000005"]
+        assert session.get(CorpMaster, "00000002").modify_date == date(2026, 2, 14)
@@ -0,0 +1,57 @@
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models.disclosure import DartDisclosure
+from app.services.disclosure_service import derive_disclosure_flags, list_disclosures, upsert_dart_disclosures
+
+
+def test_derive_disclosure_flags_from_report_name() -> None:
+    assert derive_disclosure_flags("증권신고서(지분증권)") == (False, False)
+    assert derive_disclosure_flags("[발행조건확정]증권신고서(지분증권)") == (True, False)
+    assert derive_disclosure_flags("[기재정정]증권신고서(지분증권)") == (False, True)
+    assert derive_disclosure_flags(None) == (False, False)
+
+
+def test_upsert_dart_disclosures_is_keyed_by_rcept_no() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    rows = [
+        {"corp_code": "00126380", "rcept_no": "20260214000001", "report_nm": "증권신고서", "rcept_dt": "20260214"},
+        {"corp_code": "00126380", "rcept_no": "20260220000002", "report_nm": "[기재정정]증권신고서", "rcept_dt": "20260220"},
+        {"corp_code": "", "rcept_no": "20260220000003", "report_nm": "skipped"},
+    ]
+    with Session(engine) as session:
+        assert upsert_dart_disclosures(session, rows, batch_size=1) == 2
+        upsert_dart_disclosures(
+            session,
+            [
+                {
+                    "corp_code": "00126380",
+                    "rcept_no": "20260214000001",
+                    "report_nm": "[발행조건확정]증권신고서(지분증권)",
+                    "rcept_dt": "20260214",
+                }
+            ],
+        )
+        session.commit()
+
+        assert session.scalar(select(func.count()).select_from(DartDisclosure)) == 2
+        items = list_disclosures(session, "00126380")
+        assert [item["rcept_no"] for item in items] == ["20260220000002", "20260214000001"]
+        assert items[0]["is_amended"] is True
+        assert items[1]["is_final"] is True
+
+
+def test_upsert_without_disclosure_type_keeps_the_stored_one() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    row = {"corp_code": "00126380", "rcept_no": "20260214000001", "report_nm": "증권신고서", "rcept_dt": "20260214"}
+    with Session(engine) as session:
+        upsert_dart_disclosures(session, [{**row, "pblntf_ty": "C", "pblntf_detail_ty": "C001"}])
+        upsert_dart_disclosures(session, [{**row, "report_nm": "[기재정정]증권신고서"}])
+        session.commit()
+
+        item = list_disclosures(session, "00126380")[0]
+        assert (item["pblntf_ty"], item["pblntf_detail_ty"]) == ("C", "C001")
+        assert item["is_amended"] is True
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 
 from app.services import ipo_service
 
@@ -33,29 +34,30 @@ def test_refresh_pipeline_live_collects_rows_from_multiple_paths(monkeypatch) ->
     monkeypatch.delenv("KRX_API_ESG_PATH", raising=False)
 
     class FakeKindConnector:
-        def fetch_public_offering_companies(self) -> list[dict]:
+        async def fetch_public_offering_companies_async(self) -> list[dict]:
             return [{"corp_name": "alpha-tech"}]
 
     class FakeDartConnector:
         def __init__(self, api_key: str) -> None:
             self.api_key = api_key
 
-        def fetch_list(
+        async def fetch_list_page_async(
             self,
-            corp_code: str,
-            page_no: int,
-            page_count: int,
+            corp_code: str | None = None,
+            page_no: int = 1,
+            page_count: int = 100,
             last_reprt_at: str | None = None,
             bgn_de: str | None = None,
             end_de: str | None = None,
-        ) -> list[dict]:
-            return [{"corp_code": corp_code, "rcept_no": "1"}]
+            pblntf_ty: str | None = None,
+        ) -> dict:
+            return {"status": "000", "list": [{"corp_code": corp_code, "rcept_no": "1"}]}
 
     class FakeKrxConnector:
         def __init__(self, api_key: str | None) -> None:
             self.api_key = api_key
 
-        def fetch_open_api(self, api_path: str, params: dict[str, str]) -> dict:
+        async def fetch_open_api_async(self, api_path: str, params: dict[str, str]) -> dict:
             mapping = {
                 "idx/krx_dd_trd": [{"id": "A"}, {"id": "B"}],
                 "idx/kospi_dd_trd": [{"id": "C"}],
@@ -67,10 +69,14 @@ def test_refresh_pipeline_live_collects_rows_from_multiple_paths(monkeypatch) ->
     class FakeRunResult:
         published: bool
         issues: list
+        gate_timings: dict = field(default_factory=dict)
+        gate_reused_rows: int = 0
+        issue_logging: object = None
+        decision_issue: object = None
 
     captured_bundle: dict = {}
 
-    def fake_run_pipeline(session: object, bundle: dict) -> FakeRunResult:
+    def fake_run_pipeline(session: object, bundle: dict, **_: object) -> FakeRunResult:
         captured_bundle.update(bundle)
         return FakeRunResult(published=True, issues=[])
 
@@ -105,7 +111,7 @@ def test_refresh_pipeline_live_queries_dart_with_date_window(monkeypatch) -> Non
     monkeypatch.delenv("KRX_API_ESG_PATH", raising=False)
 
     class FakeKindConnector:
-        def fetch_public_offering_companies(self) -> list[dict]:
+        async def fetch_public_offering_companies_async(self) -> list[dict]:
             return []
 
     captured_call: dict[str, str] = {}
@@ -114,27 +120,32 @@ def test_refresh_pipeline_live_queries_dart_with_date_window(monkeypatch) -> Non
         def __init__(self, api_key: str) -> None:
             self.api_key = api_key
 
-        def fetch_list(
+        async def fetch_list_page_async(
             self,
-            corp_code: str,
-            page_no: int,
-            page_count: int,
+            corp_code: str | None = None,
+            page_no: int = 1,
+            page_count: int = 100,
             last_reprt_at: str | None = None,
             bgn_de: str | None = None,
             end_de: str | None = None,
-        ) -> list[dict]:
+            pblntf_ty: str | None = None,
+        ) -> dict:
             captured_call["corp_code"] = corp_code
             captured_call["bgn_de"] = bgn_de or ""
             captured_call["end_de"] = end_de or ""
             captured_call["last_reprt_at"] = last_reprt_at or ""
-            return []
+            return {"status": "000", "list": []}
 
     @dataclass
     class FakeRunResult:
         published: bool
         issues: list
+        gate_timings: dict = field(default_factory=dict)
+        gate_reused_rows: int = 0
+        issue_logging: object = None
+        decision_issue: object = None
 
-    def fake_run_pipeline(session: object, bundle: dict) -> FakeRunResult:
+    def fake_run_pipeline(session: object, bundle: dict, **_: object) -> FakeRunResult:
         return FakeRunResult(published=True, issues=[])
 
     monkeypatch.setattr(ipo_service, "KindConnector", FakeKindConnector)
@@ -160,30 +171,31 @@ def test_refresh_pipeline_live_retries_transient_access_denied(monkeypatch) -> N
     monkeypatch.delenv("KRX_API_ESG_PATH", raising=False)
 
     class FakeKindConnector:
-        def fetch_public_offering_companies(self) -> list[dict]:
+        async def fetch_public_offering_companies_async(self) -> list[dict]:
             return []
 
     class FakeDartConnector:
         def __init__(self, api_key: str) -> None:
             self.api_key = api_key
 
-        def fetch_list(
+        async def fetch_list_page_async(
             self,
-            corp_code: str,
-            page_no: int,
-            page_count: int,
+            corp_code: str | None = None,
+            page_no: int = 1,
+            page_count: int = 100,
             last_reprt_at: str | None = None,
             bgn_de: str | None = None,
             end_de: str | None = None,
-        ) -> list[dict]:
-            return []
+            pblntf_ty: str | None = None,
+        ) -> dict:
+            return {"status": "000", "list": []}
 
     class FakeKrxConnector:
         def __init__(self, api_key: str | None) -> None:
             self.api_key = api_key
             self.calls = 0
 
-        def fetch_open_api(self, api_path: str, params: dict[str, str]) -> dict:
+        async def fetch_open_api_async(self, api_path: str, params: dict[str, str]) -> dict:
             self.calls += 1
             if self.calls == 1:
                 raise ipo_service.KrxAccessDeniedError("Access Denied")
@@ -193,8 +205,12 @@ def test_refresh_pipeline_live_retries_transient_access_denied(monkeypatch) -> N
     class FakeRunResult:
         published: bool
         issues: list
+        gate_timings: dict = field(default_factory=dict)
+        gate_reused_rows: int = 0
+        issue_logging: object = None
+        decision_issue: object = None
 
-    def fake_run_pipeline(session: object, bundle: dict) -> FakeRunResult:
+    def fake_run_pipeline(session: object, bundle: dict, **_: object) -> FakeRunResult:
         return FakeRunResult(published=True, issues=[])
 
     monkeypatch.setattr(ipo_service, "KindConnector", FakeKindConnector)
@@ -222,30 +238,31 @@ def test_refresh_pipeline_live_does_not_retry_unauthorized_error(monkeypatch) ->
     monkeypatch.delenv("KRX_API_ESG_PATH", raising=False)
 
     class FakeKindConnector:
-        def fetch_public_offering_companies(self) -> list[dict]:
+        async def fetch_public_offering_companies_async(self) -> list[dict]:
             return []
 
     class FakeDartConnector:
         def __init__(self, api_key: str) -> None:
             self.api_key = api_key
 
-        def fetch_list(
+        async def fetch_list_page_async(
             self,
-            corp_code: str,
-            page_no: int,
-            page_count: int,
+            corp_code: str | None = None,
+            page_no: int = 1,
+            page_count: int = 100,
             last_reprt_at: str | None = None,
             bgn_de: str | None = None,
             end_de: str | None = None,
-        ) -> list[dict]:
-            return []
+            pblntf_ty: str | None = None,
+        ) -> dict:
+            return {"status": "000", "list": []}
 
     class FakeKrxConnector:
         def __init__(self, api_key: str | None) -> None:
             self.api_key = api_key
             self.calls = 0
 
-        def fetch_open_api(self, api_path: str, params: dict[str, str]) -> dict:
+        async def fetch_open_api_async(self, api_path: str, params: dict[str, str]) -> dict:
             self.calls += 1
             raise ipo_service.KrxAuthError("Unauthorized API Call")
 
@@ -253,8 +270,12 @@ def test_refresh_pipeline_live_does_not_retry_unauthorized_error(monkeypatch) ->
     class FakeRunResult:
         published: bool
         issues: list
+        gate_timings: dict = field(default_factory=dict)
+        gate_reused_rows: int = 0
+        issue_logging: object = None
+        decision_issue: object = None
 
-    def fake_run_pipeline(session: object, bundle: dict) -> FakeRunResult:
+    def fake_run_pipeline(session: object, bundle: dict, **_: object) -> FakeRunResult:
         return FakeRunResult(published=True, issues=[])
 
     monkeypatch.setattr(ipo_service, "KindConnector", FakeKindConnector)
@@ -267,3 +288,103 @@ def test_refresh_pipeline_live_does_not_retry_unauthorized_error(monkeypatch) ->
     detail = result["source_status_detail"]["stock"][0]
     assert detail["status"] == "auth_error"
     assert detail["attempts"] == 1
+
+
+def test_refresh_pipeline_live_fetches_all_categories_concurrently(monkeypatch) -> None:
+    monkeypatch.delenv("DART_API_KEY", raising=False)
+    monkeypatch.setenv("KRX_API_KEY", "krx-key")
+    monkeypatch.setenv("LIVE_FETCH_MAX_CONCURRENCY", "8")
+    monkeypatch.setenv("KRX_API_INDEX_PATH", "idx/krx_dd_trd,idx/kospi_dd_trd")
+    monkeypatch.setenv("KRX_API_STOCK_PATH", "sto/stk_bydd_trd")
+    monkeypatch.setenv("KRX_API_BOND_PATH", "bon/bnd_bydd_trd")
+    monkeypatch.delenv("KRX_API_SECURITIES_PATH", raising=False)
+    monkeypatch.delenv("KRX_API_DERIVATIVE_PATH", raising=False)
+    monkeypatch.delenv("KRX_API_GENERAL_PATH", raising=False)
+    monkeypatch.delenv("KRX_API_ESG_PATH", raising=False)
+
+    in_flight = {"now": 0, "peak": 0}
+
+    class FakeKindConnector:
+        async def fetch_public_offering_companies_async(self) -> list[dict]:
+            return []
+
+    class FakeKrxConnector:
+        def __init__(self, api_key: str | None) -> None:
+            self.api_key = api_key
+
+        async def fetch_open_api_async(self, api_path: str, params: dict[str, str]) -> dict:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.05)
+            in_flight["now"] -= 1
+            return {"OutBlock_1": [{"path": api_path}]}
+
+    @dataclass
+    class FakeRunResult:
+        published: bool
+        issues: list
+        gate_timings: dict = field(default_factory=dict)
+        gate_reused_rows: int = 0
+        issue_logging: object = None
+        decision_issue: object = None
+
+    def fake_run_pipeline(session: object, bundle: dict, **_: object) -> FakeRunResult:
+        return FakeRunResult(published=True, issues=[])
+
+    monkeypatch.setattr(ipo_service, "KindConnector", FakeKindConnector)
+    monkeypatch.setattr(ipo_service, "KrxConnector", FakeKrxConnector)
+    monkeypatch.setattr(ipo_service, "run_pipeline", fake_run_pipeline)
+
+    result = ipo_service.refresh_pipeline_live(object(), corp_code="00126380", bas_dd="20250131")
+
+    assert in_flight["peak"] == 4
+    assert result["source_status"]["index"] == "ok:2"
+    assert result["source_status"]["bond"] == "ok:1"
+    assert result["source_status"]["dart"] == "missing_key"
+
+
+def test_refresh_pipeline_live_reports_queue_wait_and_run_time(monkeypatch) -> None:
+    monkeypatch.delenv("DART_API_KEY", raising=False)
+    monkeypatch.setenv("KRX_API_KEY", "krx-key")
+    monkeypatch.setenv("LIVE_FETCH_MAX_CONCURRENCY", "1")
+    monkeypatch.setenv("KRX_API_INDEX_PATH", "idx/krx_dd_trd")
+    monkeypatch.setenv("KRX_API_STOCK_PATH", "sto/stk_bydd_trd")
+    monkeypatch.delenv("KRX_API_SECURITIES_PATH", raising=False)
+    monkeypatch.delenv("KRX_API_BOND_PATH", raising=False)
+    monkeypatch.delenv("KRX_API_DERIVATIVE_PATH", raising=False)
+    monkeypatch.delenv("KRX_API_GENERAL_PATH", raising=False)
+    monkeypatch.delenv("KRX_API_ESG_PATH", raising=False)
+
+    class FakeKindConnector:
+        async def fetch_public_offering_companies_async(self) -> list[dict]:
+            return []
+
+    class FakeKrxConnector:
+        def __init__(self, api_key: str | None) -> None:
+            self.api_key = api_key
+
+        async def fetch_open_api_async(self, api_path: str, params: dict[str, str]) -> dict:
+            await asyncio.sleep(0.05)
+            return {"OutBlock_1": [{"path": api_path}]}
+
+    @dataclass
+    class FakeRunResult:
+        published: bool
+        issues: list
+        gate_timings: dict = field(default_factory=dict)
+        gate_reused_rows: int = 0
+        issue_logging: object = None
+        decision_issue: object = None
+
+    def fake_run_pipeline(session: object, bundle: dict, **_: object) -> FakeRunResult:
+        return FakeRunResult(published=True, issues=[])
+
+    monkeypatch.setattr(ipo_service, "KindConnector", FakeKindConnector)
+    monkeypatch.setattr(ipo_service, "KrxConnector", FakeKrxConnector)
+    monkeypatch.setattr(ipo_service, "run_pipeline", fake_run_pipeline)
+
+    result = ipo_service.refresh_pipeline_live(object(), corp_code="00126380", bas_dd="20250131")
+
+    details = result["source_status_detail"]["index"] + result["source_status_detail"]["stock"]
+    assert all(entry["run_ms"] >= 40 for entry in details)
+    assert max(entry["queue_wait_ms"] for entry in details) >= 40
@@ -0,0 +1,66 @@
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.etl.pipeline import run_pipeline
+from app.models.snapshot import IpoPipelineSnapshot, IpoPipelineSnapshotPointer
+from app.services.ipo_service import ensure_demo_pipeline_if_empty, get_pipeline_snapshot
+from app.services.pipeline_snapshot_service import current_snapshot_version, publish_pipeline_snapshot
+
+
+def _bundle(batch_id: str, lead_manager: str) -> dict:
+    return {
+        "batch_id": batch_id,
+        "kind_rows": [
+            {"corp_name": "알파테크", "market": "KOSDAQ", "stage": "공모", "listing_date": "2026-03-15", "lead_manager": lead_manager}
+        ],
+        "dart_rows": [],
+    }
+
+
+def test_publish_flips_current_snapshot_only_when_rows_change() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        first = run_pipeline(session, _bundle("batch-snap-1", "미래증권"))
+        assert first.snapshot_version is not None
+        assert current_snapshot_version(session) == first.snapshot_version
+
+        unchanged = run_pipeline(session, _bundle("batch-snap-2", "미래증권"))
+        assert unchanged.snapshot_version == first.snapshot_version
+
+        changed = run_pipeline(session, _bundle("batch-snap-3", "대한증권"))
+        assert changed.snapshot_version > first.snapshot_version
+        payload = get_pipeline_snapshot(session)
+        assert payload["snapshot_version"] == changed.snapshot_version
+        assert payload["total"] == 1
+        assert payload["items"][0]["lead_manager"] == "대한증권"
+        assert payload["items"][0]["listing_date"] == "2026-03-15"
+        # The previous version stays readable as it was published.
+        previous = session.get(IpoPipelineSnapshot, first.snapshot_version)
+        assert previous.payload["items"][0]["lead_manager"] == "미래증권"
+
+
+def test_publish_prunes_versions_beyond_retention() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        versions = [publish_pipeline_snapshot(session, [], batch_id=f"batch-{index}", retention=2) for index in range(4)]
+        session.commit()
+        assert current_snapshot_version(session) == versions[-1]
+        assert session.execute(select(func.count(IpoPipelineSnapshot.version))).scalar_one() == 2
+
+
+def test_existing_items_are_backfilled_into_a_snapshot() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        run_pipeline(session, _bundle("batch-backfill", "미래증권"))
+        # State of a database upgraded from before snapshots existed.
+        session.execute(IpoPipelineSnapshotPointer.__table__.delete())
+        session.execute(IpoPipelineSnapshot.__table__.delete())
+        session.commit()
+
+        ensure_demo_pipeline_if_empty(session)
+        payload = get_pipeline_snapshot(session)
+        assert [item["corp_name"] for item in payload["items"]] == ["알파테크"]
@@ -0,0 +1,92 @@
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.db import upsert
+from app.db.base import Base
+from app.models.quality import DataQualityIssue, DataQualityIssueAggregate, DataQualityIssueOccurrence
+from app.quality.types import QualityIssue
+from app.services.quality_log_service import save_quality_issues
+
+
+def _issue(entity_key: str, message: str = "row is not numeric") -> QualityIssue:
+    return QualityIssue(
+        source="KRX",
+        rule_code="KRX_NUMERIC_FIELD_INVALID",
+        severity="WARN",
+        entity_type="dataset",
+        entity_key=entity_key,
+        message=message,
+    )
+
+
+def test_save_quality_issues_aggregates_every_chunk() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    issues = [_issue(f"sto/stk_bydd_trd:{index}") for index in range(7)]
+    with Session(engine) as session:
+        assert save_quality_issues(session, issues, batch_id="batch-bulk", chunk_size=3) == 7
+        assert save_quality_issues(session, [], batch_id="batch-empty") == 0
+        session.commit()
+        rows = session.execute(select(DataQualityIssueAggregate).order_by(DataQualityIssueAggregate.id)).scalars().all()
+        assert [row.entity_key for row in rows] == [issue.entity_key for issue in issues]
+        assert {row.last_batch_id for row in rows} == {"batch-bulk"}
+        assert all(row.first_seen is not None and row.occurrence_count == 1 for row in rows)
+        assert session.execute(select(DataQualityIssue)).all() == []
+
+
+def test_recurring_issues_bump_one_aggregate_row() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        save_quality_issues(session, [_issue("sto/a"), _issue("sto/a"), _issue("sto/b")], batch_id="batch-1")
+        save_quality_issues(session, [_issue("sto/a", "row 9 is not numeric")], batch_id="batch-2")
+        session.commit()
+
+        aggregates = {
+            row.entity_key: row for row in session.execute(select(DataQualityIssueAggregate)).scalars().all()
+        }
+        assert set(aggregates) == {"sto/a", "sto/b"}
+        assert aggregates["sto/a"].occurrence_count == 3
+        assert aggregates["sto/a"].message == "row 9 is not numeric"
+        assert aggregates["sto/a"].last_batch_id == "batch-2"
+        assert aggregates["sto/b"].occurrence_count == 1
+
+        occurrence = DataQualityIssueOccurrence
+        occurrences = session.execute(
+            select(occurrence.aggregate_id, occurrence.last_batch_id, occurrence.occurrence_count)
+            .order_by(occurrence.id)
+        ).all()
+        # Both batches ran on the same day, so each aggregate has a single occurrence bucket.
+        assert occurrences == [(aggregates["sto/a"].id, "batch-2", 3), (aggregates["sto/b"].id, "batch-1", 1)]
+
+
+def test_separate_writers_of_the_same_issue_merge_into_one_aggregate() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    for batch_id in ("deferred-worker", "celery-job"):
+        with Session(engine) as session:
+            save_quality_issues(session, [_issue("sto/a")], batch_id=batch_id)
+            session.commit()
+    with Session(engine) as session:
+        aggregate = session.execute(select(DataQualityIssueAggregate)).scalar_one()
+        occurrence = session.execute(select(DataQualityIssueOccurrence)).scalar_one()
+        assert (aggregate.occurrence_count, aggregate.last_batch_id) == (2, "celery-job")
+        assert (occurrence.occurrence_count, occurrence.last_batch_id) == (2, "celery-job")
+
+
+def test_recurring_issues_are_counted_without_on_conflict_support(monkeypatch) -> None:
+    monkeypatch.setattr(upsert, "_UPSERT_DIALECTS", {})
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        save_quality_issues(session, [_issue("sto/a"), _issue("sto/a"), _issue("sto/b")], batch_id="batch-1")
+        save_quality_issues(session, [_issue("sto/a", "row 9 is not numeric")], batch_id="batch-2")
+        session.commit()
+
+        aggregates = {
+            row.entity_key: row for row in session.execute(select(DataQualityIssueAggregate)).scalars().all()
+        }
+        assert (aggregates["sto/a"].occurrence_count, aggregates["sto/b"].occurrence_count) == (3, 1)
+        assert aggregates["sto/a"].message == "row 9 is not numeric"
+        counts = session.execute(select(DataQualityIssueOccurrence.occurrence_count)).scalars().all()
+        assert sorted(counts) == [1, 3]
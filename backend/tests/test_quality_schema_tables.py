@@ -4,6 +4,8 @@ from sqlalchemy import inspect
 def test_quality_tables_exist(db_engine) -> None:
     expected = {
         "data_quality_issue",
+        "data_quality_issue_aggregate",
+        "data_quality_issue_occurrence",
         "data_quality_summary_daily",
         "snapshot_publish_log",
     }
@@ -7,9 +7,12 @@ def test_core_tables_exist(db_engine) -> None:
         "corp_profile",
         "dart_disclosure",
         "ipo_pipeline_item",
+        "ipo_pipeline_alias",
         "company_snapshot",
         "ipo_pipeline_snapshot",
+        "ipo_pipeline_snapshot_pointer",
         "dataset_registry",
         "raw_payload_log",
+        "raw_payload_blob",
     }
     assert expected.issubset(set(inspect(db_engine).get_table_names()))
@@ -10,8 +10,10 @@ export function IpoKpiStrip({ items, refresh }: { items: IpoItem[]; refresh?: Re
   const offering = countStage(items, (stage) => stage.includes("offer"));
   const preListing = countStage(items, (stage) => stage.includes("pre"));
   const listed = countStage(items, (stage) => stage.includes("list"));
+  const issueLabel =
+    refresh?.issue_count ?? (refresh?.decision_issue ? `pending (${refresh.decision_issue.rule_code})` : "pending");
   const refreshLabel = refresh
-    ? `${refresh.published ? "Published" : "Blocked"} / issues ${refresh.issue_count}`
+    ? `${refresh.published ? "Published" : "Blocked"} / issues ${issueLabel}`
     : "No refresh";
 
   const cards = [
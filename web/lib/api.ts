@@ -11,7 +11,10 @@ export type IpoItem = {
 export type RefreshMeta = {
   batch_id: string;
   published: boolean;
-  issue_count: number;
+  // null while fail-fast issue logging is still evaluating the batch in the background.
+  issue_count: number | null;
+  issue_logging?: "deferred" | "inline";
+  decision_issue?: { source: string; rule_code: string; severity: string; entity_key: string; message: string } | null;
   kind_rows: number;
   dart_rows: number;
   krx_rows: number;